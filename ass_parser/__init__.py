@@ -1,18 +1,33 @@
 """ASS parser main module."""
 from ass_parser.ass_color import AssColor
 from ass_parser.ass_event import AssEvent
-from ass_parser.ass_file import AssFile
+from ass_parser.ass_file import AssFile, AssFileSnapshot, AssFrozenFile
+from ass_parser.ass_index import AssIndex
 from ass_parser.ass_sections import (
+    AssAttachment,
+    AssAttachmentSection,
     AssBaseSection,
     AssBaseTabularSection,
     AssEventList,
     AssKeyValueMapping,
+    AssRawSection,
     AssScriptInfo,
+    AssSectionList,
     AssStringTable,
     AssStyleList,
+    SectionListSnapshot,
 )
 from ass_parser.ass_style import AssStyle
+from ass_parser.batch import AssBatchResult, read_ass_many, write_ass_many
+from ass_parser.diff import (
+    AssDiff,
+    AssItemModification,
+    AssSequenceDiff,
+    diff_ass,
+)
 from ass_parser.errors import CorruptAssError, CorruptAssLineError
+from ass_parser.mapped_file import AssMappedEventList, AssMappedFile
+from ass_parser.merge import AssMergeConflict, AssMergeResult, merge_ass
 from ass_parser.observable_mapping_mixin import ObservableMappingChangeEvent
 from ass_parser.observable_object_mixin import ObservableObjectChangeEvent
 from ass_parser.observable_sequence_mixin import (
@@ -20,21 +35,48 @@ from ass_parser.observable_sequence_mixin import (
     ObservableSequenceItemModificationEvent,
     ObservableSequenceItemRemovalEvent,
 )
-from ass_parser.reader import read_ass
-from ass_parser.writer import write_ass
+from ass_parser.reader import read_ass, read_ass_async
+from ass_parser.records import AssEventRecord, AssStyleRecord
+from ass_parser.shared_events import AssSharedEvents
+from ass_parser.snapshot_sequence_mixin import SequenceSnapshot
+from ass_parser.string_pool import (
+    StringMemoryReport,
+    StringPool,
+    string_memory_report,
+)
+from ass_parser.undo_journal import UndoJournal
+from ass_parser.writer import write_ass, write_ass_async
 
 __all__ = [
+    "AssAttachment",
+    "AssAttachmentSection",
     "AssBaseSection",
     "AssBaseTabularSection",
+    "AssBatchResult",
     "AssColor",
+    "AssDiff",
     "AssEvent",
     "AssEventList",
+    "AssEventRecord",
     "AssFile",
+    "AssFileSnapshot",
+    "AssFrozenFile",
+    "AssIndex",
+    "AssItemModification",
     "AssKeyValueMapping",
+    "AssMappedEventList",
+    "AssMappedFile",
+    "AssMergeConflict",
+    "AssMergeResult",
+    "AssRawSection",
     "AssScriptInfo",
+    "AssSectionList",
+    "AssSequenceDiff",
+    "AssSharedEvents",
     "AssStringTable",
     "AssStyle",
     "AssStyleList",
+    "AssStyleRecord",
     "CorruptAssError",
     "CorruptAssLineError",
     "ObservableMappingChangeEvent",
@@ -42,6 +84,18 @@ __all__ = [
     "ObservableSequenceItemInsertionEvent",
     "ObservableSequenceItemModificationEvent",
     "ObservableSequenceItemRemovalEvent",
+    "SectionListSnapshot",
+    "SequenceSnapshot",
+    "StringMemoryReport",
+    "StringPool",
+    "UndoJournal",
+    "diff_ass",
+    "merge_ass",
     "read_ass",
+    "read_ass_async",
+    "read_ass_many",
+    "string_memory_report",
     "write_ass",
+    "write_ass_async",
+    "write_ass_many",
 ]
@@ -1,19 +1,16 @@
 """AssEvent definition."""
+import weakref
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Optional
 
-from ass_parser.observable_object_mixin import ObservableObjectMixin
-from ass_parser.observable_sequence_mixin import (
-    ObservableSequenceChangeEvent,
-    ObservableSequenceItemModificationEvent,
-)
+from ass_parser.ass_list_item_mixin import AssListItemMixin
 
 if TYPE_CHECKING:
     from ass_parser.ass_sections import AssEventList  # pragma: no coverage
 
 
-@dataclass
-class AssEvent(ObservableObjectMixin):
+@dataclass(eq=False)
+class AssEvent(AssListItemMixin["AssEventList"]):
     """ASS event (subtitle, comment etc.)."""
 
     start: int = 0
@@ -29,10 +26,58 @@ class AssEvent(ObservableObjectMixin):
     margin_vertical: int = 0
     is_comment: bool = False
 
-    _parent: Optional["AssEventList"] = None
+    # weak, so that dropping a list does not wait for the cyclic garbage
+    # collector
+    _parent: Optional["weakref.ref[AssEventList]"] = None
     _index: Optional[int] = None
+    _INTERNED_FIELDS = ("style_name", "actor", "effect", "text")
     _note = ""
     _text = ""
+    _style_name = ""
+    _actor = ""
+    _effect = ""
+
+    def get_style_name(self) -> str:
+        """Return event style name.
+
+        :return: style name
+        """
+        return self._style_name
+
+    def set_style_name(self, value: str) -> None:
+        """Set new event style name.
+
+        :param value: new style name
+        """
+        self._style_name = self._intern(value)
+
+    def get_actor(self) -> str:
+        """Return event actor.
+
+        :return: actor
+        """
+        return self._actor
+
+    def set_actor(self, value: str) -> None:
+        """Set new event actor.
+
+        :param value: new actor
+        """
+        self._actor = self._intern(value)
+
+    def get_effect(self) -> str:
+        """Return event effect.
+
+        :return: effect
+        """
+        return self._effect
+
+    def set_effect(self, value: str) -> None:
+        """Set new event effect.
+
+        :param value: new effect
+        """
+        self._effect = self._intern(value)
 
     def get_text(self) -> str:
         """Return event text.
@@ -48,7 +93,7 @@ class AssEvent(ObservableObjectMixin):
 
         :param value: new text
         """
-        self._text = value.replace("\n", "\\N")
+        self._text = self._intern(value.replace("\n", "\\N"))
 
     def get_note(self) -> str:
         """Return event note.
@@ -66,14 +111,6 @@ class AssEvent(ObservableObjectMixin):
         """
         self._note = value.replace("\n", "\\N")
 
-    @property
-    def parent(self) -> Optional["AssEventList"]:
-        """Return parent list.
-
-        :return: parent list
-        """
-        return self._parent
-
     @property
     def index(self) -> int:
         """Return event index within its parent list.
@@ -128,49 +165,15 @@ class AssEvent(ObservableObjectMixin):
         """
         return self.end - self.start
 
-    def _after_change(self) -> None:
-        """Emit item modified event in the parent list."""
-        super()._after_change()
-        if self.parent is not None:
-            self.parent.items_modified.emit(
-                ObservableSequenceItemModificationEvent(
-                    index=self.index, item=self
-                )
-            )
-            self.parent.changed.emit(ObservableSequenceChangeEvent())
-
-    def __copy__(self) -> "AssEvent":
-        """Duplicate self.
-
-        The copy is detached from the parent list.
-
-        :return: duplicate of self
-        """
-        ret = type(self)()
-        ret.__dict__.update(
-            {
-                key: value
-                for key, value in self.__dict__.items()
-                if not callable(value) and key != "_parent"
-            }
-        )
-        return ret
-
-    def __eq__(self, other: Any) -> bool:
-        """Check for equality. Ignores parent list and event handlers.
-
-        :param other: other object
-        :return: whether objects are equal
-        """
-        if not isinstance(other, AssEvent):
-            return False
-        return all(
-            key.startswith("_")
-            or key == "parent"
-            or getattr(self, key) == getattr(other, key)
-            for key in self.__dataclass_fields__  # type: ignore
-        )
-
 
+AssEvent.style_name = property(  # type: ignore
+    AssEvent.get_style_name, AssEvent.set_style_name
+)
+AssEvent.actor = property(  # type: ignore
+    AssEvent.get_actor, AssEvent.set_actor
+)
+AssEvent.effect = property(  # type: ignore
+    AssEvent.get_effect, AssEvent.set_effect
+)
 AssEvent.text = property(AssEvent.get_text, AssEvent.set_text)  # type: ignore
 AssEvent.note = property(AssEvent.get_note, AssEvent.set_note)  # type: ignore
@@ -1,22 +1,40 @@
 """AssFile definition."""
-from dataclasses import dataclass
-from typing import IO, Any
+from collections.abc import Generator, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Optional, cast
 
+from ass_parser.ass_event import AssEvent
 from ass_parser.ass_sections import (
+    AssAttachmentSection,
     AssBaseSection,
     AssEventList,
     AssKeyValueMapping,
+    AssRawSection,
     AssScriptInfo,
+    AssSectionList,
     AssStringTable,
     AssStyleList,
+    SectionListSnapshot,
 )
 from ass_parser.ass_sections.const import (
+    ATTACHMENT_DATA_RE,
+    ATTACHMENT_ENTRY_PREFIXES,
+    ATTACHMENT_SECTION_NAMES,
     EVENTS_SECTION_NAME,
     SCRIPT_INFO_SECTION_NAME,
     SECTION_HEADING_RE,
     STYLES_SECTION_NAME,
 )
+from ass_parser.ass_style import AssStyle
 from ass_parser.errors import CorruptAssLineError
+from ass_parser.records import AssEventRecord, AssStyleRecord
+from ass_parser.snapshot_sequence_mixin import SequenceSnapshot
+from ass_parser.string_pool import StringPool
+from ass_parser.util import content_key, gc_paused, stable_hash
+
+# number of lines to parse between the pauses of iter_consume_ass_stream()
+PARSE_BATCH_SIZE = 1000
 
 
 @dataclass
@@ -26,82 +44,412 @@ class _SectionInfo:
     lines: list[tuple[int, str]]
 
 
-def _collect_section_info_list(handle: IO[str]) -> list[_SectionInfo]:
+def _start_section(
+    section_info_list: list[_SectionInfo], line_num: int, line: str
+) -> bool:
+    """Append a section introduced by the given heading line.
+
+    :param section_info_list: sections collected so far
+    :param line_num: number of the heading line
+    :param line: heading line
+    :return: whether the section holds attachments
+    """
+    match = SECTION_HEADING_RE.match(line)
+    assert match is not None
+    name = match.group("section_name")
+    section_info_list.append(
+        _SectionInfo(name=name, is_tabular=False, lines=[(line_num, line)])
+    )
+    return name in ATTACHMENT_SECTION_NAMES
+
+
+def _iter_collect_section_info_list(
+    handle: Iterable[str], batch_size: int
+) -> Generator[None, None, list[_SectionInfo]]:
     section_info_list: list[_SectionInfo] = []
+    in_attachments = False
+    # encoded line that looks like a section heading, which the next line
+    # tells apart from attachment data
+    maybe_heading: Optional[tuple[int, str]] = None
     for line_num, line in enumerate(handle, start=1):
+        if not line_num % batch_size:
+            yield
         if line.startswith("\N{BOM}"):
             line = line[len("\N{BOM}") :]
         line = line.strip()
         if not line:
             continue
+        if maybe_heading is not None:
+            # a heading is followed by the body of its section rather than
+            # by more attachment data or entries
+            if ATTACHMENT_DATA_RE.match(line) or line.startswith(
+                ATTACHMENT_ENTRY_PREFIXES
+            ):
+                section_info_list[-1].lines.append(maybe_heading)
+            else:
+                in_attachments = _start_section(
+                    section_info_list, *maybe_heading
+                )
+            maybe_heading = None
+        if in_attachments and ATTACHMENT_DATA_RE.match(line):
+            # uuencoded lines can start with a semicolon or look like
+            # a section heading
+            if SECTION_HEADING_RE.match(line):
+                maybe_heading = (line_num, line)
+            else:
+                section_info_list[-1].lines.append((line_num, line))
+            continue
         if line.startswith(";"):
             continue
 
-        if match := SECTION_HEADING_RE.match(line):
-            section_info_list.append(
-                _SectionInfo(
-                    name=match.group("section_name"),
-                    is_tabular=False,
-                    lines=[],
-                )
-            )
-        elif not section_info_list:
+        if SECTION_HEADING_RE.match(line):
+            in_attachments = _start_section(section_info_list, line_num, line)
+            continue
+        if not section_info_list:
             raise CorruptAssLineError(line_num, line, "expected a section")
-        elif line.startswith("Format:"):
+        if line.startswith("Format:"):
             section_info_list[-1].is_tabular = True
         section_info_list[-1].lines.append((line_num, line))
+    if maybe_heading is not None:
+        section_info_list[-1].lines.append(maybe_heading)
     return section_info_list
 
 
+@dataclass(frozen=True)
+class AssFileSnapshot:
+    """Read-only snapshot of an ASS file.
+
+    See AssFile.snapshot().
+    """
+
+    script_info: Mapping[str, str]
+    styles: SequenceSnapshot[AssStyle]
+    events: SequenceSnapshot[AssEvent]
+    extra_sections: SectionListSnapshot
+
+    def to_ass_file(self) -> "AssFile":
+        """Create an editable ASS file with the snapshot contents.
+
+        :return: a new ASS file
+        """
+        ass_file = AssFile()
+        ass_file.script_info.update(self.script_info)
+        ass_file.styles.extend(self.styles)
+        ass_file.events.extend(self.events)
+        ass_file.extra_sections.extend(self.extra_sections.iter_stored())
+        return ass_file
+
+
+@dataclass(frozen=True)
+class AssFrozenFile:
+    """Immutable and hashable copy of an ASS file.
+
+    Made only of tuples, strings and numbers, so it can be handed to other
+    threads or used as a cache key. See AssFile.freeze().
+    """
+
+    script_info: tuple[tuple[str, str], ...]
+    styles: tuple[AssStyleRecord, ...]
+    events: tuple[AssEventRecord, ...]
+    # ASS text of each of the other sections
+    extra_sections: tuple[str, ...]
+    _hash: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __hash__(self) -> int:
+        """Return a hash of the contents.
+
+        The hash is computed on first use only.
+
+        :return: hash
+        """
+        if self._hash is None:
+            object.__setattr__(
+                self,
+                "_hash",
+                hash(
+                    (
+                        self.script_info,
+                        self.styles,
+                        self.events,
+                        self.extra_sections,
+                    )
+                ),
+            )
+        return cast(int, self._hash)
+
+    def thaw(self) -> "AssFile":
+        """Create an editable ASS file with the contents of self.
+
+        :return: a new ASS file
+        """
+        ass_file = AssFile()
+        if self.extra_sections:
+            ass_file.consume_ass_stream(
+                "".join(self.extra_sections).splitlines()
+            )
+        ass_file.script_info.update(self.script_info)
+        # pylint: disable=protected-access
+        ass_file.styles._load_columns(tuple(zip(*self.styles)))
+        ass_file.events._load_columns(tuple(zip(*self.events)))
+        return ass_file
+
+
 class AssFile:
     """ASS file (master container for all ASS stuff)."""
 
     def __init__(self) -> None:
         """Initialize self."""
+        self.string_pool = StringPool()
         self.script_info = AssScriptInfo()
-        self.events = AssEventList()
-        self.styles = AssStyleList()
-        self.extra_sections: list[AssBaseSection] = []
+        self.events = AssEventList(string_pool=self.string_pool)
+        self.styles = AssStyleList(string_pool=self.string_pool)
+        self.extra_sections = AssSectionList()
+
+    @property
+    def extra_sections(self) -> AssSectionList:
+        """Return the sections other than script info, styles and events.
+
+        :return: list of sections
+        """
+        return self._extra_sections
+
+    @extra_sections.setter
+    def extra_sections(self, value: Iterable[AssBaseSection]) -> None:
+        """Replace the sections other than script info, styles and events.
+
+        Plain lists and other iterables are wrapped in an AssSectionList.
+
+        :param value: new sections
+        """
+        if not isinstance(value, AssSectionList):
+            value = AssSectionList(value)
+        self._extra_sections = value
 
-    def consume_ass_stream(self, handle: IO[str]) -> None:
+    def consume_ass_stream(
+        self,
+        handle: Iterable[str],
+        preserve_original: bool = False,
+        raw_extra_sections: bool = False,
+        time_range: Optional[tuple[int, int]] = None,
+    ) -> None:
         """Load ASS from the specified source.
 
-        Clears the existing content.
+        Clears the existing content. The cyclic garbage collector is paused
+        meanwhile, see gc_paused().
+
+        :param handle: a readable stream or any other iterable of lines
+        :param preserve_original: whether to keep the source text of each
+            event, style and key-value line and write it back unchanged
+            unless the line's object gets modified
+        :param raw_extra_sections: whether to keep the sections other than
+            script info, styles and events as AssRawSection objects, which
+            are parsed on first access from .extra_sections and written back
+            verbatim until modified
+        :param time_range: optional window (start, end) in milliseconds;
+            events that do not intersect it, meaning events that end before
+            its start or start at or after its end, are skipped after parsing
+            only their times
+        """
+        with gc_paused():
+            for _ in self.iter_consume_ass_stream(
+                handle, preserve_original, raw_extra_sections, time_range
+            ):
+                pass
+
+    def iter_consume_ass_stream(
+        self,
+        handle: Iterable[str],
+        preserve_original: bool = False,
+        raw_extra_sections: bool = False,
+        time_range: Optional[tuple[int, int]] = None,
+        batch_size: int = PARSE_BATCH_SIZE,
+    ) -> Iterator[None]:
+        """Load ASS from the specified source, pausing every now and then.
+
+        Works like consume_ass_stream(), but yields after every batch of
+        lines, so that the caller can do other work in between - for
+        example, let an event loop run.
 
-        :param handle: a readable stream
+        :param handle: a readable stream or any other iterable of lines
+        :param preserve_original: see consume_ass_stream()
+        :param raw_extra_sections: see consume_ass_stream()
+        :param time_range: see consume_ass_stream()
+        :param batch_size: number of lines to process between the pauses
+        :return: a generator to exhaust
         """
         self.script_info.clear()
         self.events.clear()
         self.styles.clear()
         self.extra_sections.clear()
-        for section_info in _collect_section_info_list(handle):
+        self.string_pool.clear()
+        self.script_info.preserve_original = preserve_original
+        self.events.preserve_original = preserve_original
+        self.styles.preserve_original = preserve_original
+        section_info_list = yield from _iter_collect_section_info_list(
+            handle, batch_size
+        )
+        for section_info in section_info_list:
             section: AssBaseSection
             if section_info.name == STYLES_SECTION_NAME:
-                self.styles.consume_ass_lines(section_info.lines)
+                section = self.styles
             elif section_info.name == EVENTS_SECTION_NAME:
-                self.events.consume_ass_lines(section_info.lines)
+                section = self.events
             elif section_info.name == SCRIPT_INFO_SECTION_NAME:
-                self.script_info.consume_ass_lines(section_info.lines)
+                section = self.script_info
+            elif section_info.name in ATTACHMENT_SECTION_NAMES:
+                # attachments are decoded lazily anyway
+                section = AssAttachmentSection(name=section_info.name)
+                self.extra_sections.append(section)
+            elif raw_extra_sections:
+                section = AssRawSection(
+                    name=section_info.name, is_tabular=section_info.is_tabular
+                )
+                section.lines = section_info.lines
+                section.preserve_original = preserve_original
+                self.extra_sections.append(section)
+                continue
             elif section_info.is_tabular:
                 section = AssStringTable(name=section_info.name)
-                section.consume_ass_lines(section_info.lines)
+                section.preserve_original = preserve_original
                 self.extra_sections.append(section)
             else:
                 section = AssKeyValueMapping(name=section_info.name)
-                section.consume_ass_lines(section_info.lines)
+                section.preserve_original = preserve_original
                 self.extra_sections.append(section)
+            if section is self.events:
+                yield from self.events.iter_consume_ass_lines(
+                    section_info.lines, batch_size, time_range
+                )
+            else:
+                yield from section.iter_consume_ass_lines(
+                    section_info.lines, batch_size
+                )
+
+    def snapshot(self) -> AssFileSnapshot:
+        """Take a consistent read-only snapshot of self.
+
+        Styles, events and the extra sections are shared with self and get
+        copied only once they are modified or removed, so taking a snapshot
+        does not depend on the size of the file. Raw sections are not
+        parsed. The snapshot can be read from other threads while self is
+        being edited, but it must be taken from the thread that edits self.
+
+        :return: snapshot
+        """
+        return AssFileSnapshot(
+            script_info=MappingProxyType(dict(self.script_info)),
+            styles=self.styles.snapshot(),
+            events=self.events.snapshot(),
+            extra_sections=self.extra_sections.snapshot(),
+        )
+
+    def freeze(self) -> AssFrozenFile:
+        """Create an immutable and hashable copy of self.
+
+        Unlike snapshot(), the copy does not share anything with self and
+        can be taken from any thread that does not edit self at the time.
+        Source lines kept because of preserve_original are not copied.
+
+        :return: frozen copy
+        """
+        return AssFrozenFile(
+            script_info=tuple(self.script_info.items()),
+            styles=tuple(
+                map(AssStyleRecord._make, map(content_key, self.styles))
+            ),
+            events=tuple(
+                map(AssEventRecord._make, map(content_key, self.events))
+            ),
+            extra_sections=tuple(
+                section.to_ass_string()
+                for section in self.extra_sections.iter_stored()
+            ),
+        )
+
+    @property
+    def fingerprint(self) -> int:
+        """Return a stable hash of the whole file contents.
+
+        The hash is rolled up from the cached section fingerprints, so it is
+        O(1) in the number of events if nothing changed since the last call.
+        Comparing it with the fingerprint remembered at save time tells
+        whether the file needs saving. Unlike ==, which compares contents,
+        it may in theory collide.
+
+        :return: 64-bit hash
+        """
+        return stable_hash(
+            section.fingerprint
+            for section in (
+                self.script_info,
+                self.styles,
+                self.events,
+                # raw sections hash their source lines without being parsed
+                *self.extra_sections.iter_stored(),
+            )
+        )
 
     def __eq__(self, other: Any) -> bool:
         """Check for equality.
 
+        Files with different fingerprints are told apart without comparing
+        their contents. Files with matching fingerprints are compared item by
+        item, which is O(n) in the number of events, so that equality never
+        depends on a hash; compare fingerprints for an O(1) check.
+
         :param other: other object
         :return: whether objects are equal
         """
+        if other is self:
+            return True
         if not isinstance(other, AssFile):
             return False
         return (
-            self.script_info == other.script_info
+            self.fingerprint == other.fingerprint
+            and self.script_info == other.script_info
             and self.events == other.events
             and self.styles == other.styles
             and self.extra_sections == other.extra_sections
         )
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Return pickle compatible object representation.
+
+        Styles and events are pickled as columns of their field values, and
+        share a single string pool again once unpickled.
+
+        :return: object representation
+        """
+        # pylint: disable=protected-access
+        return type(self)._from_pickle_state, (
+            self.script_info,
+            self.styles._pickle_state(),
+            self.events._pickle_state(),
+            self.extra_sections,
+        )
+
+    @classmethod
+    def _from_pickle_state(
+        cls,
+        script_info: AssScriptInfo,
+        styles: tuple[Any, ...],
+        events: tuple[Any, ...],
+        extra_sections: AssSectionList,
+    ) -> "AssFile":
+        """Recreate a file from the state returned by __reduce__().
+
+        :param script_info: script info section
+        :param styles: pickled state of the style list
+        :param events: pickled state of the event list
+        :param extra_sections: other sections
+        :return: ASS file
+        """
+        # pylint: disable=protected-access
+        ret = cls()
+        ret.script_info = script_info
+        ret.styles = AssStyleList._from_pickle_state(styles, ret.string_pool)
+        ret.events = AssEventList._from_pickle_state(events, ret.string_pool)
+        ret.extra_sections = extra_sections
+        return ret
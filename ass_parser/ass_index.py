@@ -0,0 +1,341 @@
+"""Byte offset index of ASS files, optionally kept in a sidecar file."""
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from ass_parser.ass_sections.const import (
+    ATTACHMENT_DATA_RE,
+    ATTACHMENT_ENTRY_PREFIXES,
+    ATTACHMENT_SECTION_NAMES,
+    EVENTS_SECTION_NAME,
+)
+from ass_parser.decoding import decode_bytes
+from ass_parser.errors import CorruptAssError
+from ass_parser.util import try_ass_timestamp_to_ms
+
+# memory map, or bytes for empty files
+MappedData = Union[bytes, mmap.mmap]
+
+# suffix appended to the name of an ASS file to get its sidecar index
+INDEX_SUFFIX = ".idx"
+# number of events per entry of AssIndex.block_times
+EVENT_BLOCK_SIZE = 1024
+
+# times of blocks holding events with unreadable times
+UNKNOWN_START = -(2**62)
+UNKNOWN_END = 2**62
+
+# the content hash covers this many evenly spaced samples of the file, so
+# that validating an index does not read multi-gigabyte files in full
+HASH_SAMPLE_COUNT = 16
+HASH_SAMPLE_SIZE = 2**16
+
+# bumped whenever scan() changes, so that older indexes get rebuilt
+_MAGIC = b"ASSIDX\x02\n"
+_HEADER_SIZE = struct.Struct("<Q")
+
+# section headings, possibly preceded by the BOM of a concatenated file
+_HEADING_RE = re.compile(
+    rb"^(?:\xef\xbb\xbf)?[ \t]*(?P<heading>\[(?P<name>[^\]\r\n]+)\])"
+    rb"[ \t]*\r?$",
+    re.M,
+)
+# first non-empty line at or after a given offset
+_NEXT_LINE_RE = re.compile(rb"\s*(?P<line>[^\r\n]*)")
+_FORMAT_RE = re.compile(rb"^[ \t]*Format:[^\r\n]*", re.M)
+_EVENT_PREFIX = rb"^[ \t]*(?:Dialogue|Comment):"
+_EVENT_RE = re.compile(_EVENT_PREFIX, re.M)
+
+
+def index_path_for(path: Path) -> Path:
+    """Return the path of the sidecar index of an ASS file.
+
+    :param path: path to the ASS file
+    :return: path to the index file
+    """
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def _content_hash(data: MappedData) -> str:
+    """Hash samples of the file contents.
+
+    :param data: file contents
+    :return: hex digest
+    """
+    digest = blake2b(digest_size=16)
+    size = len(data)
+    if size <= HASH_SAMPLE_COUNT * HASH_SAMPLE_SIZE:
+        digest.update(data)
+    else:
+        step = (size - HASH_SAMPLE_SIZE) // (HASH_SAMPLE_COUNT - 1)
+        for pos in range(0, size - HASH_SAMPLE_SIZE + 1, step):
+            digest.update(data[pos : pos + HASH_SAMPLE_SIZE])
+    return digest.hexdigest()
+
+
+def _is_followed_by_attachment_data(data: MappedData, pos: int) -> bool:
+    """Tell whether the line after a heading-like line holds attachment
+    data, which means that the heading-like line holds data as well.
+
+    :param data: file contents
+    :param pos: offset of the end of the heading-like line
+    :return: whether the next non-empty line, if any, is attachment data
+    """
+    match = _NEXT_LINE_RE.match(data, pos)
+    assert match is not None
+    line = match.group("line").decode("ascii", "replace").strip()
+    return (
+        not line
+        or ATTACHMENT_DATA_RE.match(line) is not None
+        or line.startswith(ATTACHMENT_ENTRY_PREFIXES)
+    )
+
+
+def _event_re(field_names: list[str]) -> "re.Pattern[bytes]":
+    """Build a pattern that finds the event lines of a table and captures
+    their Start and End fields.
+
+    :param field_names: columns of the table
+    :return: pattern whose start and end groups are None for lines that do
+        not have enough fields
+    """
+    if "Start" not in field_names or "End" not in field_names:
+        return _EVENT_RE
+    fields = [
+        rf"(?P<{name.lower()}>[^,\r\n]*)".encode()
+        if name in {"Start", "End"}
+        else rb"[^,\r\n]*"
+        for name in field_names[
+            : max(field_names.index("Start"), field_names.index("End")) + 1
+        ]
+    ]
+    return re.compile(
+        _EVENT_PREFIX + rb"(?:" + b",".join(fields) + rb")?", re.M
+    )
+
+
+def _parse_time(raw: Optional[bytes]) -> Optional[int]:
+    if raw is None:
+        return None
+    return try_ass_timestamp_to_ms(raw.decode("ascii", "replace").strip())
+
+
+@dataclass
+class AssIndex:
+    """Byte offsets of the sections and event lines of an ASS file.
+
+    block_times holds pairs of the earliest start and the latest end of
+    every block_size consecutive events, which lets time-based lookups
+    skip whole blocks. It is only computed on request, because it requires
+    parsing the times of all events.
+    """
+
+    encodings: list[str]
+    # section names and byte offsets of their starts and ends
+    sections: list[tuple[str, int, int]]
+    # byte offsets of the event lines
+    offsets: "array[int]"
+    # index of the first event of each [Events] section and its columns
+    formats: list[tuple[int, list[str]]]
+    block_times: Optional["array[int]"] = None
+    block_size: int = EVENT_BLOCK_SIZE
+
+    @classmethod
+    def scan(
+        cls, data: MappedData, encodings: list[str], with_times: bool = False
+    ) -> "AssIndex":
+        """Index the given file contents.
+
+        :param data: file contents
+        :param encodings: encodings to decode section names and table headers
+            with, see sniff_encodings()
+        :param with_times: whether to compute block_times
+        :return: index
+        """
+        headings: list[tuple[str, int]] = []
+        in_attachments = False
+        for match in _HEADING_RE.finditer(data):
+            name = decode_bytes(match.group("name"), encodings)
+            if (
+                in_attachments
+                and ATTACHMENT_DATA_RE.match(f"[{name}]")
+                and _is_followed_by_attachment_data(data, match.end())
+            ):
+                # uuencoded lines can look like a section heading
+                continue
+            in_attachments = name in ATTACHMENT_SECTION_NAMES
+            headings.append((name, match.start("heading")))
+        ends = [offset for _name, offset in headings[1:]] + [len(data)]
+        sections = [
+            (name, offset, end) for (name, offset), end in zip(headings, ends)
+        ]
+
+        offsets = array("q")
+        formats: list[tuple[int, list[str]]] = []
+        block_times = array("q") if with_times else None
+        block_size = EVENT_BLOCK_SIZE
+        for name, start, end in sections:
+            if name != EVENTS_SECTION_NAME:
+                continue
+            format_match = _FORMAT_RE.search(data, start, end)
+            if format_match is None:
+                if _EVENT_RE.search(data, start, end):
+                    raise CorruptAssError("expected a table header")
+                continue
+            line = decode_bytes(format_match.group(), encodings).strip()
+            field_names = [
+                field.strip() for field in line.split(":", 1)[1].split(",")
+            ]
+            formats.append((len(offsets), field_names))
+            if block_times is None:
+                offsets.extend(
+                    event_match.start()
+                    for event_match in _EVENT_RE.finditer(
+                        data, format_match.end(), end
+                    )
+                )
+                continue
+            has_times = "Start" in field_names and "End" in field_names
+            for event_match in _event_re(field_names).finditer(
+                data, format_match.end(), end
+            ):
+                event_start = event_end = None
+                if has_times:
+                    event_start = _parse_time(event_match.group("start"))
+                    event_end = _parse_time(event_match.group("end"))
+                event_start = (
+                    UNKNOWN_START if event_start is None else event_start
+                )
+                # {TIME:…} tags can push the end up to 9 ms further
+                event_end = UNKNOWN_END if event_end is None else event_end + 9
+                if len(offsets) % block_size:
+                    block_times[-2] = min(block_times[-2], event_start)
+                    block_times[-1] = max(block_times[-1], event_end)
+                else:
+                    block_times.extend((event_start, event_end))
+                offsets.append(event_match.start())
+        return cls(
+            encodings=encodings,
+            sections=sections,
+            offsets=offsets,
+            formats=formats,
+            block_times=block_times,
+            block_size=block_size,
+        )
+
+    def save(self, index_path: Path, path: Path, data: MappedData) -> None:
+        """Write self into a sidecar file, along with the size, modification
+        time and content hash of the indexed file.
+
+        :param index_path: path to the index file
+        :param path: path to the indexed file
+        :param data: indexed file contents
+        """
+        stat = path.stat()
+        header = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "hash": _content_hash(data),
+            "encodings": self.encodings,
+            "sections": self.sections,
+            "formats": self.formats,
+            "events": len(self.offsets),
+            "block_size": self.block_size,
+            "blocks": None
+            if self.block_times is None
+            else len(self.block_times),
+        }
+        header_bytes = json.dumps(header).encode()
+        arrays = [self.offsets]
+        if self.block_times is not None:
+            arrays.append(self.block_times)
+        tmp_path = index_path.with_name(index_path.name + ".tmp")
+        try:
+            with tmp_path.open("wb") as handle:
+                handle.write(_MAGIC)
+                handle.write(_HEADER_SIZE.pack(len(header_bytes)))
+                handle.write(header_bytes)
+                for values in arrays:
+                    if sys.byteorder == "big":
+                        values = array("q", values)
+                        values.byteswap()
+                    values.tofile(handle)
+            os.replace(tmp_path, index_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(
+        cls,
+        index_path: Path,
+        path: Path,
+        data: MappedData,
+        encodings: list[str],
+    ) -> Optional["AssIndex"]:
+        """Read an index saved with save(), unless it is missing, unreadable
+        or out of date.
+
+        :param index_path: path to the index file
+        :param path: path to the indexed file
+        :param data: indexed file contents
+        :param encodings: encodings the index must have been built with
+        :return: index or None
+        """
+        try:
+            with index_path.open("rb") as handle:
+                if handle.read(len(_MAGIC)) != _MAGIC:
+                    return None
+                (header_size,) = _HEADER_SIZE.unpack(
+                    handle.read(_HEADER_SIZE.size)
+                )
+                header: dict[str, Any] = json.loads(handle.read(header_size))
+                stat = path.stat()
+                if (
+                    header["size"] != stat.st_size
+                    or header["mtime_ns"] != stat.st_mtime_ns
+                    or header["encodings"] != encodings
+                    or header["hash"] != _content_hash(data)
+                ):
+                    return None
+                block_size: int = header["block_size"]
+                offsets = array("q")
+                offsets.fromfile(handle, header["events"])
+                block_times = None
+                if header["blocks"] is not None:
+                    block_times = array("q")
+                    block_times.fromfile(handle, header["blocks"])
+        except (
+            OSError,
+            EOFError,
+            ValueError,
+            KeyError,
+            TypeError,
+            struct.error,
+        ):
+            return None
+        if sys.byteorder == "big":
+            offsets.byteswap()
+            if block_times is not None:
+                block_times.byteswap()
+        return cls(
+            encodings=encodings,
+            sections=[
+                (name, start, end) for name, start, end in header["sections"]
+            ],
+            offsets=offsets,
+            formats=[
+                (start, field_names)
+                for start, field_names in header["formats"]
+            ],
+            block_times=block_times,
+            block_size=block_size,
+        )
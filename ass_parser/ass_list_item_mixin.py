@@ -0,0 +1,163 @@
+"""AssListItemMixin definition."""
+import weakref
+from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar
+
+from ass_parser.observable_object_mixin import ObservableObjectMixin
+from ass_parser.observable_sequence_mixin import (
+    ObservableSequenceItemModificationEvent,
+)
+from ass_parser.util import content_key, content_positions, stable_hash
+
+if TYPE_CHECKING:
+    from ass_parser.ass_sections import AssBaseItemList  # pragma: no coverage
+    from ass_parser.string_pool import StringPool  # pragma: no coverage
+
+TAssItemList = TypeVar("TAssItemList", bound="AssBaseItemList[Any]")
+
+
+class AssListItemMixin(ObservableObjectMixin, Generic[TAssItemList]):
+    """Base of the dataclasses that make up the rows of tabular sections,
+    such as AssEvent and AssStyle.
+
+    Attributes declared here are not dataclass fields, so they stay out of
+    __init__(), repr() and dataclasses.fields().
+    """
+
+    # fields whose values are shared through the string pool; subclasses
+    # expose them as properties keeping their values under a private name
+    _INTERNED_FIELDS: tuple[str, ...] = ()
+
+    # link to the parent list, redeclared by subclasses as dataclass fields
+    _parent: Optional["weakref.ref[TAssItemList]"] = None
+    _index: Optional[int] = None
+    _generation = 0
+    # stable hash of the field values, see fingerprint
+    _fingerprint: Optional[int] = None
+    # ASS line written for the item, reused until the item changes
+    _ass_line: Optional[str] = None
+    _derived_attrs = ("_fingerprint", "_ass_line")
+
+    def _intern(self, value: str) -> str:
+        """Return a copy of value shared with the parent list string pool.
+
+        :param value: string to intern
+        :return: interned string if has parent list, value otherwise
+        """
+        parent = self.parent
+        if parent is None:
+            return value
+        return parent.string_pool.intern(value)
+
+    def _intern_strings(self, pool: "StringPool") -> None:
+        """Make the string properties use the strings from the given pool.
+
+        The values do not change, so no change events are emitted.
+
+        :param pool: string pool to use
+        """
+        state = self.__dict__
+        for name in self._INTERNED_FIELDS:
+            key = "_" + name
+            state[key] = pool.intern(getattr(self, key))
+
+    @classmethod
+    def _intern_columns(
+        cls, columns: tuple[tuple[Any, ...], ...], pool: "StringPool"
+    ) -> tuple[tuple[Any, ...], ...]:
+        """Make the string columns made by content_columns() use the strings
+        from the given pool, like _intern_strings() does for a single item.
+
+        :param columns: columns of item field values
+        :param pool: string pool to use
+        :return: columns with pooled strings
+        """
+        if not columns:
+            return columns
+        positions = content_positions(cls)
+        interned = list(columns)
+        for name in cls._INTERNED_FIELDS:
+            interned[positions[name]] = pool.intern_all(
+                columns[positions[name]]
+            )
+        return tuple(interned)
+
+    @property
+    def parent(self) -> Optional[TAssItemList]:
+        """Return parent list.
+
+        :return: parent list
+        """
+        if self._parent is None:
+            return None
+        return self._parent()
+
+    @property
+    def index(self) -> int:
+        """Return item index within its parent list.
+
+        If the item does not have a parent list, raises a ValueError.
+
+        :return: index
+        """
+        raise NotImplementedError("not implemented")  # pragma: no cover
+
+    @property
+    def fingerprint(self) -> int:
+        """Return a stable hash of the item contents.
+
+        The hash is cached until the item changes.
+
+        :return: 64-bit hash
+        """
+        if self._fingerprint is None:
+            self._fingerprint = stable_hash(content_key(self))
+        return self._fingerprint
+
+    def _before_change(self) -> None:
+        """Emit item about to be modified event in the parent list."""
+        super()._before_change()
+        parent = self.parent
+        if parent is not None:
+            # pylint: disable=protected-access
+            parent._before_item_change(self)
+            if parent.items_about_to_be_modified.callbacks:
+                parent.items_about_to_be_modified.emit(
+                    ObservableSequenceItemModificationEvent(
+                        index=self.index, item=self
+                    )
+                )
+
+    def _after_change(self) -> None:
+        """Emit item modified event in the parent list."""
+        super()._after_change()
+        parent = self.parent
+        if parent is not None:
+            parent.items_modified.emit(
+                ObservableSequenceItemModificationEvent(
+                    index=self.index, item=self
+                )
+            )
+            parent._after_change()  # pylint: disable=protected-access
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Return pickle compatible object representation.
+
+        Only the field values are pickled, so the unpickled item is
+        detached from the parent list and has no subscribers.
+
+        :return: object representation
+        """
+        return type(self), content_key(self)
+
+    def __eq__(self, other: Any) -> bool:
+        """Check for equality. Ignores parent list and event handlers.
+
+        Subclasses must be declared with @dataclass(eq=False) so that the
+        dataclass does not replace this method.
+
+        :param other: other object
+        :return: whether objects are equal
+        """
+        if not isinstance(other, type(self)):
+            return False
+        return content_key(self) == content_key(other)
@@ -3,20 +3,30 @@
 Each section is capable of serializing and deserializing itself to an ASS text
 representation of itself.
 """
+from .ass_attachment_section import AssAttachment, AssAttachmentSection
+from .ass_base_item_list import AssBaseItemList
 from .ass_base_section import AssBaseSection
 from .ass_base_tabular_section import AssBaseTabularSection
 from .ass_event_list import AssEventList
 from .ass_key_value_mapping import AssKeyValueMapping
+from .ass_raw_section import AssRawSection
 from .ass_script_info import AssScriptInfo
+from .ass_section_list import AssSectionList, SectionListSnapshot
 from .ass_string_table import AssStringTable
 from .ass_style_list import AssStyleList
 
 __all__ = [
+    "AssAttachment",
+    "AssAttachmentSection",
+    "AssBaseItemList",
     "AssBaseSection",
     "AssBaseTabularSection",
     "AssEventList",
     "AssKeyValueMapping",
+    "AssRawSection",
     "AssScriptInfo",
+    "AssSectionList",
     "AssStringTable",
     "AssStyleList",
+    "SectionListSnapshot",
 ]
@@ -0,0 +1,255 @@
+"""AssAttachment and AssAttachmentSection definitions."""
+import base64
+import binascii
+from collections.abc import Iterable, Iterator
+from itertools import zip_longest
+from pathlib import Path
+from typing import IO, Any, Optional, Union
+
+from ass_parser.ass_sections.ass_base_section import AssBaseSection
+from ass_parser.ass_sections.const import GRAPHICS_SECTION_NAME
+from ass_parser.errors import CorruptAssError, CorruptAssLineError
+from ass_parser.observable_sequence_mixin import ObservableSequenceMixin
+
+# ASS uuencoding is base64 with the 64 characters starting at "!" and without
+# padding, so the conversion goes through binascii with a translation table
+_ASS_ALPHABET = bytes(range(33, 97))
+_BASE64_ALPHABET = (
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+)
+_TO_BASE64 = bytes.maketrans(_ASS_ALPHABET, _BASE64_ALPHABET)
+_FROM_BASE64 = bytes.maketrans(_BASE64_ALPHABET, _ASS_ALPHABET)
+
+# number of encoded characters per line, as written by Aegisub
+LINE_LENGTH = 80
+# number of decoded bytes processed at once
+CHUNK_SIZE = 3 * 2**16
+
+
+def _decode(text: str) -> bytes:
+    data = text.encode("ascii").translate(_TO_BASE64)
+    return base64.b64decode(data + b"=" * (-len(data) % 4))
+
+
+def _encode(data: bytes) -> str:
+    return base64.b64encode(data).rstrip(b"=").translate(_FROM_BASE64).decode()
+
+
+class AssAttachment:
+    """A file embedded in the [Fonts] or [Graphics] section.
+
+    Attachments read from an ASS file only remember where their encoded data
+    lies within the section, and get decoded on demand. Attachments created
+    from a path read the file only while being written.
+    """
+
+    def __init__(self, name: str, data: bytes = b"") -> None:
+        """Initialize self.
+
+        :param name: attachment file name
+        :param data: attachment contents
+        """
+        self.name = name
+        self._data: Optional[bytes] = data
+        self._path: Optional[Path] = None
+        self._encoded = ""
+        self._start = 0
+        self._end = 0
+
+    @classmethod
+    def from_path(
+        cls, path: Path, name: Optional[str] = None
+    ) -> "AssAttachment":
+        """Create an attachment backed by a file on disk.
+
+        :param path: path to the file to attach
+        :param name: attachment file name; defaults to the name of the file
+        :return: attachment
+        """
+        result = cls(name=path.name if name is None else name)
+        result._data = None
+        result._path = path
+        return result
+
+    @classmethod
+    def from_encoded(
+        cls, name: str, encoded: str, start: int = 0, end: Optional[int] = None
+    ) -> "AssAttachment":
+        """Create an attachment from uuencoded text without decoding it.
+
+        :param name: attachment file name
+        :param encoded: text holding the uuencoded data, without line breaks
+        :param start: offset of the attachment data within the text
+        :param end: offset of the end of the attachment data within the text
+        :return: attachment
+        """
+        result = cls(name=name)
+        result._data = None
+        result._encoded = encoded
+        result._start = start
+        result._end = len(encoded) if end is None else end
+        return result
+
+    @property
+    def size(self) -> int:
+        """Return the size of the decoded contents without decoding them.
+
+        :return: number of bytes
+        """
+        if self._data is not None:
+            return len(self._data)
+        if self._path is not None:
+            return self._path.stat().st_size
+        length = self._end - self._start
+        return length // 4 * 3 + max(0, length % 4 - 1)
+
+    def iter_bytes(self, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """Produce the decoded contents chunk by chunk.
+
+        :param chunk_size: maximum number of bytes per chunk
+        :return: a generator of byte chunks
+        """
+        chunk_size = max(3, chunk_size - chunk_size % 3)
+        if self._data is not None:
+            for pos in range(0, len(self._data), chunk_size):
+                yield self._data[pos : pos + chunk_size]
+        elif self._path is not None:
+            with self._path.open("rb") as handle:
+                while chunk := handle.read(chunk_size):
+                    yield chunk
+        else:
+            step = chunk_size // 3 * 4
+            for pos in range(self._start, self._end, step):
+                text = self._encoded[pos : min(pos + step, self._end)]
+                try:
+                    yield _decode(text)
+                except (binascii.Error, UnicodeEncodeError) as exc:
+                    raise CorruptAssError(
+                        f'badly encoded attachment "{self.name}"'
+                    ) from exc
+
+    def read(self) -> bytes:
+        """Return the decoded contents.
+
+        :return: attachment contents
+        """
+        if self._data is not None:
+            return self._data
+        return b"".join(self.iter_bytes())
+
+    def save(self, target: Union[Path, IO[bytes]]) -> None:
+        """Decode the contents into a file or a binary stream.
+
+        :param target: a path or a writable binary stream
+        """
+        if isinstance(target, Path):
+            with target.open("wb") as handle:
+                self.save(handle)
+                return
+        for chunk in self.iter_bytes():
+            target.write(chunk)
+
+    def produce_ass_body_lines(self) -> Iterator[str]:
+        """Produce the uuencoded contents, split into lines.
+
+        :return: a generator of encoded lines
+        """
+        if self._data is None and self._path is None:
+            for pos in range(self._start, self._end, LINE_LENGTH):
+                yield self._encoded[pos : min(pos + LINE_LENGTH, self._end)]
+            return
+        # chunks are a multiple of the bytes encoded in a single line, so
+        # only the last one produces a shorter line
+        line_bytes = LINE_LENGTH // 4 * 3
+        for chunk in self.iter_bytes(CHUNK_SIZE // line_bytes * line_bytes):
+            text = _encode(chunk)
+            for pos in range(0, len(text), LINE_LENGTH):
+                yield text[pos : pos + LINE_LENGTH]
+
+    def __eq__(self, other: Any) -> bool:
+        """Check for equality.
+
+        :param other: other object
+        :return: whether objects are equal
+        """
+        if not isinstance(other, AssAttachment):
+            return False
+        return self.name == other.name and all(
+            ours == theirs
+            for ours, theirs in zip_longest(
+                self.produce_ass_body_lines(), other.produce_ass_body_lines()
+            )
+        )
+
+    def __repr__(self) -> str:
+        """Return a short representation of self.
+
+        :return: representation
+        """
+        return f"{type(self).__name__}(name={self.name!r}, size={self.size})"
+
+
+class AssAttachmentSection(
+    ObservableSequenceMixin[AssAttachment], AssBaseSection
+):
+    """ASS section holding embedded fonts or graphics."""
+
+    # attachments can be renamed
+    _has_mutable_items = True
+
+    @property
+    def entry_key(self) -> str:
+        """Return the key that introduces each attachment.
+
+        :return: "filename" for [Graphics], "fontname" otherwise
+        """
+        if self.name == GRAPHICS_SECTION_NAME:
+            return "filename"
+        return "fontname"
+
+    def consume_ass_body_lines(self, lines: list[tuple[int, str]]) -> None:
+        """Populate self from ASS text representation of this section,
+        excluding the ASS header line.
+
+        The encoded lines of each attachment are joined into a string of its
+        own, so that dropping an attachment frees its data.
+
+        :param lines: list of tuples (line_num, line)
+        """
+        prefix = self.entry_key + ":"
+        entries: list[tuple[str, list[str]]] = []
+        for line_num, line in lines:
+            # the encoding never produces lowercase letters
+            if line.startswith(prefix):
+                entries.append((line[len(prefix) :].strip(), []))
+            elif not entries:
+                raise CorruptAssLineError(
+                    line_num, line, f'expected "{prefix}"'
+                )
+            else:
+                entries[-1][1].append(line)
+        self.clear()
+        self.extend(
+            AssAttachment.from_encoded(name, "".join(chunks))
+            for name, chunks in entries
+        )
+
+    def produce_ass_body_lines(self) -> Iterable[str]:
+        """Produce ASS text representation of self, excluding the ASS header
+        line.
+
+        :return: a generator of ASS section body lines
+        """
+        for attachment in self:
+            yield f"{self.entry_key}: {attachment.name}"
+            yield from attachment.produce_ass_body_lines()
+
+    def __eq__(self, other: Any) -> bool:
+        """Check for equality. Ignores event handlers.
+
+        :param other: other object
+        :return: whether objects are equal
+        """
+        if not isinstance(other, AssAttachmentSection):
+            return False
+        return self.name == other.name and self._data == other._data
@@ -0,0 +1,259 @@
+"""AssBaseItemList definition."""
+import weakref
+from collections.abc import Iterable
+from itertools import repeat
+from typing import Any, Optional, TypeVar, Union
+
+from ass_parser.ass_list_item_mixin import AssListItemMixin
+from ass_parser.ass_sections.ass_base_tabular_section import (
+    AssBaseTabularSection,
+)
+from ass_parser.observable_sequence_mixin import (
+    ObservableSequenceItemInsertionEvent,
+    ObservableSequenceItemRemovalEvent,
+)
+from ass_parser.snapshot_sequence_mixin import SnapshotSequenceMixin
+from ass_parser.string_pool import StringPool
+from ass_parser.util import (
+    content_columns,
+    gc_paused,
+    items_from_columns,
+    stable_hash,
+)
+
+TAssListItem = TypeVar("TAssListItem", bound=AssListItemMixin[Any])
+TAssBaseItemList = TypeVar("TAssBaseItemList", bound="AssBaseItemList[Any]")
+
+# name, item columns, whether to preserve original lines, source format
+# line and source item lines
+_PickleState = tuple[
+    str,
+    tuple[tuple[Any, ...], ...],
+    bool,
+    Optional[str],
+    Optional[tuple[Optional[str], ...]],
+]
+
+
+class AssBaseItemList(
+    SnapshotSequenceMixin[TAssListItem], AssBaseTabularSection[TAssListItem]
+):
+    """Base of the tabular sections whose rows are dataclasses, such as
+    AssEventList and AssStyleList.
+
+    The items are linked to the list they belong to, share their strings
+    through its string pool and cache their serialized lines.
+    """
+
+    # dataclass the list is made of
+    _item_type: type[TAssListItem]
+    # format line written unless the source one is preserved
+    _format_line: str
+
+    def __init__(
+        self,
+        name: str,
+        data: Optional[list[TAssListItem]] = None,
+        string_pool: Optional[StringPool] = None,
+    ) -> None:
+        """Initialize self.
+
+        :param name: section name
+        :param data: items to populate self with
+        :param string_pool: interning table for the item strings; if not
+            given, the list uses its own
+        """
+        super().__init__(name=name)
+        self.string_pool = StringPool() if string_pool is None else string_pool
+        if data:
+            self.extend(data)
+
+    def _before_items_insertion(
+        self, event: ObservableSequenceItemInsertionEvent[TAssListItem]
+    ) -> None:
+        for item in event.items:
+            if item.parent is not None:
+                raise TypeError(
+                    f"{type(item).__name__} belongs to another "
+                    f"{type(self).__name__}"
+                )
+
+    def _on_items_insertion(
+        self, event: ObservableSequenceItemInsertionEvent[TAssListItem]
+    ) -> None:
+        pool = self.string_pool
+        parent = weakref.ref(self)
+        for item in event.items:
+            item._parent = parent  # pylint: disable=protected-access
+            item._intern_strings(pool)  # pylint: disable=protected-access
+        self._reindex(event.index)
+
+    def _on_items_removal(
+        self, event: ObservableSequenceItemRemovalEvent[TAssListItem]
+    ) -> None:
+        for item in event.items:
+            item._parent = None  # pylint: disable=protected-access
+            item._index = None  # pylint: disable=protected-access
+        self._reindex(event.index)
+
+    def _reindex(self, index: Union[int, slice]) -> None:
+        # single item operations only shift the items that follow them
+        start = 0
+        if isinstance(index, int):
+            if index < 0:
+                start = max(0, index + len(self._data) - 1)
+            else:
+                start = max(0, min(index, len(self._data) - 1))
+        for i in range(start, len(self._data)):
+            self._data[i]._index = i  # pylint: disable=protected-access
+
+    def produce_ass_table_header(self, own_item: TAssListItem) -> str:
+        """Produce the "Format:" line of the table.
+
+        :param own_item: the first item
+        :return: ASS table header line
+        """
+        return self._source_format_line or self._format_line
+
+    def _can_preserve_ass_lines(self, field_names: list[str]) -> bool:
+        """Return whether the source lines of a table with given columns can
+        be written back as they are.
+
+        :param field_names: columns of the source table
+        :return: whether the columns are the ones this class writes
+        """
+        return "Format: " + ",".join(field_names) == self._format_line
+
+    def _preserve_ass_table_line(self, line: str) -> None:
+        """Use the source line as the serialized item until it changes.
+
+        :param line: source line
+        """
+        self._data[-1]._ass_line = line  # pylint: disable=protected-access
+
+    def produce_ass_table_line(self, own_item: TAssListItem) -> str:
+        """Produce an ASS line based on an own item.
+
+        The line is cached on the item until it changes, so saving a file
+        only formats the items modified since the last save.
+
+        :param own_item: item to serialize
+        :return: ASS table line
+        """
+        # pylint: disable=protected-access
+        line = own_item._ass_line
+        if line is None:
+            line = self._format_ass_table_line(own_item)
+            own_item._ass_line = line
+        return line
+
+    def _format_ass_table_line(self, own_item: TAssListItem) -> str:
+        """Format an ASS line based on an own item.
+
+        Equivalent to joining the values of produce_ass_table_row(), but
+        does not build the intermediate dict.
+
+        :param own_item: item to serialize
+        :return: ASS table line
+        """
+        raise NotImplementedError("not implemented")  # pragma: no cover
+
+    def _compute_fingerprint(self) -> int:
+        """Hash the items by combining their cached fingerprints.
+
+        :return: 64-bit hash
+        """
+        return stable_hash(item.fingerprint for item in self._data)
+
+    def __eq__(self, other: Any) -> bool:
+        """Check for equality. Ignores event handlers.
+
+        Lists with different cached fingerprints are told apart in O(1);
+        otherwise the items are compared one by one, in O(n).
+
+        :param other: other object
+        :return: whether objects are equal
+        """
+        if other is self:
+            return True
+        if not isinstance(other, type(self)):
+            return False
+        return (
+            self.name == other.name
+            and self.fingerprint == other.fingerprint
+            and self._data == other._data
+        )
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Return pickle compatible object representation.
+
+        Items are pickled as columns of their field values, without their
+        links to self. The pickled copy does not have subscribers nor
+        snapshots.
+
+        :return: object representation
+        """
+        return type(self)._from_pickle_state, (self._pickle_state(),)
+
+    def _pickle_state(self) -> _PickleState:
+        """Return the contents of self as plain tuples.
+
+        :return: state to pass to _from_pickle_state()
+        """
+        ass_lines = None
+        if self.preserve_original:
+            # pylint: disable=protected-access
+            ass_lines = tuple(item._ass_line for item in self._data)
+        return (
+            self.name,
+            content_columns(self._data),
+            self.preserve_original,
+            self._source_format_line,
+            ass_lines,
+        )
+
+    @classmethod
+    def _from_pickle_state(
+        cls: type[TAssBaseItemList],
+        state: _PickleState,
+        string_pool: Optional[StringPool] = None,
+    ) -> TAssBaseItemList:
+        """Recreate a list from the state returned by _pickle_state().
+
+        :param state: pickled state
+        :param string_pool: interning table for the item strings
+        :return: item list
+        """
+        name, columns, preserve_original, source_format_line, ass_lines = state
+        ret = cls(name=name, string_pool=string_pool)
+        ret.preserve_original = preserve_original
+        ret._source_format_line = source_format_line
+        ret._load_columns(columns, ass_lines)
+        return ret
+
+    def _load_columns(
+        self,
+        columns: tuple[tuple[Any, ...], ...],
+        ass_lines: Optional[tuple[Optional[str], ...]] = None,
+    ) -> None:
+        """Populate empty self with items made from the given columns.
+
+        The items are linked to self in a single pass rather than through
+        the insertion events.
+
+        :param columns: columns of item field values, see content_columns()
+        :param ass_lines: source lines to write back unless the items change
+        """
+        extra_columns: dict[str, Iterable[Any]] = {
+            "_parent": repeat(weakref.ref(self)),
+            "_index": range(len(columns[0]) if columns else 0),
+        }
+        if ass_lines is not None:
+            extra_columns["_ass_line"] = ass_lines
+        # pylint: disable=protected-access
+        with gc_paused():
+            self._data = items_from_columns(
+                self._item_type,
+                self._item_type._intern_columns(columns, self.string_pool),
+                **extra_columns,
+            )
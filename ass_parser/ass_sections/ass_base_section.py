@@ -1,9 +1,14 @@
 """AssBaseSection definition."""
-from collections.abc import Iterable
-from typing import TypeVar
+import weakref
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
 from ass_parser.ass_sections.const import SECTION_HEADING_RE
 from ass_parser.errors import CorruptAssError, CorruptAssLineError
+from ass_parser.util import stable_hash
+
+if TYPE_CHECKING:  # pragma: no coverage
+    from ass_parser.ass_sections.ass_section_list import SectionListSnapshot
 
 TAssConcreteSection = TypeVar("TAssConcreteSection", bound="AssBaseSection")
 
@@ -17,6 +22,27 @@ class AssBaseSection:
     Each section knows how to serialize and deserialize itself.
     """
 
+    # whether consume_ass_lines() keeps the source text of the lines, so
+    # that the unmodified ones are written back unchanged
+    preserve_original = False
+
+    # change counter maintained by the observable container mixins
+    _version = 0
+    # whether items can be changed in place without bumping _version, in
+    # which case nothing derived from the contents can be cached
+    _has_mutable_items = False
+    _fingerprint_cache: Optional[tuple[int, int]] = None
+
+    # source lines written back as long as the section does not change
+    _raw_body_lines: Optional[list[str]] = None
+    _raw_version = 0
+    _raw_fingerprint: Optional[int] = None
+
+    # whether every change to the section calls _preserve_in_snapshots()
+    # first, so that section list snapshots can share it until it changes
+    _preserves_before_change = False
+    _list_snapshots: Optional["weakref.WeakSet[SectionListSnapshot]"] = None
+
     def __init__(self, name: str) -> None:
         """Initialize self.
 
@@ -24,6 +50,34 @@ class AssBaseSection:
         """
         self.name = name
 
+    @property
+    def fingerprint(self) -> int:
+        """Return a stable hash of the section name and contents.
+
+        The hash of the contents is cached until the section changes, so
+        repeated calls on an unchanged section are O(1), unless its items
+        can be changed in place. Sections parsed from raw sections hash the
+        same as the raw sections until they change.
+
+        :return: 64-bit hash
+        """
+        if self._raw_body_lines is not None and self._is_unchanged():
+            return stable_hash((self.name, stable_hash(self._raw_body_lines)))
+        if self._has_mutable_items:
+            return stable_hash((self.name, self._compute_fingerprint()))
+        cache = self._fingerprint_cache
+        if cache is None or cache[0] != self._version:
+            cache = (self._version, self._compute_fingerprint())
+            self._fingerprint_cache = cache
+        return stable_hash((self.name, cache[1]))
+
+    def _compute_fingerprint(self) -> int:
+        """Hash the section contents.
+
+        :return: 64-bit hash
+        """
+        return stable_hash(self.produce_ass_body_lines())
+
     @classmethod
     def from_ass_string(
         cls: type[TAssConcreteSection], source: str
@@ -54,6 +108,31 @@ class AssBaseSection:
         """Populate self from ASS text representation of this section,
         including the ASS header line.
 
+        :param lines: list of tuples (line_num, line)
+        """
+        self._consume_ass_header_line(lines)
+        self.consume_ass_body_lines(lines[1:])
+
+    def iter_consume_ass_lines(
+        self, lines: list[tuple[int, str]], batch_size: int
+    ) -> Iterator[None]:
+        """Populate self like consume_ass_lines(), pausing every now and then.
+
+        Sections that can take long to parse yield after every batch of
+        lines, so that the caller can do other work in between. The others
+        yield once they are done.
+
+        :param lines: list of tuples (line_num, line)
+        :param batch_size: number of lines to consume between the pauses
+        :return: a generator to exhaust
+        """
+        # pylint: disable=unused-argument
+        self.consume_ass_lines(lines)
+        yield
+
+    def _consume_ass_header_line(self, lines: list[tuple[int, str]]) -> None:
+        """Take the section name from the ASS header line.
+
         :param lines: list of tuples (line_num, line)
         """
         if not lines:
@@ -65,8 +144,6 @@ class AssBaseSection:
             raise CorruptAssLineError(line_num, line, "badly formatted header")
         self.name = match.group("section_name")
 
-        self.consume_ass_body_lines(lines[1:])
-
     def consume_ass_body_lines(self, lines: list[tuple[int, str]]) -> None:
         """Populate self from ASS text representation of this section,
         excluding the ASS header line.
@@ -82,7 +159,36 @@ class AssBaseSection:
         :return: a generator of ASS section lines
         """
         yield f"[{self.name}]"
-        yield from self.produce_ass_body_lines()
+        if self._raw_body_lines is not None and self._is_unchanged():
+            yield from self._raw_body_lines
+        else:
+            yield from self.produce_ass_body_lines()
+
+    def _remember_raw_body_lines(self, lines: list[str]) -> None:
+        """Write the given source lines instead of the contents of self for
+        as long as self does not change.
+
+        :param lines: section lines, excluding the ASS header line
+        """
+        self._raw_body_lines = lines
+        self._raw_version = self._version
+        if self._has_mutable_items:
+            self._raw_fingerprint = self._compute_fingerprint()
+
+    def _is_unchanged(self) -> bool:
+        """Return whether self did not change since its source lines were
+        remembered.
+
+        Sections whose items can change in place are hashed again.
+
+        :return: whether the remembered source lines are up to date
+        """
+        if self._raw_version != self._version:
+            return False
+        return (
+            not self._has_mutable_items
+            or self._compute_fingerprint() == self._raw_fingerprint
+        )
 
     def produce_ass_body_lines(self) -> Iterable[str]:
         """Produce ASS text representation of self, excluding the ASS header
@@ -91,3 +197,34 @@ class AssBaseSection:
         :return: a generator of ASS section body lines
         """
         raise NotImplementedError("not implemented")  # pragma: no cover
+
+    def _add_list_snapshot(self, snapshot: "SectionListSnapshot") -> None:
+        """Share self with a section list snapshot until self changes.
+
+        :param snapshot: snapshot to preserve self in
+        """
+        if self._list_snapshots is None:
+            self._list_snapshots = weakref.WeakSet()
+        self._list_snapshots.add(snapshot)
+
+    def _preserve_in_snapshots(self) -> None:
+        """Hand a copy of self to the section list snapshots that share it.
+
+        Called before self changes.
+        """
+        snapshots = self._list_snapshots
+        if snapshots:
+            for snapshot in list(snapshots):
+                snapshot._preserve(self)  # pylint: disable=protected-access
+            snapshots.clear()
+
+    def __getstate__(self) -> Any:
+        """Return pickle compatible object representation.
+
+        Copies are not shared with the snapshots of the original.
+
+        :return: object representation
+        """
+        state = self.__dict__.copy()
+        state.pop("_list_snapshots", None)
+        return state
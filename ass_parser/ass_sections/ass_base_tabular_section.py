@@ -1,6 +1,6 @@
 """AssBaseTabularSection definition."""
-from collections.abc import Iterable, MutableSequence
-from typing import Generic, TypeVar
+from collections.abc import Callable, Iterable, Iterator, MutableSequence
+from typing import Generic, Optional, TypeVar
 
 from ass_parser.ass_sections.ass_base_section import AssBaseSection
 from ass_parser.errors import CorruptAssError, CorruptAssLineError
@@ -8,6 +8,25 @@ from ass_parser.errors import CorruptAssError, CorruptAssLineError
 TAssTableItem = TypeVar("TAssTableItem")
 
 
+def split_ass_table_line(
+    line: str, field_names: list[str]
+) -> tuple[str, dict[str, str]]:
+    """Split an ASS table line into its type and a dict of its values.
+
+    :param line: line to split
+    :param field_names: columns of the table
+    :return: a tuple of the part before the colon and a dictified ASS line
+    """
+    try:
+        item_type, rest = line.split(": ", 1)
+    except ValueError as exc:
+        raise ValueError("expected a colon") from exc
+    field_values = rest.strip().split(",", len(field_names) - 1)
+    if len(field_names) != len(field_values):
+        raise ValueError(f"expected {len(field_names)} values")
+    return item_type, dict(zip(field_names, field_values))
+
+
 class AssBaseTabularSection(
     AssBaseSection, Generic[TAssTableItem], MutableSequence[TAssTableItem]
 ):
@@ -17,12 +36,33 @@ class AssBaseTabularSection(
     and items.
     """
 
+    _source_format_line: Optional[str] = None
+
     def consume_ass_body_lines(self, lines: list[tuple[int, str]]) -> None:
         """Populate self from ASS text representation of this section,
         excluding the ASS header line.
 
         :param lines: list of tuples (line_num, line)
         """
+        for _ in self._iter_consume_ass_body_lines(lines, len(lines) + 1):
+            pass
+
+    def iter_consume_ass_lines(
+        self, lines: list[tuple[int, str]], batch_size: int
+    ) -> Iterator[None]:
+        """Populate self like consume_ass_lines(), yielding after every batch
+        of table rows.
+
+        :param lines: list of tuples (line_num, line)
+        :param batch_size: number of lines to consume between the pauses
+        :return: a generator to exhaust
+        """
+        self._consume_ass_header_line(lines)
+        yield from self._iter_consume_ass_body_lines(lines[1:], batch_size)
+
+    def _iter_consume_ass_body_lines(
+        self, lines: list[tuple[int, str]], batch_size: int
+    ) -> Iterator[None]:
         if not lines:
             raise CorruptAssError("expected a table header")
 
@@ -42,24 +82,54 @@ class AssBaseTabularSection(
         field_names = [p.strip() for p in rest.strip().split(",")]
 
         self.clear()
-
-        for line_num, line in lines[1:]:
-            try:
-                item_type, rest = line.split(": ", 1)
-            except (ValueError, IndexError) as exc:
-                raise CorruptAssLineError(
-                    line_num, line, "expected a colon"
-                ) from exc
-            field_values = rest.strip().split(",", len(field_names) - 1)
-            if len(field_names) != len(field_values):
-                raise CorruptAssLineError(
-                    line_num, line, f"expected {len(field_names)} values"
-                )
-            item = dict(zip(field_names, field_values))
+        preserve = self.preserve_original and self._can_preserve_ass_lines(
+            field_names
+        )
+        self._source_format_line = line if preserve else None
+
+        line_filter = self._make_ass_line_filter(field_names)
+        for row_num, (line_num, line) in enumerate(lines[1:], start=1):
+            if not row_num % batch_size:
+                yield
+            if line_filter is not None and not line_filter(line):
+                continue
             try:
+                item_type, item = split_ass_table_line(line, field_names)
                 self.consume_ass_table_row(item_type, item)
             except (ValueError, IndexError) as exc:
                 raise CorruptAssLineError(line_num, line, str(exc)) from exc
+            if preserve:
+                self._preserve_ass_table_line(line)
+
+    def _make_ass_line_filter(
+        self, field_names: list[str]
+    ) -> Optional[Callable[[str], bool]]:
+        """Return a function that tells which source lines to consume.
+
+        Lets subclasses skip lines without fully parsing them.
+
+        :param field_names: columns of the source table
+        :return: predicate taking a source line, or None to consume all lines
+        """
+        # pylint: disable=unused-argument
+        return None
+
+    def _can_preserve_ass_lines(self, field_names: list[str]) -> bool:
+        """Return whether the source lines of a table with given columns can
+        be written back as they are.
+
+        :param field_names: columns of the source table
+        :return: whether to preserve the source lines
+        """
+        # pylint: disable=unused-argument
+        return False
+
+    def _preserve_ass_table_line(self, line: str) -> None:
+        """Remember the source line of the most recently consumed item.
+
+        :param line: source line
+        """
+        # pylint: disable=unused-argument
 
     def consume_ass_table_row(
         self, item_type: str, item: dict[str, str]
@@ -79,15 +149,40 @@ class AssBaseTabularSection(
         """
         header_output = False
         for own_item in self:
-            item_type, item_dict = self.produce_ass_table_row(own_item)
             if not header_output:
-                yield "Format: " + ",".join(item_dict.keys())
+                yield self.produce_ass_table_header(own_item)
                 header_output = True
-            values = list(item_dict.values())
-            last_value = values.pop()
-            values = [value.replace(",", ";") for value in values]
-            values.append(last_value)
-            yield f"{item_type}: " + ",".join(values)
+            yield self.produce_ass_table_line(own_item)
+
+    def produce_ass_table_header(self, own_item: TAssTableItem) -> str:
+        """Produce the "Format:" line of the table.
+
+        Subclasses with fixed columns can override this to skip building
+        a row dict.
+
+        :param own_item: the first item of the table
+        :return: ASS table header line
+        """
+        _item_type, item_dict = self.produce_ass_table_row(own_item)
+        return "Format: " + ",".join(item_dict.keys())
+
+    def produce_ass_table_line(self, own_item: TAssTableItem) -> str:
+        """Produce an ASS line based on an own item.
+
+        Subclasses with fixed columns can override this to format the line
+        directly rather than through produce_ass_table_row().
+
+        :param own_item: item to serialize
+        :return: ASS table line
+        """
+        item_type, item_dict = self.produce_ass_table_row(own_item)
+        *values, last_value = item_dict.values()
+        return (
+            f"{item_type}: "
+            + ",".join([value.replace(",", ";") for value in values])
+            + ("," if values else "")
+            + last_value
+        )
 
     def produce_ass_table_row(
         self, own_item: TAssTableItem
@@ -1,70 +1,74 @@
 """AssEventList definition."""
 import re
+from collections.abc import Callable, Iterator
+from operator import itemgetter
 from typing import Any, Optional
 
 from ass_parser.ass_event import AssEvent
+from ass_parser.ass_sections.ass_base_item_list import AssBaseItemList
 from ass_parser.ass_sections.ass_base_tabular_section import (
-    AssBaseTabularSection,
+    split_ass_table_line,
 )
-from ass_parser.ass_sections.const import EVENTS_SECTION_NAME
-from ass_parser.observable_sequence_mixin import (
-    ObservableSequenceItemInsertionEvent,
-    ObservableSequenceItemRemovalEvent,
-    ObservableSequenceMixin,
+from ass_parser.ass_sections.const import (
+    EVENTS_FORMAT_LINE,
+    EVENTS_SECTION_NAME,
 )
+from ass_parser.string_pool import StringPool
 from ass_parser.util import (
     ass_timestamp_to_ms,
+    content_key,
+    content_positions,
     escape_ass_tag,
     ms_to_ass_timestamp,
+    try_ass_timestamp_to_ms,
     unescape_ass_tag,
 )
 
+# picks the fields of content_key() tuples that format_ass_table_values()
+# unpacks, by name, so that it does not depend on the field order
+_pick_format_fields = itemgetter(
+    *map(
+        content_positions(AssEvent).__getitem__,
+        (
+            "start",
+            "end",
+            "style_name",
+            "actor",
+            "text",
+            "note",
+            "effect",
+            "layer",
+            "margin_left",
+            "margin_right",
+            "margin_vertical",
+            "is_comment",
+        ),
+    )
+)
+
 
-class AssEventList(
-    ObservableSequenceMixin[AssEvent],
-    AssBaseTabularSection[AssEvent],
-):
+class AssEventList(AssBaseItemList[AssEvent]):
     """ASS events container."""
 
+    _item_type = AssEvent
+    _format_line = EVENTS_FORMAT_LINE
+    # window passed to iter_consume_ass_lines(), only set while it runs
+    _time_range: Optional[tuple[int, int]] = None
+
     def __init__(
         self,
         name: str = EVENTS_SECTION_NAME,
         data: Optional[list[AssEvent]] = None,
+        string_pool: Optional[StringPool] = None,
     ) -> None:
-        """Initialize self."""
-        super().__init__(name=name)
-        self.items_about_to_be_inserted.subscribe(self._before_items_insertion)
-        self.items_inserted.subscribe(self._on_items_insertion)
-        self.items_removed.subscribe(self._on_items_removal)
-        if data:
-            self.extend(data)
-
-    @staticmethod
-    def _before_items_insertion(
-        event: ObservableSequenceItemInsertionEvent[AssEvent],
-    ) -> None:
-        for item in event.items:
-            if item.parent is not None:
-                raise TypeError("AssEvent belongs to another AssEventList")
-
-    def _on_items_insertion(
-        self, event: ObservableSequenceItemInsertionEvent[AssEvent]
-    ) -> None:
-        for item in event.items:
-            item._parent = self  # pylint: disable=protected-access
-        self._reindex()
-
-    def _on_items_removal(
-        self, event: ObservableSequenceItemRemovalEvent[AssEvent]
-    ) -> None:
-        for item in event.items:
-            item._parent = None  # pylint: disable=protected-access
-            item._index = None  # pylint: disable=protected-access
-        self._reindex()
+        """Initialize self.
 
-    def _reindex(self) -> None:
-        for i, item in enumerate(self._data):
-            item._index = i  # pylint: disable=protected-access
+        :param name: section name
+        :param data: events to populate self with
+        :param string_pool: interning table for the event strings; if not
+            given, the list uses its own
+        """
+        super().__init__(name=name, data=data, string_pool=string_pool)
 
     def consume_ass_table_row(
         self, item_type: str, item: dict[str, str]
@@ -74,6 +78,17 @@ class AssEventList(
         :param item_type: the part before the colon
         :param item: the dictified ASS line
         """
+        self.append(self.parse_ass_table_row(item_type, item))
+
+    @staticmethod
+    def parse_ass_table_row(item_type: str, item: dict[str, str]) -> AssEvent:
+        """Create a standalone event from a dict created by parsing an ASS
+        line.
+
+        :param item_type: the part before the colon
+        :param item: the dictified ASS line
+        :return: event
+        """
         if item_type not in {"Comment", "Dialogue"}:
             raise ValueError(f'unknown event type: "{item_type}"')
 
@@ -102,23 +117,87 @@ class AssEventList(
             if 0 <= end_ms - end < 10:
                 end = end_ms
 
-        self.append(
-            AssEvent(
-                layer=int(item["Layer"]),
-                start=start,
-                end=end,
-                style_name=item["Style"],
-                actor=item["Name"],
-                margin_left=int(item["MarginL"]),
-                margin_right=int(item["MarginR"]),
-                margin_vertical=int(item["MarginV"]),
-                effect=item["Effect"],
-                text=text,
-                note=note,
-                is_comment=item_type == "Comment",
-            )
+        return AssEvent(
+            layer=int(item["Layer"]),
+            start=start,
+            end=end,
+            style_name=item["Style"],
+            actor=item["Name"],
+            margin_left=int(item["MarginL"]),
+            margin_right=int(item["MarginR"]),
+            margin_vertical=int(item["MarginV"]),
+            effect=item["Effect"],
+            text=text,
+            note=note,
+            is_comment=item_type == "Comment",
         )
 
+    def iter_consume_ass_lines(
+        self,
+        lines: list[tuple[int, str]],
+        batch_size: int,
+        time_range: Optional[tuple[int, int]] = None,
+    ) -> Iterator[None]:
+        """Populate self like consume_ass_lines(), yielding after every batch
+        of table rows.
+
+        :param lines: list of tuples (line_num, line)
+        :param batch_size: number of lines to consume between the pauses
+        :param time_range: optional window (start, end) in milliseconds;
+            events that do not intersect it are skipped, see
+            AssFile.consume_ass_stream()
+        :return: a generator to exhaust
+        """
+        self._time_range = time_range
+        try:
+            yield from super().iter_consume_ass_lines(lines, batch_size)
+        finally:
+            self._time_range = None
+
+    def _make_ass_line_filter(
+        self, field_names: list[str]
+    ) -> Optional[Callable[[str], bool]]:
+        """Return a function that tells which source lines fall within
+        the time range passed to iter_consume_ass_lines().
+
+        Only the Start and End fields are parsed, unless the event lies so
+        close to the window bounds that its {TIME:…} tag decides.
+
+        :param field_names: columns of the source table
+        :return: predicate taking a source line, or None to consume all lines
+        """
+        time_range = self._time_range
+        if time_range is None or not {"Start", "End"} <= set(field_names):
+            return None
+        range_start, range_end = time_range
+        start_pos = field_names.index("Start")
+        end_pos = field_names.index("End")
+        max_split = max(start_pos, end_pos) + 1
+
+        def accepts(line: str) -> bool:
+            values = line.split(": ", 1)[-1].split(",", max_split)
+            start = end = None
+            if len(values) > max_split:
+                start = try_ass_timestamp_to_ms(values[start_pos].strip())
+                end = try_ass_timestamp_to_ms(values[end_pos].strip())
+            if start is None or end is None:
+                # let the full parsing report the error
+                return True
+            # {TIME:…} tags can move the times up to 9 ms later
+            if start >= range_end or end + 9 <= range_start:
+                return False
+            if start + 9 < range_end and end > range_start:
+                return True
+            try:
+                event = self.parse_ass_table_row(
+                    *split_ass_table_line(line, field_names)
+                )
+            except (ValueError, IndexError):
+                return True
+            return event.start < range_end and event.end > range_start
+
+        return accepts
+
     def produce_ass_table_row(
         self, own_item: AssEvent
     ) -> tuple[str, dict[str, str]]:
@@ -150,14 +229,56 @@ class AssEventList(
             "Text": text,
         }
 
-    def __eq__(self, other: Any) -> bool:
-        """Check for equality. Ignores event handlers.
+    @staticmethod
+    def _format_ass_table_line(own_item: AssEvent) -> str:
+        """Format an ASS line based on an own item.
+
+        Equivalent to joining the values of produce_ass_table_row(), but
+        does not build the intermediate dict.
+
+        :param own_item: event to serialize
+        :return: ASS event line
+        """
+        return AssEventList.format_ass_table_values(content_key(own_item))
+
+    @staticmethod
+    def format_ass_table_values(values: tuple[Any, ...]) -> str:
+        """Format an ASS line based on the field values of an event.
+
+        Works without an AssEvent instance, which is costly to create in
+        a worker process just to serialize it.
 
-        :param other: other object
-        :return: whether objects are equal
+        :param values: field values, in the order of content_key()
+        :return: ASS event line
         """
-        if not isinstance(other, AssEventList):
-            return False
-        return self.name == other.name and tuple(self._data) == tuple(
-            other._data
+        (
+            start,
+            end,
+            style_name,
+            actor,
+            text,
+            note,
+            effect,
+            layer,
+            margin_left,
+            margin_right,
+            margin_vertical,
+            is_comment,
+        ) = _pick_format_fields(values)
+        if start is not None and end is not None:
+            text = "{TIME:%d,%d}" % (start, end) + text
+        if note:
+            text += "{NOTE:%s}" % escape_ass_tag(note.replace("\n", "\\N"))
+        return (
+            f"{'Comment' if is_comment else 'Dialogue'}: "
+            f"{layer},"
+            f"{ms_to_ass_timestamp(start)},"
+            f"{ms_to_ass_timestamp(end)},"
+            f"{style_name.replace(',', ';')},"
+            f"{actor.replace(',', ';')},"
+            f"{margin_left},"
+            f"{margin_right},"
+            f"{margin_vertical},"
+            f"{effect.replace(',', ';')},"
+            f"{text}"
         )
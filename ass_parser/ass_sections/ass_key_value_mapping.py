@@ -10,6 +10,20 @@ from ass_parser.observable_mapping_mixin import ObservableMappingMixin
 class AssKeyValueMapping(ObservableMappingMixin[str, str], AssBaseSection):
     """ASS key-value mapping section."""
 
+    _preserves_before_change = True
+
+    def __init__(self, name: str) -> None:
+        """Initialize self.
+
+        :param name: section name
+        """
+        super().__init__(name)
+        self._source_lines: dict[str, tuple[str, str]] = {}
+
+    def _before_change(self) -> None:
+        """Preserve self in the section list snapshots that share it."""
+        self._preserve_in_snapshots()
+
     def consume_ass_body_lines(self, lines: list[tuple[int, str]]) -> None:
         """Populate self from ASS text representation of this section,
         excluding the ASS header line.
@@ -17,6 +31,7 @@ class AssKeyValueMapping(ObservableMappingMixin[str, str], AssBaseSection):
         :param lines: list of tuples (line_num, line)
         """
         self.clear()
+        self._source_lines.clear()
 
         for line_num, line in lines:
             try:
@@ -27,6 +42,8 @@ class AssKeyValueMapping(ObservableMappingMixin[str, str], AssBaseSection):
                 ) from exc
             else:
                 self[key] = value.lstrip()
+                if self.preserve_original:
+                    self._source_lines[key] = (value.lstrip(), line)
 
     def produce_ass_body_lines(self) -> Iterable[str]:
         """Produce ASS text representation of self, excluding the ASS header
@@ -35,7 +52,11 @@ class AssKeyValueMapping(ObservableMappingMixin[str, str], AssBaseSection):
         :return: a generator of ASS section body lines
         """
         for key, value in self.items():
-            yield f"{key}: {value}"
+            source = self._source_lines.get(key)
+            if source and source[0] == value:
+                yield source[1]
+            else:
+                yield f"{key}: {value}"
 
     def __eq__(self, other: Any) -> bool:
         """Check for equality. Ignores event handlers.
@@ -0,0 +1,77 @@
+"""AssRawSection definition."""
+from collections.abc import Iterable
+
+from ass_parser.ass_sections.ass_attachment_section import AssAttachmentSection
+from ass_parser.ass_sections.ass_base_section import AssBaseSection
+from ass_parser.ass_sections.ass_key_value_mapping import AssKeyValueMapping
+from ass_parser.ass_sections.ass_string_table import AssStringTable
+from ass_parser.ass_sections.const import ATTACHMENT_SECTION_NAMES
+
+
+class AssRawSection(AssBaseSection):
+    """ASS section kept as unparsed source text.
+
+    Produces its source lines verbatim. Call .parse() to turn it into an
+    AssAttachmentSection, an AssStringTable or an AssKeyValueMapping.
+    """
+
+    def __init__(self, name: str, is_tabular: bool = False) -> None:
+        """Initialize self.
+
+        :param name: section name
+        :param is_tabular: whether the section is a table
+        """
+        super().__init__(name)
+        self.is_tabular = is_tabular
+        self.lines: list[tuple[int, str]] = []
+
+    def consume_ass_lines(self, lines: list[tuple[int, str]]) -> None:
+        """Remember ASS text representation of this section, including the
+        ASS header line.
+
+        The lines get validated only once the section is parsed.
+
+        :param lines: list of tuples (line_num, line)
+        """
+        super().consume_ass_lines(lines)
+        self.lines = lines
+
+    def consume_ass_body_lines(self, lines: list[tuple[int, str]]) -> None:
+        """Remember ASS text representation of this section, excluding the
+        ASS header line.
+
+        :param lines: list of tuples (line_num, line)
+        """
+        self.is_tabular = any(line.startswith("Format:") for _, line in lines)
+
+    def produce_ass_body_lines(self) -> Iterable[str]:
+        """Produce the source lines of this section, excluding the ASS header
+        line.
+
+        :return: a generator of ASS section body lines
+        """
+        for _line_num, line in self.lines[1:]:
+            yield line
+
+    def parse(self) -> AssBaseSection:
+        """Parse the source lines into a structured section.
+
+        The parsed section keeps writing the source lines until it gets
+        modified, and inherits the preserve_original setting of self.
+
+        :return: an AssAttachmentSection, an AssStringTable or an
+            AssKeyValueMapping
+        """
+        section: AssBaseSection
+        if self.name in ATTACHMENT_SECTION_NAMES:
+            section = AssAttachmentSection(name=self.name)
+        elif self.is_tabular:
+            section = AssStringTable(name=self.name)
+        else:
+            section = AssKeyValueMapping(name=self.name)
+        section.preserve_original = self.preserve_original
+        section.consume_ass_lines(self.lines)
+        section.name = self.name
+        # pylint: disable=protected-access
+        section._remember_raw_body_lines(list(self.produce_ass_body_lines()))
+        return section
@@ -0,0 +1,252 @@
+"""AssSectionList and SectionListSnapshot definitions."""
+import threading
+from collections.abc import Iterable, Iterator, MutableSequence, Sequence
+from copy import deepcopy
+from typing import Any, Union, overload
+
+from ass_parser.ass_sections.ass_base_section import AssBaseSection
+from ass_parser.ass_sections.ass_raw_section import AssRawSection
+
+
+class SectionListSnapshot(Sequence[AssBaseSection]):
+    """Read-only snapshot of an AssSectionList.
+
+    Raw sections are shared with the live list, since parsing them there
+    replaces them rather than changing them. Sections that preserve
+    themselves before every change are shared too, and get copied only once
+    they are about to change; the other sections are copied when the
+    snapshot is taken.
+
+    Sections retrieved from the snapshot are parsed, detached copies.
+    Reading from the snapshot is safe while another thread modifies the live
+    list.
+    """
+
+    def __init__(self, sections: Iterable[AssBaseSection]) -> None:
+        """Initialize self.
+
+        :param sections: sections of the live list
+        """
+        self._data: list[tuple[str, AssBaseSection]] = []
+        self._preserved: dict[int, AssBaseSection] = {}
+        self._lock = threading.Lock()
+        for section in sections:
+            # pylint: disable=protected-access
+            if section._preserves_before_change:
+                section._add_list_snapshot(self)
+            elif not isinstance(section, AssRawSection):
+                section = deepcopy(section)
+            self._data.append((section.name, section))
+
+    def _preserve(self, section: AssBaseSection) -> None:
+        """Remember the current state of a section that is about to change.
+
+        :param section: section of the live list
+        """
+        with self._lock:
+            if id(section) not in self._preserved:
+                self._preserved[id(section)] = deepcopy(section)
+
+    def _resolve(self, section: AssBaseSection) -> AssBaseSection:
+        return self._preserved.get(id(section), section)
+
+    def __len__(self) -> int:
+        """Return number of sections.
+
+        :return: number of sections
+        """
+        return len(self._data)
+
+    @overload
+    def __getitem__(self, index: int) -> AssBaseSection:
+        ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, index: slice) -> list[AssBaseSection]:
+        ...  # pragma: no cover
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[AssBaseSection, list[AssBaseSection]]:
+        """Return a copy of the section as it was when the snapshot was
+        taken, parsing it if needed.
+
+        :param index: section index or slice
+        :return: section copy or a list of section copies
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        section = self._copy(index)
+        if isinstance(section, AssRawSection):
+            section = section.parse()
+        return section
+
+    def _copy(self, index: int) -> AssBaseSection:
+        """Return a copy of the section at the given index, sharing the raw
+        sections.
+
+        :param index: section index
+        :return: section copy
+        """
+        name, section = self._data[index]
+        if isinstance(section, AssRawSection):
+            return section
+        with self._lock:
+            section = deepcopy(self._resolve(section))
+        section.name = name
+        return section
+
+    def __iter__(self) -> Iterator[AssBaseSection]:
+        """Iterate over copies of the sections, parsing them if needed.
+
+        :return: iterator over section copies
+        """
+        for i in range(len(self)):
+            yield self[i]
+
+    def iter_stored(self) -> Iterator[AssBaseSection]:
+        """Iterate over copies of the sections, leaving the raw sections
+        unparsed.
+
+        :return: iterator over section copies
+        """
+        for i in range(len(self)):
+            yield self._copy(i)
+
+
+class AssSectionList(MutableSequence[AssBaseSection]):
+    """List of sections that parses AssRawSection items on first access.
+
+    Every accessor goes through __getitem__(), so raw sections are never
+    exposed. iter_stored() gives the items as they are stored, without
+    parsing them.
+    """
+
+    def __init__(self, sections: Iterable[AssBaseSection] = ()) -> None:
+        """Initialize self.
+
+        :param sections: initial sections
+        """
+        self._data: list[AssBaseSection] = list(sections)
+
+    def __len__(self) -> int:
+        """Return number of sections.
+
+        :return: number of sections
+        """
+        return len(self._data)
+
+    @overload
+    def __getitem__(self, index: int) -> AssBaseSection:
+        ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, index: slice) -> list[AssBaseSection]:
+        ...  # pragma: no cover
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[AssBaseSection, list[AssBaseSection]]:
+        """Return the section at the given index, parsing it if needed.
+
+        :param index: section index or slice
+        :return: section or a list of sections
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        section = self._data[index]
+        if isinstance(section, AssRawSection):
+            section = section.parse()
+            self._data[index] = section
+        return section
+
+    @overload
+    def __setitem__(self, index: int, value: AssBaseSection) -> None:
+        ...  # pragma: no cover
+
+    @overload
+    def __setitem__(
+        self, index: slice, value: Iterable[AssBaseSection]
+    ) -> None:
+        ...  # pragma: no cover
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        """Replace the section or sections at the given index.
+
+        :param index: section index or slice
+        :param value: section or sections to put there
+        """
+        self._data[index] = value
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        """Remove the section or sections at the given index.
+
+        :param index: section index or slice
+        """
+        del self._data[index]
+
+    def insert(self, index: int, value: AssBaseSection) -> None:
+        """Insert a section before the given index.
+
+        :param index: index to insert at
+        :param value: section to insert
+        """
+        self._data.insert(index, value)
+
+    def clear(self) -> None:
+        """Remove all sections, without parsing them."""
+        self._data.clear()
+
+    def __iter__(self) -> Iterator[AssBaseSection]:
+        """Iterate over the sections, parsing them if needed.
+
+        :return: iterator over sections
+        """
+        for i in range(len(self)):
+            yield self[i]
+
+    def iter_stored(self) -> Iterator[AssBaseSection]:
+        """Iterate over the sections as they are stored, leaving the raw
+        sections unparsed.
+
+        :return: iterator over sections
+        """
+        return iter(self._data)
+
+    def snapshot(self) -> SectionListSnapshot:
+        """Take a read-only snapshot of self, without parsing the raw
+        sections.
+
+        :return: snapshot
+        """
+        return SectionListSnapshot(self._data)
+
+    def copy(self) -> "AssSectionList":
+        """Return a shallow copy of self.
+
+        Raw sections are shared and get parsed separately by each list.
+
+        :return: copy of self
+        """
+        return type(self)(self._data)
+
+    def __eq__(self, other: Any) -> bool:
+        """Check for equality with another list of sections, parsing the raw
+        sections of both.
+
+        :param other: other object
+        :return: whether objects are equal
+        """
+        if not isinstance(other, (AssSectionList, list)):
+            return False
+        return len(self) == len(other) and all(
+            section == other_section
+            for section, other_section in zip(self, other)
+        )
+
+    def __repr__(self) -> str:
+        """Return a representation of the stored sections.
+
+        :return: representation
+        """
+        return f"{type(self).__name__}({self._data!r})"
@@ -1,4 +1,6 @@
 """AssStringTable definition."""
+from typing import Any
+
 from ass_parser.ass_sections.ass_base_tabular_section import (
     AssBaseTabularSection,
 )
@@ -13,6 +15,9 @@ class AssStringTable(
 ):
     """Simple tabular string ASS section."""
 
+    # rows are plain dicts
+    _has_mutable_items = True
+
     def consume_ass_table_row(
         self, item_type: str, item: dict[str, str]
     ) -> None:
@@ -31,3 +36,13 @@ class AssStringTable(
         :return: a tuple of the part before the colon and a dictified ASS line
         """
         return own_item[0], own_item[1]
+
+    def __eq__(self, other: Any) -> bool:
+        """Check for equality. Ignores event handlers.
+
+        :param other: other object
+        :return: whether objects are equal
+        """
+        if not isinstance(other, AssStringTable):
+            return False
+        return self.name == other.name and self._data == other._data
@@ -1,37 +1,37 @@
 """AssStyleList definition."""
-from typing import Any, Optional
+from typing import Optional
 
 from ass_parser.ass_color import AssColor
-from ass_parser.ass_sections.ass_base_tabular_section import (
-    AssBaseTabularSection,
+from ass_parser.ass_sections.ass_base_item_list import AssBaseItemList
+from ass_parser.ass_sections.const import (
+    STYLES_FORMAT_LINE,
+    STYLES_SECTION_NAME,
 )
-from ass_parser.ass_sections.const import STYLES_SECTION_NAME
 from ass_parser.ass_style import AssStyle
-from ass_parser.observable_sequence_mixin import (
-    ObservableSequenceItemInsertionEvent,
-    ObservableSequenceItemRemovalEvent,
-    ObservableSequenceMixin,
-)
+from ass_parser.string_pool import StringPool
 from ass_parser.util import smart_float
 
 
-class AssStyleList(
-    ObservableSequenceMixin[AssStyle], AssBaseTabularSection[AssStyle]
-):
+class AssStyleList(AssBaseItemList[AssStyle]):
     """ASS styles container."""
 
+    _item_type = AssStyle
+    _format_line = STYLES_FORMAT_LINE
+
     def __init__(
         self,
         data: Optional[list[AssStyle]] = None,
         name: str = STYLES_SECTION_NAME,
+        string_pool: Optional[StringPool] = None,
     ) -> None:
-        """Initialize self."""
-        super().__init__(name=name)
-        self.items_about_to_be_inserted.subscribe(self._before_items_insertion)
-        self.items_inserted.subscribe(self._on_items_insertion)
-        self.items_removed.subscribe(self._on_items_removal)
-        if data:
-            self.extend(data)
+        """Initialize self.
+
+        :param data: styles to populate self with
+        :param name: section name
+        :param string_pool: interning table for the style strings; if not
+            given, the list uses its own
+        """
+        super().__init__(name=name, data=data, string_pool=string_pool)
 
     def get_by_name(self, name: str) -> Optional[AssStyle]:
         """Retrieve style by its name.
@@ -44,33 +44,6 @@ class AssStyleList(
                 return style
         return None
 
-    @staticmethod
-    def _before_items_insertion(
-        event: ObservableSequenceItemInsertionEvent[AssStyle],
-    ) -> None:
-        for item in event.items:
-            if item.parent is not None:
-                raise TypeError("AssStyle belongs to another AssStyleList")
-
-    def _on_items_insertion(
-        self, event: ObservableSequenceItemInsertionEvent[AssStyle]
-    ) -> None:
-        for item in event.items:
-            item._parent = self  # pylint: disable=protected-access
-        self._reindex()
-
-    def _on_items_removal(
-        self, event: ObservableSequenceItemRemovalEvent[AssStyle]
-    ) -> None:
-        for item in event.items:
-            item._parent = None  # pylint: disable=protected-access
-            item._index = None  # pylint: disable=protected-access
-        self._reindex()
-
-    def _reindex(self) -> None:
-        for i, item in enumerate(self._data):
-            item._index = i  # pylint: disable=protected-access
-
     def consume_ass_table_row(
         self, item_type: str, item: dict[str, str]
     ) -> None:
@@ -145,14 +118,38 @@ class AssStyleList(
             "Encoding": str(own_item.encoding),
         }
 
-    def __eq__(self, other: Any) -> bool:
-        """Check for equality. Ignores event handlers.
+    @staticmethod
+    def _format_ass_table_line(own_item: AssStyle) -> str:
+        """Format an ASS line based on an own item.
+
+        Equivalent to joining the values of produce_ass_table_row(), but
+        does not build the intermediate dict.
 
-        :param other: other object
-        :return: whether objects are equal
+        :param own_item: style to serialize
+        :return: ASS style line
         """
-        if not isinstance(other, AssStyleList):
-            return False
-        return self.name == other.name and tuple(self._data) == tuple(
-            other._data
+        return (
+            f"Style: {own_item.name.replace(',', ';')},"
+            f"{own_item.font_name.replace(',', ';')},"
+            f"{own_item.font_size},"
+            f"{own_item.primary_color.to_ass_string()},"
+            f"{own_item.secondary_color.to_ass_string()},"
+            f"{own_item.outline_color.to_ass_string()},"
+            f"{own_item.back_color.to_ass_string()},"
+            f"{'-1' if own_item.bold else '0'},"
+            f"{'-1' if own_item.italic else '0'},"
+            f"{'-1' if own_item.underline else '0'},"
+            f"{'-1' if own_item.strike_out else '0'},"
+            f"{smart_float(own_item.scale_x)},"
+            f"{smart_float(own_item.scale_y)},"
+            f"{smart_float(own_item.spacing)},"
+            f"{smart_float(own_item.angle)},"
+            f"{own_item.border_style},"
+            f"{smart_float(own_item.outline)},"
+            f"{smart_float(own_item.shadow)},"
+            f"{own_item.alignment},"
+            f"{own_item.margin_left},"
+            f"{own_item.margin_right},"
+            f"{own_item.margin_vertical},"
+            f"{own_item.encoding}"
         )
@@ -5,3 +5,19 @@ SECTION_HEADING_RE = re.compile(r"^\[(?P<section_name>[^\]]+)\]$")
 STYLES_SECTION_NAME = "V4+ Styles"
 EVENTS_SECTION_NAME = "Events"
 SCRIPT_INFO_SECTION_NAME = "Script Info"
+STYLES_FORMAT_LINE = (
+    "Format: Name,Fontname,Fontsize,PrimaryColour,SecondaryColour,"
+    "OutlineColour,BackColour,Bold,Italic,Underline,StrikeOut,ScaleX,ScaleY,"
+    "Spacing,Angle,BorderStyle,Outline,Shadow,Alignment,MarginL,MarginR,"
+    "MarginV,Encoding"
+)
+EVENTS_FORMAT_LINE = (
+    "Format: Layer,Start,End,Style,Name,MarginL,MarginR,MarginV,Effect,Text"
+)
+FONTS_SECTION_NAME = "Fonts"
+GRAPHICS_SECTION_NAME = "Graphics"
+ATTACHMENT_SECTION_NAMES = (FONTS_SECTION_NAME, GRAPHICS_SECTION_NAME)
+# uuencoded attachment data only uses the characters from "!" to "`"
+ATTACHMENT_DATA_RE = re.compile(r"^[!-`]+$")
+# lines introducing the attachments of the [Fonts] and [Graphics] sections
+ATTACHMENT_ENTRY_PREFIXES = ("fontname:", "filename:")
@@ -1,20 +1,17 @@
 """AssStyle definition."""
+import weakref
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Optional
 
 from ass_parser.ass_color import AssColor
-from ass_parser.observable_object_mixin import ObservableObjectMixin
-from ass_parser.observable_sequence_mixin import (
-    ObservableSequenceChangeEvent,
-    ObservableSequenceItemModificationEvent,
-)
+from ass_parser.ass_list_item_mixin import AssListItemMixin
 
 if TYPE_CHECKING:
     from ass_parser.ass_sections import AssStyleList  # pragma: no coverage
 
 
-@dataclass
-class AssStyle(ObservableObjectMixin):
+@dataclass(eq=False)
+class AssStyle(AssListItemMixin["AssStyleList"]):
     """ASS style."""
 
     name: str
@@ -49,8 +46,41 @@ class AssStyle(ObservableObjectMixin):
     margin_vertical: int = 20
     encoding: int = 1
 
-    _parent: Optional["AssStyleList"] = None
+    # weak, so that dropping a list does not wait for the cyclic garbage
+    # collector
+    _parent: Optional["weakref.ref[AssStyleList]"] = None
     _index: Optional[int] = None
+    _INTERNED_FIELDS = ("name", "font_name")
+    _name = ""
+    _font_name = ""
+
+    def get_name(self) -> str:
+        """Return style name.
+
+        :return: name
+        """
+        return self._name
+
+    def set_name(self, value: str) -> None:
+        """Set new style name.
+
+        :param value: new name
+        """
+        self._name = self._intern(value)
+
+    def get_font_name(self) -> str:
+        """Return style font name.
+
+        :return: font name
+        """
+        return self._font_name
+
+    def set_font_name(self, value: str) -> None:
+        """Set new style font name.
+
+        :param value: new font name
+        """
+        self._font_name = self._intern(value)
 
     def scale(self, factor: float) -> None:
         """Scale self by the given factor.
@@ -66,14 +96,6 @@ class AssStyle(ObservableObjectMixin):
         self.margin_vertical = int(self.margin_vertical * factor)
         self.end_update()
 
-    @property
-    def parent(self) -> Optional["AssStyleList"]:
-        """Return parent list.
-
-        :return: parent list
-        """
-        return self._parent
-
     @property
     def index(self) -> int:
         """Return style index within its parent list.
@@ -86,45 +108,8 @@ class AssStyle(ObservableObjectMixin):
             raise ValueError("AssStyle does not belong to any AssStyleList")
         return self._index
 
-    def _after_change(self) -> None:
-        """Emit item modified event in the parent list."""
-        super()._after_change()
-        if self.parent is not None:
-            self.parent.items_modified.emit(
-                ObservableSequenceItemModificationEvent(
-                    index=self.index, item=self
-                )
-            )
-            self.parent.changed.emit(ObservableSequenceChangeEvent())
 
-    def __copy__(self) -> "AssStyle":
-        """Duplicate self.
-
-        The copy is detached from the parent list.
-
-        :return: duplicate of self
-        """
-        ret = type(self)(name=self.name)
-        ret.__dict__.update(
-            {
-                key: value
-                for key, value in self.__dict__.items()
-                if not callable(value) and key != "_parent"
-            }
-        )
-        return ret
-
-    def __eq__(self, other: Any) -> bool:
-        """Check for equality. Ignores parent list and event handlers.
-
-        :param other: other object
-        :return: whether objects are equal
-        """
-        if not isinstance(other, AssStyle):
-            return False
-        return all(
-            key.startswith("_")
-            or key == "parent"
-            or getattr(self, key) == getattr(other, key)
-            for key in self.__dataclass_fields__  # type: ignore
-        )
+AssStyle.name = property(AssStyle.get_name, AssStyle.set_name)  # type: ignore
+AssStyle.font_name = property(  # type: ignore
+    AssStyle.get_font_name, AssStyle.set_font_name
+)
@@ -0,0 +1,100 @@
+"""Reading and writing many ASS files in parallel."""
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from ass_parser.ass_file import AssFile
+from ass_parser.reader import read_ass
+from ass_parser.writer import write_ass
+
+# number of files handed to the pool per worker before waiting for results
+PENDING_PER_WORKER = 4
+
+
+@dataclass
+class AssBatchResult:
+    """Outcome of reading or writing a single file of a batch.
+
+    ass_file is the parsed file for reads, and None for writes and failures.
+    error is the exception that made the file fail, or None.
+    """
+
+    path: Path
+    ass_file: Optional[AssFile] = None
+    error: Optional[BaseException] = None
+
+
+def _run_batch(
+    func: Callable[..., Any],
+    jobs: Iterable[tuple[Path, tuple[Any, ...]]],
+    workers: Optional[int],
+) -> Iterator[tuple[Path, "Future[Any]"]]:
+    """Run the jobs in a process pool, keeping only a few of them pending.
+
+    :param func: function to call in the worker processes
+    :param jobs: pairs of a path and the arguments to call func with
+    :param workers: number of worker processes; defaults to the CPU count
+    :return: a generator of paths and finished futures, in completion order
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * PENDING_PER_WORKER
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: dict["Future[Any]", Path] = {}
+        for path, args in jobs:
+            if len(pending) >= max_pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future
+            pending[executor.submit(func, *args)] = path
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future
+
+
+def read_ass_many(
+    paths: Iterable[Path], workers: Optional[int] = None
+) -> Iterator[AssBatchResult]:
+    """Read many ASS files in a pool of worker processes.
+
+    Results are produced as soon as each file is parsed, so their order can
+    differ from the order of paths. A file that fails to load is reported
+    through AssBatchResult.error and does not stop the rest of the batch.
+
+    :param paths: paths of the files to read
+    :param workers: number of worker processes; defaults to the CPU count
+    :return: a generator of results
+    """
+    jobs = ((path, (path,)) for path in paths)
+    for path, future in _run_batch(read_ass, jobs, workers):
+        error = future.exception()
+        if error is not None:
+            yield AssBatchResult(path=path, error=error)
+        else:
+            yield AssBatchResult(path=path, ass_file=future.result())
+
+
+def write_ass_many(
+    items: Iterable[tuple[AssFile, Path]], workers: Optional[int] = None
+) -> Iterator[AssBatchResult]:
+    """Write many ASS files in a pool of worker processes.
+
+    Results are produced as soon as each file is saved, so their order can
+    differ from the order of items. A file that fails to save is reported
+    through AssBatchResult.error and does not stop the rest of the batch.
+
+    :param items: pairs of a file to save and its target path
+    :param workers: number of worker processes; defaults to the CPU count
+    :return: a generator of results
+    """
+    jobs = ((path, (ass_file, path)) for ass_file, path in items)
+    for path, future in _run_batch(write_ass, jobs, workers):
+        yield AssBatchResult(path=path, error=future.exception())
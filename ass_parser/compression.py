@@ -0,0 +1,169 @@
+"""Transparent compression of ASS files."""
+import bz2
+import gzip
+import io
+import lzma
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Optional
+
+# path suffixes and the functions that open such files
+_OPENERS: dict[str, Callable[..., Any]] = {
+    ".gz": gzip.open,
+    ".xz": lzma.open,
+    ".bz2": bz2.open,
+}
+
+# names accepted by write_ass() and the functions that wrap binary streams
+# to compress or decompress them
+_CODECS: dict[str, Callable[..., Any]] = {
+    "gz": lambda stream, mode: gzip.GzipFile(fileobj=stream, mode=mode),
+    "xz": lzma.LZMAFile,
+    "bz2": bz2.BZ2File,
+}
+
+# leading bytes of the compressed formats
+_MAGIC_NUMBERS = {
+    b"\x1f\x8b": "gz",
+    b"\xfd7zXZ\x00": "xz",
+    b"BZh": "bz2",
+}
+_MAGIC_SIZE = max(map(len, _MAGIC_NUMBERS))
+
+
+class _PrefixedReader(io.RawIOBase):
+    """Binary stream that returns the given bytes, then the rest of another
+    stream. Lets the magic number detection put back what it has read.
+
+    Closing the reader leaves the other stream open.
+    """
+
+    def __init__(self, prefix: bytes, stream: IO[bytes]) -> None:
+        """Initialize self.
+
+        :param prefix: bytes to return first
+        :param stream: stream to read the rest from
+        """
+        super().__init__()
+        self._prefix = prefix
+        self._stream = stream
+
+    def readable(self) -> bool:
+        """Return whether the stream can be read from.
+
+        :return: always True
+        """
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Read bytes into a pre-allocated buffer.
+
+        :param buffer: buffer to fill
+        :return: number of bytes read
+        """
+        view = memoryview(buffer).cast("B")
+        if self._prefix:
+            size = min(len(view), len(self._prefix))
+            view[:size] = self._prefix[:size]
+            self._prefix = self._prefix[size:]
+            return size
+        data = self._stream.read(len(view))
+        view[: len(data)] = data
+        return len(data)
+
+
+def is_binary_stream(stream: Any) -> bool:
+    """Return whether the given stream deals with bytes rather than text.
+
+    :param stream: stream to check
+    :return: whether stream is binary
+    """
+    if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    if isinstance(stream, io.TextIOBase):
+        return False
+    return "b" in getattr(stream, "mode", "")
+
+
+def is_compressed_path(path: Path) -> bool:
+    """Return whether the given file gets compressed by open_path().
+
+    :param path: path to the file
+    :return: whether its name ends with .gz, .xz or .bz2
+    """
+    return path.suffix.lower() in _OPENERS
+
+
+def open_path(path: Path, mode: str) -> IO[str]:
+    """Open an ASS file in text mode, compressing or decompressing it on the
+    fly if its name ends with .gz, .xz or .bz2.
+
+    :param path: path to the file
+    :param mode: "r" or "w"
+    :return: text stream
+    """
+    opener = _OPENERS.get(path.suffix.lower())
+    if opener is None:
+        return path.open(mode, encoding="utf-8")
+    handle: IO[str] = opener(path, mode + "t", encoding="utf-8")
+    return handle
+
+
+@contextmanager
+def text_reader(stream: IO[bytes]) -> Iterator[IO[str]]:
+    """Wrap a binary stream into a text stream, decompressing it on the fly
+    if it starts with a gzip, xz or bzip2 magic number.
+
+    The binary stream is left open.
+
+    :param stream: readable binary stream
+    :return: context manager giving a text stream
+    """
+    prefix = b""
+    while len(prefix) < _MAGIC_SIZE:
+        chunk = stream.read(_MAGIC_SIZE - len(prefix))
+        if not chunk:
+            break
+        prefix += chunk
+    binary: IO[bytes] = io.BufferedReader(_PrefixedReader(prefix, stream))
+    for magic, compression in _MAGIC_NUMBERS.items():
+        if prefix.startswith(magic):
+            binary = _CODECS[compression](binary, "rb")
+            break
+    handle = io.TextIOWrapper(binary, encoding="utf-8")
+    try:
+        yield handle
+    finally:
+        handle.close()
+
+
+@contextmanager
+def text_writer(
+    stream: IO[bytes], compression: Optional[str] = None
+) -> Iterator[IO[str]]:
+    """Wrap a binary stream into a text stream, compressing the output on the
+    fly if requested.
+
+    The binary stream is flushed, but left open.
+
+    :param stream: writable binary stream
+    :param compression: "gz", "xz", "bz2" or None
+    :return: context manager giving a text stream
+    """
+    binary: IO[bytes] = stream
+    if compression is not None:
+        try:
+            codec = _CODECS[compression]
+        except KeyError as exc:
+            raise ValueError(f'unknown compression: "{compression}"') from exc
+        binary = codec(stream, "wb")
+    handle = io.TextIOWrapper(binary, encoding="utf-8")
+    try:
+        yield handle
+    finally:
+        handle.flush()
+        handle.detach()
+        if binary is not stream:
+            binary.close()
+        stream.flush()
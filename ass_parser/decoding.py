@@ -0,0 +1,161 @@
+"""Decoding ASS files from bytes."""
+import codecs
+import mmap
+from collections.abc import Generator
+from typing import Optional, Union
+
+# bytes-like objects accepted by read_ass()
+ByteSource = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+# number of bytes to decode at once
+BLOCK_SIZE = 2**20
+
+# byte order marks and the encodings they stand for, longest first so that
+# UTF-32 LE is not mistaken for UTF-16 LE
+_BOMS = [
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+]
+
+# encodings to try in turn for files without a BOM; latin-1 never fails
+_FALLBACK_ENCODINGS = ["utf-8", "cp1252", "latin-1"]
+
+
+def sniff_encodings(
+    data: ByteSource,
+    encoding: Optional[str] = None,
+    legacy_fallback: bool = True,
+) -> tuple[list[str], int]:
+    """Guess the encoding of an ASS file from its first bytes.
+
+    :param data: file contents
+    :param encoding: encoding forced by the user, if any
+    :param legacy_fallback: whether files without a BOM that are not valid
+        UTF-8 may be decoded with legacy encodings instead of failing
+    :return: encodings to try in turn and the length of the BOM to skip
+    """
+    head = bytes(data[:4])
+    for bom, bom_encoding in _BOMS:
+        if head.startswith(bom):
+            return [encoding or bom_encoding], len(bom)
+    if encoding:
+        return [encoding], 0
+    # ASS files start with an ASCII character, usually "["
+    if len(head) >= 2 and head[0] and not head[1]:
+        return ["utf-16-le"], 0
+    if len(head) >= 2 and not head[0] and head[1]:
+        return ["utf-16-be"], 0
+    if not legacy_fallback:
+        return _FALLBACK_ENCODINGS[:1], 0
+    return _FALLBACK_ENCODINGS, 0
+
+
+def pick_encoding(
+    data: ByteSource, encodings: list[str], start: int = 0
+) -> str:
+    """Choose the first encoding that decodes the whole file.
+
+    Each candidate but the last is validated by decoding the file in large
+    blocks without keeping the text, so that the file can then be parsed
+    once. Files without a BOM are usually valid UTF-8, which is tried first
+    and validated at memory speed.
+
+    :param data: file contents
+    :param encodings: encodings to try in turn, see sniff_encodings()
+    :param start: offset to start decoding at, past the BOM
+    :return: encoding to decode the file with
+    """
+    for candidate in encodings[:-1]:
+        decoder = codecs.getincrementaldecoder(candidate)()
+        try:
+            with memoryview(data) as view:
+                for pos in range(start, len(view), BLOCK_SIZE):
+                    decoder.decode(view[pos : pos + BLOCK_SIZE])
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            continue
+        return candidate
+    return encodings[-1]
+
+
+class LineSplitter:
+    """Split text that comes in chunks into lines.
+
+    Recognizes \\n, \\r\\n and \\r line endings, like text mode files do,
+    even if a chunk ends between the \\r and the \\n.
+    """
+
+    def __init__(self) -> None:
+        """Initialize self."""
+        self._tail = ""
+
+    def feed(self, text: str, final: bool = False) -> list[str]:
+        """Split the next chunk of text into lines.
+
+        :param text: next chunk
+        :param final: whether this is the last chunk
+        :return: the lines completed by the chunk, without line endings
+        """
+        text = self._tail + text
+        if "\r" in text:
+            # a \r\n pair can be split between the chunks
+            keep_cr = text.endswith("\r") and not final
+            if keep_cr:
+                text = text[:-1]
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+            if keep_cr:
+                text += "\r"
+        *lines, self._tail = text.split("\n")
+        if final:
+            if self._tail:
+                lines.append(self._tail)
+            self._tail = ""
+        return lines
+
+
+def iter_decoded_lines(
+    data: ByteSource, encoding: str, start: int = 0
+) -> Generator[str, None, None]:
+    """Decode bytes block by block and split them into lines.
+
+    Recognizes \\n, \\r\\n and \\r line endings, like text mode files do.
+
+    :param data: file contents
+    :param encoding: encoding to decode with
+    :param start: offset to start decoding at, past the BOM
+    :return: a generator of lines without line endings
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    splitter = LineSplitter()
+    # releasing the view lets the caller close a memory map afterwards
+    with memoryview(data) as view:
+        size = len(view)
+        for pos in range(start, size, BLOCK_SIZE):
+            is_last = pos + BLOCK_SIZE >= size
+            try:
+                text = decoder.decode(
+                    view[pos : pos + BLOCK_SIZE], final=is_last
+                )
+            except UnicodeDecodeError as exc:
+                # the decoder frame in the traceback would keep the block,
+                # and with it data, exported
+                raise exc.with_traceback(None)
+            yield from splitter.feed(text, final=is_last)
+
+
+def decode_bytes(raw: bytes, encodings: list[str]) -> str:
+    """Decode a piece of an ASS file with the first encoding that works.
+
+    :param raw: bytes to decode
+    :param encodings: encodings to try in turn, see sniff_encodings()
+    :return: decoded text
+    """
+    for encoding in encodings[:-1]:
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return raw.decode(encodings[-1])
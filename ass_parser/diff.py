@@ -0,0 +1,247 @@
+"""Structural diff of ASS files."""
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Generic, Optional, TypeVar
+
+from ass_parser.ass_event import AssEvent
+from ass_parser.ass_file import AssFile
+from ass_parser.ass_style import AssStyle
+from ass_parser.util import content_key, public_fields
+
+TItem = TypeVar("TItem")
+
+
+@dataclass
+class AssItemModification(Generic[TItem]):
+    """An event or a style whose fields changed between two revisions."""
+
+    old_index: int
+    new_index: int
+    old_item: TItem
+    new_item: TItem
+    changes: dict[str, tuple[Any, Any]]
+
+
+@dataclass
+class AssSequenceDiff(Generic[TItem]):
+    """Differences between two revisions of a list of events or styles.
+
+    Indices in deleted refer to the old list, indices in inserted refer to
+    the new list. Moved items are the unchanged items that ended up in
+    a different relative order, given as (old index, new index) pairs.
+    """
+
+    inserted: list[tuple[int, TItem]] = field(default_factory=list)
+    deleted: list[tuple[int, TItem]] = field(default_factory=list)
+    moved: list[tuple[int, int]] = field(default_factory=list)
+    modified: list[AssItemModification[TItem]] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        """Return whether both revisions are equal.
+
+        :return: whether there are no differences
+        """
+        return not (
+            self.inserted or self.deleted or self.moved or self.modified
+        )
+
+
+@dataclass
+class AssDiff:
+    """Differences between two revisions of an ASS file.
+
+    Script info changes map each changed key to a tuple of the old and the
+    new value, where None stands for a missing key.
+    """
+
+    script_info: dict[str, tuple[Optional[str], Optional[str]]]
+    styles: AssSequenceDiff[AssStyle]
+    events: AssSequenceDiff[AssEvent]
+
+    @property
+    def is_empty(self) -> bool:
+        """Return whether both revisions are equal, ignoring extra sections.
+
+        :return: whether there are no differences
+        """
+        return (
+            not self.script_info
+            and self.styles.is_empty
+            and self.events.is_empty
+        )
+
+
+def _field_changes(old: Any, new: Any) -> dict[str, tuple[Any, Any]]:
+    changes = {}
+    for name in public_fields(old):
+        old_value = getattr(old, name)
+        new_value = getattr(new, name)
+        if old_value != new_value:
+            changes[name] = (old_value, new_value)
+    return changes
+
+
+def _longest_increasing_run(values: list[int]) -> set[int]:
+    """Return positions of the longest strictly increasing subsequence.
+
+    :param values: list of distinct numbers
+    :return: positions within values
+    """
+    tails: list[int] = []
+    tail_positions: list[int] = []
+    predecessors: list[int] = []
+    for pos, value in enumerate(values):
+        slot = bisect_left(tails, value)
+        if slot == len(tails):
+            tails.append(value)
+            tail_positions.append(pos)
+        else:
+            tails[slot] = value
+            tail_positions[slot] = pos
+        predecessors.append(tail_positions[slot - 1] if slot else -1)
+    result: set[int] = set()
+    pos = tail_positions[-1] if tail_positions else -1
+    while pos != -1:
+        result.add(pos)
+        pos = predecessors[pos]
+    return result
+
+
+def diff_sequences(
+    old: Sequence[TItem],
+    new: Sequence[TItem],
+    identity: Optional[Callable[[TItem], Hashable]] = None,
+) -> AssSequenceDiff[TItem]:
+    """Compare two revisions of a list of events or styles.
+
+    Items with equal content are matched through their hashes. Matched items
+    that keep their relative order anchor the diff, the rest are reported as
+    moved. Unmatched items are then paired as modified - first by their
+    identity, if given, then by their position between the anchors. The
+    whole comparison takes O(n log n) time.
+
+    :param old: old revision
+    :param new: new revision
+    :param identity: optional function returning what makes two revisions of
+        the same item recognizable, such as a style name
+    :return: differences
+    """
+    result = AssSequenceDiff[TItem]()
+    old_match: list[Optional[int]] = [None] * len(old)
+    new_match: list[Optional[int]] = [None] * len(new)
+
+    positions: dict[tuple[Any, ...], deque[int]] = {}
+    for new_index, item in enumerate(new):
+        positions.setdefault(content_key(item), deque()).append(new_index)
+    for old_index, item in enumerate(old):
+        queue = positions.get(content_key(item))
+        if queue:
+            new_index = queue.popleft()
+            old_match[old_index] = new_index
+            new_match[new_index] = old_index
+
+    matched = [
+        (old_index, new_index)
+        for old_index, new_index in enumerate(old_match)
+        if new_index is not None
+    ]
+    in_order = _longest_increasing_run([pair[1] for pair in matched])
+    anchors: list[tuple[int, int]] = []
+    for pos, (old_index, new_index) in enumerate(matched):
+        if pos in in_order:
+            anchors.append((old_index, new_index))
+        else:
+            result.moved.append((old_index, new_index))
+
+    def pair(old_index: int, new_index: int) -> None:
+        old_match[old_index] = new_index
+        new_match[new_index] = old_index
+        result.modified.append(
+            AssItemModification(
+                old_index=old_index,
+                new_index=new_index,
+                old_item=old[old_index],
+                new_item=new[new_index],
+                changes=_field_changes(old[old_index], new[new_index]),
+            )
+        )
+
+    if identity is not None:
+        unmatched_ids: dict[Hashable, deque[int]] = {}
+        for new_index, item in enumerate(new):
+            if new_match[new_index] is None:
+                unmatched_ids.setdefault(identity(item), deque()).append(
+                    new_index
+                )
+        for old_index, item in enumerate(old):
+            if old_match[old_index] is None:
+                queue = unmatched_ids.get(identity(item))
+                if queue:
+                    pair(old_index, queue.popleft())
+
+    prev_old, prev_new = -1, -1
+    for old_stop, new_stop in anchors + [(len(old), len(new))]:
+        old_gap = [
+            old_index
+            for old_index in range(prev_old + 1, old_stop)
+            if old_match[old_index] is None
+        ]
+        new_gap = [
+            new_index
+            for new_index in range(prev_new + 1, new_stop)
+            if new_match[new_index] is None
+        ]
+        for old_index, new_index in zip(old_gap, new_gap):
+            pair(old_index, new_index)
+        prev_old, prev_new = old_stop, new_stop
+
+    result.deleted = [
+        (old_index, old[old_index])
+        for old_index, new_index in enumerate(old_match)
+        if new_index is None
+    ]
+    result.inserted = [
+        (new_index, new[new_index])
+        for new_index, old_index in enumerate(new_match)
+        if old_index is None
+    ]
+    result.modified.sort(key=lambda modification: modification.new_index)
+    return result
+
+
+def diff_script_info(
+    old: Mapping[str, str], new: Mapping[str, str]
+) -> dict[str, tuple[Optional[str], Optional[str]]]:
+    """Compare two revisions of a key-value section.
+
+    :param old: old revision
+    :param new: new revision
+    :return: changed keys mapped to tuples of the old and the new value
+    """
+    return {
+        key: (old.get(key), new.get(key))
+        for key in {**old, **new}
+        if old.get(key) != new.get(key)
+    }
+
+
+def diff_ass(old: AssFile, new: AssFile) -> AssDiff:
+    """Compare two revisions of an ASS file.
+
+    Events are matched by their content, styles by their content and then
+    by their names. Extra sections are not compared.
+
+    :param old: old revision
+    :param new: new revision
+    :return: differences
+    """
+    return AssDiff(
+        script_info=diff_script_info(old.script_info, new.script_info),
+        styles=diff_sequences(
+            old.styles, new.styles, identity=lambda style: style.name
+        ),
+        events=diff_sequences(old.events, new.events),
+    )
@@ -1,4 +1,5 @@
 """Common error definitions."""
+from typing import Any
 
 
 class CorruptAssError(ValueError):
@@ -11,6 +12,17 @@ class CorruptAssError(ValueError):
         """
         prefix = "corrupt ASS file"
         super().__init__(f"{prefix}: {message}" if message else prefix)
+        self._init_args: tuple[Any, ...] = (message,)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Return pickle compatible object representation.
+
+        Errors raised in worker processes need to be recreated from the
+        arguments they were created with rather than from their message.
+
+        :return: object representation
+        """
+        return type(self), self._init_args
 
 
 class CorruptAssLineError(CorruptAssError):
@@ -25,3 +37,7 @@ class CorruptAssLineError(CorruptAssError):
         """
         prefix = f'error while parsing line #{line_num} ("{line}")'
         super().__init__(f"{prefix}: {message}" if message else prefix)
+        self.line_num = line_num
+        self.line = line
+        self.message = message
+        self._init_args = (line_num, line, message)
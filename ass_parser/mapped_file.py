@@ -0,0 +1,298 @@
+"""Random access to the events of large ASS files."""
+import bisect
+import mmap
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any, Optional, Union, overload
+
+from ass_parser.ass_event import AssEvent
+from ass_parser.ass_index import AssIndex, MappedData, index_path_for
+from ass_parser.ass_sections import AssEventList, AssScriptInfo, AssStyleList
+from ass_parser.ass_sections.ass_base_tabular_section import (
+    split_ass_table_line,
+)
+from ass_parser.ass_sections.const import (
+    SCRIPT_INFO_SECTION_NAME,
+    STYLES_SECTION_NAME,
+)
+from ass_parser.decoding import BLOCK_SIZE, decode_bytes, sniff_encodings
+from ass_parser.errors import CorruptAssLineError
+
+# number of decoded events kept by AssMappedEventList
+EVENT_CACHE_SIZE = 1024
+
+
+def _line_num(data: MappedData, offset: int) -> int:
+    """Count the lines preceding the given offset, without copying the whole
+    file at once.
+
+    :param data: file contents
+    :param offset: byte offset
+    :return: 1-based number of the line at offset
+    """
+    return 1 + sum(
+        bytes(data[pos : min(pos + BLOCK_SIZE, offset)]).count(b"\n")
+        for pos in range(0, offset, BLOCK_SIZE)
+    )
+
+
+class AssMappedEventList(Sequence[AssEvent]):
+    """Read-only sequence of the events of a memory-mapped ASS file.
+
+    Events are decoded on demand and the most recently used ones are kept
+    in a bounded cache. Decoded events do not belong to any AssEventList,
+    and modifying them does not change the file.
+    """
+
+    def __init__(
+        self,
+        data: MappedData,
+        ass_index: AssIndex,
+        cache_size: int = EVENT_CACHE_SIZE,
+    ) -> None:
+        """Initialize self.
+
+        :param data: file contents
+        :param ass_index: byte offsets of the event lines
+        :param cache_size: maximum number of decoded events to keep
+        """
+        self.ass_index = ass_index
+        self.offsets = ass_index.offsets
+        self.cache_size = cache_size
+        self._data = data
+        self._format_starts = [
+            start for start, _field_names in ass_index.formats
+        ]
+        self._cache: OrderedDict[int, AssEvent] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of events.
+
+        :return: number of events
+        """
+        return len(self.offsets)
+
+    @overload
+    def __getitem__(self, index: int) -> AssEvent:
+        ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, index: slice) -> list[AssEvent]:
+        ...  # pragma: no cover
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[AssEvent, list[AssEvent]]:
+        """Decode the event or events at the given index.
+
+        :param index: event index or slice
+        :return: event or list of events
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("event index out of range")
+        cache = self._cache
+        event = cache.get(index)
+        if event is not None:
+            cache.move_to_end(index)
+            return event
+        event = self._decode_event(index)
+        cache[index] = event
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return event
+
+    def read_line(self, index: int) -> str:
+        """Return the source text of the event at the given index.
+
+        :param index: event index
+        :return: ASS line
+        """
+        start = self.offsets[index]
+        end = self._data.find(b"\n", start)
+        if end == -1:
+            end = len(self._data)
+        return decode_bytes(
+            bytes(self._data[start:end]), self.ass_index.encodings
+        ).strip()
+
+    def _decode_event(self, index: int) -> AssEvent:
+        line = self.read_line(index)
+        pos = bisect.bisect_right(self._format_starts, index) - 1
+        field_names = self.ass_index.formats[pos][1]
+        try:
+            item_type, item = split_ass_table_line(line, field_names)
+            return AssEventList.parse_ass_table_row(item_type, item)
+        except (ValueError, IndexError) as exc:
+            raise CorruptAssLineError(
+                _line_num(self._data, self.offsets[index]), line, str(exc)
+            ) from exc
+
+    def iter_time_range(self, start: int, end: int) -> Iterator[AssEvent]:
+        """Produce the events that intersect the given time window, that is
+        the events that end after its start and start before its end.
+
+        Events are decoded without going through the cache. With a sidecar
+        index, blocks of events outside the window are skipped entirely.
+
+        :param start: window start in milliseconds
+        :param end: window end in milliseconds
+        :return: a generator of events, in file order
+        """
+        block_times = self.ass_index.block_times
+        block_size = self.ass_index.block_size
+        for block, first in enumerate(range(0, len(self), block_size)):
+            if block_times is not None and (
+                block_times[2 * block] >= end
+                or block_times[2 * block + 1] <= start
+            ):
+                continue
+            for index in range(first, min(first + block_size, len(self))):
+                event = self._cache.get(index) or self._decode_event(index)
+                if event.start < end and event.end > start:
+                    yield event
+
+    def clear_cache(self) -> None:
+        """Forget the decoded events."""
+        self._cache.clear()
+
+
+class AssMappedFile:
+    """Read-only view of a memory-mapped ASS file.
+
+    Opening the file only scans it for the byte offsets of the section
+    headings and the event lines, which lets huge files be browsed without
+    parsing them. Script info and styles are parsed right away, while events
+    are decoded on demand through the events attribute.
+
+    Unlike read_ass(), which keeps only the last one, the events of all the
+    [Events] sections of concatenated files are available.
+
+    The file must use an ASCII-compatible encoding, such as UTF-8 or cp1252;
+    lines that are not valid UTF-8 are decoded as cp1252 unless an encoding
+    is given. Only Dialogue and Comment lines count as events.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        encoding: Optional[str] = None,
+        cache_size: int = EVENT_CACHE_SIZE,
+        use_index: bool = False,
+    ) -> None:
+        """Initialize self.
+
+        :param path: path to the file
+        :param encoding: encoding to use instead of guessing it
+        :param cache_size: maximum number of decoded events to keep
+        :param use_index: whether to take the byte offsets from a sidecar
+            index file next to the file, see index_path_for(); a missing or
+            out of date index gets rebuilt and saved, including the event
+            times of AssIndex.block_times
+        """
+        self.path = path
+        with path.open("rb") as handle:
+            if not path.stat().st_size:
+                self._data: MappedData = b""
+            else:
+                self._data = mmap.mmap(
+                    handle.fileno(), 0, access=mmap.ACCESS_READ
+                )
+        self.script_info = AssScriptInfo()
+        self.styles = AssStyleList()
+        try:
+            encodings = sniff_encodings(self._data, encoding)[0]
+            if any("\n[".encode(enc) != b"\n[" for enc in encodings):
+                raise ValueError(
+                    f'"{encodings[0]}" is not an ASCII-compatible encoding'
+                )
+            self.index = self._load_index(encodings, use_index)
+            self.sections = self.index.sections
+            self._parse_header_sections()
+        except BaseException:
+            self.close()
+            raise
+        self.events = AssMappedEventList(self._data, self.index, cache_size)
+
+    def _load_index(self, encodings: list[str], use_index: bool) -> AssIndex:
+        """Read the sidecar index or scan the file.
+
+        :param encodings: encodings to try in turn for each line
+        :param use_index: see __init__()
+        :return: index
+        """
+        if not use_index:
+            return AssIndex.scan(self._data, encodings)
+        index_path = index_path_for(self.path)
+        index = AssIndex.load(index_path, self.path, self._data, encodings)
+        if index is None:
+            index = AssIndex.scan(self._data, encodings, with_times=True)
+            try:
+                index.save(index_path, self.path, self._data)
+            except OSError:
+                # read-only locations only lose the faster reopening
+                pass
+        return index
+
+    def _parse_header_sections(self) -> None:
+        """Parse the script info and styles sections."""
+        for name, start, end in self.sections:
+            section: Union[AssScriptInfo, AssStyleList]
+            if name == SCRIPT_INFO_SECTION_NAME:
+                section = AssScriptInfo()
+            elif name == STYLES_SECTION_NAME:
+                section = AssStyleList()
+            else:
+                continue
+            text = decode_bytes(
+                bytes(self._data[start:end]), self.index.encodings
+            )
+            lines = [line.strip() for line in text.splitlines()]
+            try:
+                section.consume_ass_lines(
+                    [
+                        (line_num, line)
+                        for line_num, line in enumerate(lines, start=1)
+                        if line and not line.startswith(";")
+                    ]
+                )
+            except CorruptAssLineError as exc:
+                # counting the lines of a huge file is left for errors
+                line_num = _line_num(self._data, start) + exc.line_num - 1
+                raise CorruptAssLineError(
+                    line_num, lines[exc.line_num - 1], exc.message
+                ) from exc
+            if isinstance(section, AssScriptInfo):
+                self.script_info.update(section)
+            else:
+                styles = list(section)
+                section.clear()
+                self.styles.extend(styles)
+
+    def close(self) -> None:
+        """Release the memory map.
+
+        Events decoded so far remain usable.
+        """
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        if hasattr(self, "events"):
+            self.events.clear_cache()
+
+    def __enter__(self) -> "AssMappedFile":
+        """Enter the runtime context.
+
+        :return: self
+        """
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit the runtime context, releasing the memory map.
+
+        :param args: exception details
+        """
+        self.close()
@@ -0,0 +1,330 @@
+"""Three-way merge of ASS files."""
+from collections import Counter
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from copy import copy, deepcopy
+from dataclasses import dataclass, field
+from typing import Any, Optional, TypeVar, Union
+
+from ass_parser.ass_file import AssFile
+from ass_parser.ass_sections import AssBaseSection
+from ass_parser.diff import diff_sequences
+from ass_parser.util import content_key, public_fields
+
+TItem = TypeVar("TItem")
+
+_DELETED = -1
+_START = -1
+
+
+@dataclass
+class AssMergeConflict:
+    """A change made differently in both revisions.
+
+    The merged file keeps our side of the conflict.
+
+    For events and styles, key is the index in the merged list (or the base
+    index, if the item is not in the merged list) and field is the
+    conflicting field name, or None if one side deleted the item while the
+    other modified it. For script info, key is the script info key. For
+    extra sections, section and key are both the section name and the values
+    are the section texts. None stands for a deleted item, key or section.
+    """
+
+    section: str
+    key: Union[int, str]
+    field: Optional[str]
+    base: Any
+    ours: Any
+    theirs: Any
+
+
+@dataclass
+class AssMergeResult:
+    """Result of a three-way merge."""
+
+    ass_file: AssFile
+    conflicts: list[AssMergeConflict] = field(default_factory=list)
+
+
+def _map_to_base(
+    base: Sequence[TItem],
+    other: Sequence[TItem],
+    identity: Optional[Callable[[TItem], Hashable]],
+) -> tuple[list[int], list[Optional[int]]]:
+    """Match items of a revision with the base items.
+
+    :param base: base revision
+    :param other: derived revision
+    :param identity: see diff_sequences()
+    :return: other index (or _DELETED) for every base item and base index
+        (or None) for every other item
+    """
+    diff = diff_sequences(base, other, identity=identity)
+    base_to_other = [_DELETED] * len(base)
+    other_to_base: list[Optional[int]] = [None] * len(other)
+    pairs = diff.moved + [
+        (modification.old_index, modification.new_index)
+        for modification in diff.modified
+    ]
+    for base_index, other_index in pairs:
+        base_to_other[base_index] = other_index
+        other_to_base[other_index] = base_index
+    deleted = {base_index for base_index, _item in diff.deleted}
+    inserted = {other_index for other_index, _item in diff.inserted}
+    other_index = 0
+    for base_index in range(len(base)):
+        if base_index in deleted or base_to_other[base_index] != _DELETED:
+            continue
+        # unchanged items that kept their order fill the remaining slots
+        while (
+            other_to_base[other_index] is not None or other_index in inserted
+        ):
+            other_index += 1
+        base_to_other[base_index] = other_index
+        other_to_base[other_index] = base_index
+    return base_to_other, other_to_base
+
+
+def _merge_item(
+    section: str,
+    base: TItem,
+    ours: TItem,
+    theirs: TItem,
+    conflicts: list[AssMergeConflict],
+    index: int,
+) -> TItem:
+    base_key = content_key(base)
+    if content_key(theirs) == base_key:
+        return copy(ours)
+    if content_key(ours) == base_key:
+        return copy(theirs)
+    result = copy(ours)
+    for name in public_fields(base):
+        base_value = getattr(base, name)
+        our_value = getattr(ours, name)
+        their_value = getattr(theirs, name)
+        if our_value == base_value:
+            setattr(result, name, their_value)
+        elif their_value not in (base_value, our_value):
+            conflicts.append(
+                AssMergeConflict(
+                    section=section,
+                    key=index,
+                    field=name,
+                    base=base_value,
+                    ours=our_value,
+                    theirs=their_value,
+                )
+            )
+    return result
+
+
+def merge_sequences(
+    section: str,
+    base: Sequence[TItem],
+    ours: Sequence[TItem],
+    theirs: Sequence[TItem],
+    conflicts: list[AssMergeConflict],
+    identity: Optional[Callable[[TItem], Hashable]] = None,
+) -> list[TItem]:
+    """Merge two revisions of a list of events or styles.
+
+    Changes are merged per field. The merged list follows our order, with
+    their insertions placed after the item that precedes them in their
+    revision. Items inserted identically on both sides appear once.
+
+    :param section: section name to report in conflicts
+    :param base: common ancestor
+    :param ours: our revision
+    :param theirs: their revision
+    :param conflicts: list to append the conflicts to
+    :param identity: see diff_sequences()
+    :return: detached copies of the merged items
+    """
+    base_to_ours, ours_to_base = _map_to_base(base, ours, identity)
+    base_to_theirs, theirs_to_base = _map_to_base(base, theirs, identity)
+
+    our_insertions = Counter(
+        content_key(item)
+        for item, base_index in zip(ours, ours_to_base)
+        if base_index is None
+    )
+    their_insertions: dict[int, list[TItem]] = {}
+    anchor = _START
+    for item, base_index in zip(theirs, theirs_to_base):
+        if base_index is not None:
+            if base_to_ours[base_index] != _DELETED:
+                anchor = base_index
+            continue
+        key = content_key(item)
+        if our_insertions[key]:
+            our_insertions[key] -= 1
+        else:
+            their_insertions.setdefault(anchor, []).append(item)
+
+    result: list[TItem] = [
+        copy(item) for item in their_insertions.get(_START, [])
+    ]
+    for our_item, base_index in zip(ours, ours_to_base):
+        if base_index is None:
+            result.append(copy(our_item))
+            continue
+        base_item = base[base_index]
+        their_index = base_to_theirs[base_index]
+        if their_index == _DELETED:
+            if content_key(our_item) != content_key(base_item):
+                conflicts.append(
+                    AssMergeConflict(
+                        section=section,
+                        key=len(result),
+                        field=None,
+                        base=base_item,
+                        ours=our_item,
+                        theirs=None,
+                    )
+                )
+                result.append(copy(our_item))
+        else:
+            result.append(
+                _merge_item(
+                    section,
+                    base_item,
+                    our_item,
+                    theirs[their_index],
+                    conflicts,
+                    len(result),
+                )
+            )
+        result.extend(
+            copy(item) for item in their_insertions.get(base_index, [])
+        )
+
+    for base_index, our_index in enumerate(base_to_ours):
+        their_index = base_to_theirs[base_index]
+        if our_index == _DELETED and their_index != _DELETED:
+            their_item = theirs[their_index]
+            if content_key(their_item) != content_key(base[base_index]):
+                conflicts.append(
+                    AssMergeConflict(
+                        section=section,
+                        key=base_index,
+                        field=None,
+                        base=base[base_index],
+                        ours=None,
+                        theirs=their_item,
+                    )
+                )
+    return result
+
+
+def _merge_mappings(
+    section: str,
+    base: Mapping[str, Any],
+    ours: Mapping[str, Any],
+    theirs: Mapping[str, Any],
+    conflicts: list[AssMergeConflict],
+) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    for key in {**base, **ours, **theirs}:
+        base_value = base.get(key)
+        our_value = ours.get(key)
+        their_value = theirs.get(key)
+        if our_value == base_value:
+            value = their_value
+        else:
+            value = our_value
+            if their_value not in (base_value, our_value):
+                conflicts.append(
+                    AssMergeConflict(
+                        section=section,
+                        key=key,
+                        field=None,
+                        base=base_value,
+                        ours=our_value,
+                        theirs=their_value,
+                    )
+                )
+        if value is not None:
+            result[key] = value
+    return result
+
+
+def _section_text(section: Optional[AssBaseSection]) -> Optional[str]:
+    return None if section is None else section.to_ass_string()
+
+
+def _sections_by_name(ass_file: AssFile) -> dict[str, AssBaseSection]:
+    return {section.name: section for section in ass_file.extra_sections}
+
+
+def merge_ass(base: AssFile, ours: AssFile, theirs: AssFile) -> AssMergeResult:
+    """Merge two revisions of an ASS file derived from a common ancestor.
+
+    Events are matched by their content and styles by their content and
+    then by their names, after which non-overlapping changes are combined
+    field by field. Script info is merged per key and extra sections as
+    a whole. Wherever both sides changed the same thing differently, the
+    merged file keeps our version and a conflict is reported.
+
+    :param base: common ancestor
+    :param ours: our revision
+    :param theirs: their revision
+    :return: merged file and the list of conflicts
+    """
+    result = AssMergeResult(ass_file=AssFile())
+    ass_file = result.ass_file
+    conflicts = result.conflicts
+
+    ass_file.script_info.update(
+        _merge_mappings(
+            ass_file.script_info.name,
+            base.script_info,
+            ours.script_info,
+            theirs.script_info,
+            conflicts,
+        )
+    )
+    ass_file.styles.extend(
+        merge_sequences(
+            ass_file.styles.name,
+            base.styles,
+            ours.styles,
+            theirs.styles,
+            conflicts,
+            identity=lambda style: style.name,
+        )
+    )
+    ass_file.events.extend(
+        merge_sequences(
+            ass_file.events.name,
+            base.events,
+            ours.events,
+            theirs.events,
+            conflicts,
+        )
+    )
+
+    base_sections = _sections_by_name(base)
+    our_sections = _sections_by_name(ours)
+    their_sections = _sections_by_name(theirs)
+    for name in {**base_sections, **our_sections, **their_sections}:
+        base_text = _section_text(base_sections.get(name))
+        our_text = _section_text(our_sections.get(name))
+        their_text = _section_text(their_sections.get(name))
+        section = our_sections.get(name)
+        if our_text == base_text:
+            section = their_sections.get(name)
+        elif their_text not in (base_text, our_text):
+            conflicts.append(
+                AssMergeConflict(
+                    section=name,
+                    key=name,
+                    field=None,
+                    base=base_text,
+                    ours=our_text,
+                    theirs=their_text,
+                )
+            )
+        if section is not None:
+            ass_file.extra_sections.append(deepcopy(section))
+    return result
@@ -1,4 +1,6 @@
 """Observable containers and objects."""
+import inspect
+import weakref
 from dataclasses import dataclass, field
 from typing import Any, Callable, Generic, Optional, Type, TypeVar, cast
 
@@ -15,10 +17,103 @@ class Event:
 Callback = Callable[[TEvent], None]
 
 
+class _WeakCallback(Generic[TEvent]):
+    """A callback that is called only while its target is alive."""
+
+    __slots__ = ["ref"]
+
+    def __init__(
+        self,
+        callback: Callback[TEvent],
+        observable: "BoundObservable[TEvent]",
+    ) -> None:
+        """Initialize self.
+
+        :param callback: bound method or function to reference weakly
+        :param observable: observable to prune once the target dies
+        """
+        observable_ref = weakref.ref(observable)
+
+        def prune(_ref: Any) -> None:
+            # must not reference self, or the entry would be a cycle
+            observable = observable_ref()
+            if observable is not None:
+                observable._prune()
+
+        self.ref: Callable[[], Optional[Callback[TEvent]]]
+        if inspect.ismethod(callback):
+            self.ref = weakref.WeakMethod(callback, prune)
+        else:
+            self.ref = weakref.ref(callback, prune)
+
+    def __call__(self, event: TEvent) -> None:
+        """Call the target, if it is still alive.
+
+        :param event: event to pass to the target
+        """
+        callback = self.ref()
+        if callback is not None:
+            callback(event)
+
+
+class Subscription:
+    """Handle of a callback subscribed to a BoundObservable.
+
+    The handle does not keep the observable alive. Leaving it as a context
+    manager unsubscribes the callback.
+    """
+
+    __slots__ = ["_observable", "_entry"]
+
+    def __init__(
+        self, observable: "BoundObservable[Any]", entry: Callback[Any]
+    ) -> None:
+        """Initialize self.
+
+        :param observable: observable the callback is subscribed to
+        :param entry: entry of the callback in observable.callbacks
+        """
+        self._observable = weakref.ref(observable)
+        self._entry = entry
+
+    @property
+    def is_active(self) -> bool:
+        """Return whether the callback is still subscribed.
+
+        Weakly subscribed callbacks are unsubscribed once their target dies.
+
+        :return: whether emitting events calls the callback
+        """
+        observable = self._observable()
+        return observable is not None and any(
+            entry is self._entry for entry in observable.callbacks
+        )
+
+    def unsubscribe(self) -> None:
+        """Stop calling the callback. Does nothing if it is not subscribed."""
+        observable = self._observable()
+        if observable is not None:
+            observable._remove(self._entry)
+
+    def __enter__(self) -> "Subscription":
+        """Enter the runtime context.
+
+        :return: self
+        """
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit the runtime context, unsubscribing the callback.
+
+        :param args: exception details
+        """
+        self.unsubscribe()
+
+
 class BoundObservable(Generic[TEvent]):
     """An observable that can be used to subscribe to events."""
 
-    __slots__ = ["parent", "callbacks"]
+    __slots__ = ["parent", "callbacks", "__weakref__"]
 
     def __init__(self, parent: "Observable[TEvent]") -> None:
         """Initialize self.
@@ -26,15 +121,46 @@ class BoundObservable(Generic[TEvent]):
         :parent: parent Observable
         """
         self.parent = parent
+        # replaced rather than modified, so that callbacks can subscribe and
+        # unsubscribe while an event is being emitted
         self.callbacks: list[Callback[TEvent]] = []
 
-    def subscribe(self, callback: Callback[TEvent]) -> None:
+    def subscribe(
+        self, callback: Callback[TEvent], weak: bool = False
+    ) -> Subscription:
         """Subscribe to events.
 
         :param callback: user function to call.
             That function must take a single argument, the event.
+        :param weak: whether to reference the callback weakly, so that it
+            does not keep its object alive and gets unsubscribed once that
+            object is gone; bound methods reference their object, other
+            callables reference themselves, so lambdas and partials die
+            right away and must not be subscribed weakly
+        :return: handle to unsubscribe the callback with
+        """
+        entry: Callback[TEvent] = (
+            _WeakCallback(callback, self) if weak else callback
+        )
+        self.callbacks = self.callbacks + [entry]
+        return Subscription(self, entry)
+
+    def unsubscribe(self, callback: Callback[TEvent]) -> None:
+        """Unsubscribe the first subscription of a callback.
+
+        Bound methods are equal if they bind the same method to the same
+        object, so they do not need to be the very objects that were
+        subscribed.
+
+        :param callback: user function passed to subscribe()
+        :raises ValueError: if the callback is not subscribed
         """
-        self.callbacks.append(callback)
+        for entry in self.callbacks:
+            target = entry.ref() if isinstance(entry, _WeakCallback) else entry
+            if target == callback:
+                self._remove(entry)
+                return
+        raise ValueError("callback is not subscribed")
 
     def emit(self, event: TEvent) -> None:
         """Emit an event to the subscribed functions.
@@ -45,6 +171,24 @@ class BoundObservable(Generic[TEvent]):
         for callback in self.callbacks:
             callback(event)
 
+    def _remove(self, entry: Callback[TEvent]) -> None:
+        """Remove an entry of self.callbacks.
+
+        :param entry: entry to remove
+        """
+        self.callbacks = [
+            callback for callback in self.callbacks if callback is not entry
+        ]
+
+    def _prune(self) -> None:
+        """Remove the weakly referenced callbacks whose target died."""
+        self.callbacks = [
+            callback
+            for callback in self.callbacks
+            if not isinstance(callback, _WeakCallback)
+            or callback.ref() is not None
+        ]
+
     def __getstate__(self) -> Any:
         """Return pickle compatible object representation.
 
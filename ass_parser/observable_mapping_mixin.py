@@ -25,6 +25,15 @@ class ObservableMappingMixin(MutableMapping[TKey, TValue]):
         """Initialize self."""
         super().__init__(*args, **kwargs)  # type: ignore
         self._data: dict[TKey, TValue] = {}
+        self._version = 0
+
+    def _before_change(self) -> None:
+        """Called before the contents change."""
+
+    def _after_change(self) -> None:
+        """Count the change and emit the change event."""
+        self._version += 1
+        self.changed.emit(ObservableMappingChangeEvent())
 
     def __getitem__(self, key: TKey) -> TValue:
         """Get value under given key.
@@ -42,8 +51,9 @@ class ObservableMappingMixin(MutableMapping[TKey, TValue]):
         :param value: the new value
         """
         if self._data.get(key) != value:
+            self._before_change()
             self._data[key] = value
-            self.changed.emit(ObservableMappingChangeEvent())
+            self._after_change()
 
     def __delitem__(self, key: TKey) -> None:
         """Remove the specified key.
@@ -51,8 +61,9 @@ class ObservableMappingMixin(MutableMapping[TKey, TValue]):
         :param key: key to remove
         """
         if key in self._data:
+            self._before_change()
             del self._data[key]
-            self.changed.emit(ObservableMappingChangeEvent())
+            self._after_change()
 
     def __len__(self) -> int:
         """Return length of the contents.
@@ -70,8 +81,9 @@ class ObservableMappingMixin(MutableMapping[TKey, TValue]):
 
     def clear(self) -> None:
         """Clear conents."""
+        self._before_change()
         self._data.clear()
-        self.changed.emit(ObservableMappingChangeEvent())
+        self._after_change()
 
     @overload
     def update(
@@ -97,6 +109,7 @@ class ObservableMappingMixin(MutableMapping[TKey, TValue]):
 
         :param new_content: content to update with
         """
+        self._before_change()
         if isinstance(other, Mapping):
             for key in other:
                 self._data[key] = other[key]
@@ -105,4 +118,4 @@ class ObservableMappingMixin(MutableMapping[TKey, TValue]):
                 self._data[key] = value
         for key, value in kwargs.items():
             self._data[cast(TKey, key)] = value
-        self.changed.emit(ObservableMappingChangeEvent())
+        self._after_change()
@@ -1,10 +1,23 @@
 """ObservableObjectMixin definition."""
 from dataclasses import dataclass
-from typing import Any, Callable, TypeVar
+from typing import Any, TypeVar
 
 from ass_parser.observable import Event, Observable
 
 TItem = TypeVar("TItem")
+TObservableObject = TypeVar("TObservableObject", bound="ObservableObjectMixin")
+
+# field kinds
+_UNTRACKED = 0
+_TRACKED = 1
+_TRACKED_DESCRIPTOR = 2
+
+# update modes
+_BUILDING = 0
+_NORMAL = 1
+_THROTTLED = 2
+
+_MISSING = object()
 
 
 @dataclass
@@ -12,59 +25,140 @@ class ObservableObjectChangeEvent(Event):
     """Observable object property change event."""
 
 
-class ObservableObjectMixin:
+class _ObservableObjectMeta(type):
+    """Metaclass that starts tracking changes once __init__ returns,
+    whatever the subclasses do in it or in __post_init__.
+    """
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        """Create and initialize a new instance.
+
+        :param args: positional arguments for __init__
+        :param kwargs: keyword arguments for __init__
+        :return: new instance
+        """
+        obj = super().__call__(*args, **kwargs)
+        obj.__dict__["_update_mode"] = _NORMAL
+        return obj
+
+
+class ObservableObjectMixin(metaclass=_ObservableObjectMeta):
     """An object that lets consumers to subscribe to its property change
     events.
+
+    Instances do not track changes until their __init__ finishes, so
+    constructing a dataclass is as cheap as constructing a regular one.
     """
 
     changed = Observable[ObservableObjectChangeEvent]()
 
-    def __setattr__(self, prop: str, new_value: Any) -> None:
-        """Set attribute.
+    _field_kinds: dict[str, int] = {}
+    _update_mode: int = _NORMAL
+    _dirty: bool = False
+    # private attributes caching values derived from the tracked fields,
+    # reset to None as soon as any of these fields changes
+    _derived_attrs: tuple[str, ...] = ()
+    # state that copies do not inherit: subscribers, update mode and the
+    # place of the object in its parent sequence
+    _detached_keys: tuple[str, ...] = (
+        "_parent",
+        "_index",
+        "_generation",
+        "_changed",
+        "_update_mode",
+        "_dirty",
+    )
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Give each subclass its own table of tracked fields."""
+        super().__init_subclass__(**kwargs)
+        cls._field_kinds = {}
+
+    def __new__(cls, *_args: Any, **_kwargs: Any) -> Any:
+        """Create a new instance.
+
+        Instances start in the building mode, which the metaclass ends once
+        __init__ returns.
+        """
+        obj = super().__new__(cls)
+        obj.__dict__["_update_mode"] = _BUILDING
+        return obj
 
-        Called whenever the user changes any of the class attributes.
-        Changes to properties starting with _ won't be tracked.
-        Changes to other properties will trigger self._after_change callback.
+    def __copy__(self: TObservableObject) -> TObservableObject:
+        """Duplicate self.
 
-        :param prop: property name
-        :param new_value: new value
-        """
-        if prop.startswith("_"):
-            super().__setattr__(prop, new_value)
-        else:
-            try:
-                old_value = getattr(self, prop)
-            except AttributeError:
-                super().__setattr__(prop, new_value)
-            else:
-                if new_value != old_value:
-                    self._setattr_impl(prop, new_value)
+        The copy is detached from the parent sequence and has no
+        subscribers.
 
-    def _setattr_normal(self, prop: str, new_value: Any) -> None:
-        """Regular implementation of attribute setter.
+        :return: duplicate of self
+        """
+        ret = object.__new__(type(self))
+        ret.__dict__.update(self.__dict__)
+        for key in self._detached_keys:
+            ret.__dict__.pop(key, None)
+        return ret
 
-        Calls _before_change and _after_change immediately.
+    @classmethod
+    def _classify_field(cls, prop: str) -> int:
+        """Decide how to track changes to the given property and remember the
+        decision in the class table.
 
         :param prop: property name
-        :param new_value: new value
+        :return: field kind
         """
-        self._before_change()
-        super().__setattr__(prop, new_value)
-        self._after_change()
+        if prop.startswith("_"):
+            kind = _UNTRACKED
+        elif hasattr(getattr(cls, prop, None), "__set__"):
+            kind = _TRACKED_DESCRIPTOR
+        else:
+            kind = _TRACKED
+        cls._field_kinds[prop] = kind
+        return kind
 
-    def _setattr_throttled(self, prop: str, new_value: Any) -> None:
-        """Throttled implementation of attribute setter.
+    def __setattr__(self, prop: str, new_value: Any) -> None:
+        """Set attribute.
 
-        Doesn't call _after_change until after the user calls the .end_update()
-        method. Calls before_change if it wasn't called before.
+        Called whenever the user changes any of the class attributes.
+        Changes to properties starting with _ won't be tracked.
+        Changes to other properties will trigger self._after_change callback.
 
         :param prop: property name
         :param new_value: new value
         """
-        if not self._dirty:
-            self._before_change()
-        super().__setattr__(prop, new_value)
-        self._dirty = True
+        try:
+            kind = self._field_kinds[prop]
+        except KeyError:
+            kind = self._classify_field(prop)
+        if kind == _UNTRACKED:
+            object.__setattr__(self, prop, new_value)
+            return
+        mode = self._update_mode
+        if mode == _BUILDING:
+            object.__setattr__(self, prop, new_value)
+            return
+
+        if kind == _TRACKED:
+            try:
+                old_value = self.__dict__[prop]
+            except KeyError:
+                old_value = getattr(self, prop, _MISSING)
+        else:
+            old_value = getattr(self, prop, _MISSING)
+
+        if old_value is _MISSING:
+            object.__setattr__(self, prop, new_value)
+        elif new_value != old_value:
+            for attr in self._derived_attrs:
+                self.__dict__[attr] = None
+            if mode == _THROTTLED:
+                if not self._dirty:
+                    self._before_change()
+                object.__setattr__(self, prop, new_value)
+                self._dirty = True
+            else:
+                self._before_change()
+                object.__setattr__(self, prop, new_value)
+                self._after_change()
 
     def begin_update(self) -> None:
         """Start throttling calls to ._after_change() method.
@@ -74,7 +168,7 @@ class ObservableObjectMixin:
         properties, they're getting called only once, on .begin_update() and
         .end_update(), and only if there was a change to the class properties.
         """
-        setattr(self, "_setattr_impl", self._setattr_throttled)
+        self._update_mode = _THROTTLED
 
     def end_update(self) -> None:
         """Stop throttling calls to ._after_change() method.
@@ -82,10 +176,10 @@ class ObservableObjectMixin:
         If the object was modified in the meantime, calls ._after_change()
         method only once.
         """
+        self._update_mode = _NORMAL
         if self._dirty:
+            self._dirty = False
             self._after_change()
-        setattr(self, "_setattr_impl", self._setattr_normal)
-        self._dirty = False
 
     def _before_change(self) -> None:
         """Called before class properties have changed."""
@@ -93,8 +187,3 @@ class ObservableObjectMixin:
     def _after_change(self) -> None:
         """Called after class properties have changed."""
         self.changed.emit(ObservableObjectChangeEvent())
-
-    _dirty: bool = False
-    _setattr_impl: Callable[
-        ["ObservableObjectMixin", str, Any], None
-    ] = _setattr_normal
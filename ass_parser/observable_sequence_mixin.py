@@ -38,7 +38,7 @@ class ObservableSequenceItemInsertionEvent(Event, Generic[TItem]):
 class ObservableSequenceItemModificationEvent(Event, Generic[TItem]):
     """Observable sequence item modification event.
 
-    Broadcast by third party classes after an item within an
+    Broadcast by third party classes before and after an item within an
     ObservableSequenceMixin was modified.
     """
 
@@ -64,6 +64,9 @@ class ObservableSequenceMixin(MutableSequence[TItem]):
     ]()
     items_removed = Observable[ObservableSequenceItemRemovalEvent[TItem]]()
     items_inserted = Observable[ObservableSequenceItemInsertionEvent[TItem]]()
+    items_about_to_be_modified = Observable[
+        ObservableSequenceItemModificationEvent[TItem]
+    ]()
     items_modified = Observable[
         ObservableSequenceItemModificationEvent[TItem]
     ]()
@@ -73,6 +76,71 @@ class ObservableSequenceMixin(MutableSequence[TItem]):
         """Initialize self."""
         super().__init__(*args, **kwargs)  # type: ignore
         self._data: list[TItem] = []
+        self._version = 0
+
+    def _before_items_insertion(
+        self, event: ObservableSequenceItemInsertionEvent[TItem]
+    ) -> None:
+        """Called before items are inserted, ahead of the subscribers of
+        items_about_to_be_inserted.
+
+        Lets subclasses react to their own changes without subscribing to
+        themselves, which would make every instance a reference cycle.
+
+        :param event: insertion event
+        """
+
+    def _on_items_insertion(
+        self, event: ObservableSequenceItemInsertionEvent[TItem]
+    ) -> None:
+        """Called after items were inserted, ahead of the subscribers of
+        items_inserted.
+
+        :param event: insertion event
+        """
+
+    def _on_items_removal(
+        self, event: ObservableSequenceItemRemovalEvent[TItem]
+    ) -> None:
+        """Called after items were removed, ahead of the subscribers of
+        items_removed.
+
+        :param event: removal event
+        """
+
+    def _emit_insertion(
+        self, index: Union[int, slice], items: list[TItem], is_committed: bool
+    ) -> None:
+        event = ObservableSequenceItemInsertionEvent[TItem](
+            index=index, items=items, is_committed=is_committed
+        )
+        if is_committed:
+            self._on_items_insertion(event)
+            self.items_inserted.emit(event)
+        else:
+            self._before_items_insertion(event)
+            self.items_about_to_be_inserted.emit(event)
+
+    def _emit_removal(
+        self, index: Union[int, slice], items: list[TItem], is_committed: bool
+    ) -> None:
+        event = ObservableSequenceItemRemovalEvent[TItem](
+            index=index, items=items, is_committed=is_committed
+        )
+        if is_committed:
+            self._on_items_removal(event)
+            self.items_removed.emit(event)
+        else:
+            self.items_about_to_be_removed.emit(event)
+
+    def _after_change(self) -> None:
+        """Count the change and emit the change event.
+
+        Called after every change to the sequence, including changes to its
+        items that notify their parent sequence.
+        """
+        self._version += 1
+        self.changed.emit(ObservableSequenceChangeEvent())
 
     def __len__(self) -> int:
         return len(self._data)
@@ -97,18 +165,10 @@ class ObservableSequenceMixin(MutableSequence[TItem]):
         else:
             values = [self._data[index]]
 
-        self.items_about_to_be_removed.emit(
-            ObservableSequenceItemRemovalEvent[TItem](
-                index=index, items=values, is_committed=False
-            )
-        )
+        self._emit_removal(index, values, False)
         del self._data[index]
-        self.items_removed.emit(
-            ObservableSequenceItemRemovalEvent[TItem](
-                index=index, items=values, is_committed=True
-            )
-        )
-        self.changed.emit(ObservableSequenceChangeEvent())
+        self._emit_removal(index, values, True)
+        self._after_change()
 
     @overload
     def __setitem__(self, index: int, value: TItem) -> None:
@@ -133,16 +193,8 @@ class ObservableSequenceMixin(MutableSequence[TItem]):
         else:
             new_values = [value]
 
-        self.items_about_to_be_removed.emit(
-            ObservableSequenceItemRemovalEvent[TItem](
-                index=index, items=old_values, is_committed=False
-            )
-        )
-        self.items_about_to_be_inserted.emit(
-            ObservableSequenceItemInsertionEvent[TItem](
-                index=index, items=new_values, is_committed=False
-            )
-        )
+        self._emit_removal(index, old_values, False)
+        self._emit_insertion(index, new_values, False)
         if isinstance(index, int):
             assert not isinstance(value, Iterable)
             self._data[index] = value
@@ -151,60 +203,28 @@ class ObservableSequenceMixin(MutableSequence[TItem]):
                 raise TypeError("can only assign an iterable")
             self._data[index] = value
 
-        self.items_removed.emit(
-            ObservableSequenceItemRemovalEvent[TItem](
-                index=index, items=old_values, is_committed=True
-            )
-        )
-        self.items_inserted.emit(
-            ObservableSequenceItemInsertionEvent[TItem](
-                index=index, items=new_values, is_committed=True
-            )
-        )
-        self.changed.emit(ObservableSequenceChangeEvent())
+        self._emit_removal(index, old_values, True)
+        self._emit_insertion(index, new_values, True)
+        self._after_change()
 
     def insert(self, index: int, value: TItem) -> None:
         values = [value]
-        self.items_about_to_be_inserted.emit(
-            ObservableSequenceItemInsertionEvent[TItem](
-                index=index, items=values, is_committed=False
-            )
-        )
+        self._emit_insertion(index, values, False)
         self._data.insert(index, value)
-        self.items_inserted.emit(
-            ObservableSequenceItemInsertionEvent[TItem](
-                index=index, items=values, is_committed=True
-            )
-        )
-        self.changed.emit(ObservableSequenceChangeEvent())
+        self._emit_insertion(index, values, True)
+        self._after_change()
 
     def clear(self) -> None:
         values = self._data[:]
-        self.items_about_to_be_removed.emit(
-            ObservableSequenceItemRemovalEvent[TItem](
-                index=slice(-1), items=values, is_committed=False
-            )
-        )
+        self._emit_removal(slice(-1), values, False)
         self._data.clear()
-        self.items_removed.emit(
-            ObservableSequenceItemRemovalEvent[TItem](
-                index=slice(-1), items=values, is_committed=True
-            )
-        )
-        self.changed.emit(ObservableSequenceChangeEvent())
+        self._emit_removal(slice(-1), values, True)
+        self._after_change()
 
     def extend(self, values: Iterable[TItem]) -> None:
         values = list(values)
-        self.items_about_to_be_inserted.emit(
-            ObservableSequenceItemInsertionEvent[TItem](
-                index=slice(-1), items=values, is_committed=False
-            )
-        )
+        self._emit_insertion(slice(-1), values, False)
         for value in values:
             self._data.append(value)
-        self.items_inserted.emit(
-            ObservableSequenceItemInsertionEvent[TItem](
-                index=slice(-1), items=values, is_committed=True
-            )
-        )
-        self.changed.emit(ObservableSequenceChangeEvent())
+        self._emit_insertion(slice(-1), values, True)
+        self._after_change()
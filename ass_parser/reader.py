@@ -1,25 +1,330 @@
 """ASS file reading routines."""
+import asyncio
+import codecs
 import io
+import mmap
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator, Iterator
+from concurrent.futures import Executor
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import IO, TextIO, Union
+from typing import IO, Optional, TextIO, Union, cast
 
-from ass_parser.ass_file import AssFile
+from ass_parser.ass_file import PARSE_BATCH_SIZE, AssFile
+from ass_parser.compression import (
+    is_binary_stream,
+    is_compressed_path,
+    open_path,
+    text_reader,
+)
+from ass_parser.decoding import (
+    ByteSource,
+    LineSplitter,
+    iter_decoded_lines,
+    pick_encoding,
+    sniff_encodings,
+)
 
+# number of characters to read at once by read_ass_async()
+READ_CHUNK_SIZE = 2**16
 
-def read_ass(source: Union[Path, IO[str], str]) -> AssFile:
+
+def _consume_bytes(
+    ass_file: AssFile,
+    data: ByteSource,
+    encoding: Optional[str],
+    preserve_original: bool,
+    raw_extra_sections: bool,
+    time_range: Optional[tuple[int, int]],
+    legacy_fallback: bool = True,
+) -> None:
+    """Load ASS from bytes, guessing the encoding if needed.
+
+    The encoding is chosen before parsing, so the file is parsed once.
+
+    :param ass_file: file to populate
+    :param data: file contents
+    :param encoding: encoding to use instead of guessing it
+    :param preserve_original: see read_ass()
+    :param raw_extra_sections: see read_ass()
+    :param time_range: see read_ass()
+    :param legacy_fallback: see sniff_encodings()
+    """
+    encodings, start = sniff_encodings(data, encoding, legacy_fallback)
+    lines = iter_decoded_lines(
+        data, pick_encoding(data, encodings, start), start
+    )
+    try:
+        ass_file.consume_ass_stream(
+            lines, preserve_original, raw_extra_sections, time_range
+        )
+    finally:
+        # releases the view of data even if parsing failed midway
+        lines.close()
+
+
+def read_ass(
+    source: Union[Path, IO[str], IO[bytes], str, ByteSource],
+    preserve_original: bool = False,
+    raw_extra_sections: bool = False,
+    encoding: Optional[str] = None,
+    time_range: Optional[tuple[int, int]] = None,
+) -> AssFile:
     """Read ASS from the specified source.
 
-    :param source: a string, a readable stream, or a path
+    Paths ending with .gz, .xz or .bz2 and binary streams compressed with
+    gzip, xz or bzip2 are decompressed on the fly.
+
+    Other paths are memory-mapped and, like bytes and memory maps, decoded
+    in large blocks. Unless given explicitly, their encoding is taken from
+    the byte order mark, or else is UTF-8. Bytes and memory maps that are
+    not valid UTF-8 are decoded as cp1252 instead; paths raise a
+    UnicodeDecodeError. The encoding is chosen before parsing.
+
+    :param source: a string, bytes, a memory map, a readable text or binary
+        stream, or a path
+    :param preserve_original: whether to keep the source text of each event,
+        style and key-value line and write it back unchanged unless the
+        line's object gets modified
+    :param raw_extra_sections: whether to parse the sections other than
+        script info, styles and events only on first access, see
+        AssFile.consume_ass_stream()
+    :param encoding: encoding of bytes, memory maps and uncompressed paths
+    :param time_range: optional window (start, end) in milliseconds to load
+        the events of; the other events are skipped after parsing only their
+        times, see AssFile.consume_ass_stream()
     :return: parsed ASS file
     """
     ass_file = AssFile()
     handle: Union[TextIO, IO[str]]
     if isinstance(source, str):
         with io.StringIO(source) as handle:
-            ass_file.consume_ass_stream(handle)
+            ass_file.consume_ass_stream(
+                handle, preserve_original, raw_extra_sections, time_range
+            )
+    elif isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        _consume_bytes(
+            ass_file,
+            source,
+            encoding,
+            preserve_original,
+            raw_extra_sections,
+            time_range,
+        )
+    elif isinstance(source, Path) and is_compressed_path(source):
+        with open_path(source, "r") as handle:
+            ass_file.consume_ass_stream(
+                handle, preserve_original, raw_extra_sections, time_range
+            )
     elif isinstance(source, Path):
-        with source.open("r", encoding="utf-8") as handle:
-            ass_file.consume_ass_stream(handle)
+        with source.open("rb") as binary_handle:
+            if not source.stat().st_size:
+                data: ByteSource = b""
+            else:
+                data = mmap.mmap(
+                    binary_handle.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            try:
+                _consume_bytes(
+                    ass_file,
+                    data,
+                    encoding,
+                    preserve_original,
+                    raw_extra_sections,
+                    time_range,
+                    legacy_fallback=False,
+                )
+            finally:
+                if isinstance(data, mmap.mmap):
+                    data.close()
+    elif is_binary_stream(source):
+        with text_reader(cast(IO[bytes], source)) as handle:
+            ass_file.consume_ass_stream(
+                handle, preserve_original, raw_extra_sections, time_range
+            )
     else:
-        ass_file.consume_ass_stream(source)
+        ass_file.consume_ass_stream(
+            cast(IO[str], source),
+            preserve_original,
+            raw_extra_sections,
+            time_range,
+        )
     return ass_file
+
+
+async def _iter_text_line_batches(
+    handle: IO[str],
+) -> AsyncIterator[list[str]]:
+    """Read a text stream in chunks in a worker thread.
+
+    :param handle: a readable text stream
+    :return: an async generator of lists of lines
+    """
+    splitter = LineSplitter()
+    while chunk := await asyncio.to_thread(handle.read, READ_CHUNK_SIZE):
+        yield splitter.feed(chunk)
+    yield splitter.feed("", final=True)
+
+
+def _read_decoded_lines(
+    handle: IO[bytes],
+    decoder: codecs.IncrementalDecoder,
+    splitter: LineSplitter,
+) -> Optional[list[str]]:
+    """Read and decode the next chunk of a binary stream.
+
+    Called in a worker thread, so that decoding does not block the event
+    loop either.
+
+    :param handle: a readable binary stream
+    :param decoder: decoder of the stream encoding
+    :param splitter: line splitter of the stream
+    :return: the lines completed by the chunk, or None at the end of the
+        stream
+    """
+    block = handle.read(READ_CHUNK_SIZE)
+    if not block:
+        return None
+    return splitter.feed(decoder.decode(block))
+
+
+async def _iter_line_batches(
+    source: Union[Path, IO[str], IO[bytes], str, ByteSource],
+    encoding: Optional[str],
+) -> AsyncGenerator[list[str], None]:
+    """Read and decode a source without blocking the event loop.
+
+    Paths and streams are read and decoded chunk by chunk in a worker
+    thread. Bytes and memory maps are decoded there block by block.
+
+    :param source: see read_ass_async()
+    :param encoding: see read_ass()
+    :return: an async generator of lists of lines without line endings
+    """
+    if isinstance(source, str):
+        # same line splitting as iterating over io.StringIO(text)
+        yield source.split("\n")
+    elif isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        encodings, start = sniff_encodings(source, encoding)
+        lines = iter_decoded_lines(
+            source,
+            await asyncio.to_thread(pick_encoding, source, encodings, start),
+            start,
+        )
+        try:
+            while batch := await asyncio.to_thread(
+                list, islice(lines, PARSE_BATCH_SIZE)
+            ):
+                yield batch
+        finally:
+            lines.close()
+    elif isinstance(source, Path) and is_compressed_path(source):
+        handle = await asyncio.to_thread(open_path, source, "r")
+        try:
+            async for batch in _iter_text_line_batches(handle):
+                yield batch
+        finally:
+            await asyncio.to_thread(handle.close)
+    elif isinstance(source, Path):
+        binary_handle = await asyncio.to_thread(source.open, "rb")
+        try:
+            head = await asyncio.to_thread(binary_handle.read, 4)
+            encodings, start = sniff_encodings(
+                head, encoding, legacy_fallback=False
+            )
+            decoder = codecs.getincrementaldecoder(encodings[0])()
+            splitter = LineSplitter()
+            yield splitter.feed(decoder.decode(head[start:]))
+            while (
+                new_lines := await asyncio.to_thread(
+                    _read_decoded_lines, binary_handle, decoder, splitter
+                )
+            ) is not None:
+                yield new_lines
+            yield splitter.feed(decoder.decode(b"", final=True), final=True)
+        finally:
+            await asyncio.to_thread(binary_handle.close)
+    elif is_binary_stream(source):
+        with text_reader(cast(IO[bytes], source)) as handle:
+            async for batch in _iter_text_line_batches(handle):
+                yield batch
+    else:
+        async for batch in _iter_text_line_batches(cast(IO[str], source)):
+            yield batch
+
+
+async def read_ass_async(
+    source: Union[Path, IO[str], IO[bytes], str, ByteSource],
+    preserve_original: bool = False,
+    raw_extra_sections: bool = False,
+    executor: Optional[Executor] = None,
+    encoding: Optional[str] = None,
+    time_range: Optional[tuple[int, int]] = None,
+) -> AssFile:
+    """Read ASS from the specified source without blocking the event loop.
+
+    Paths and streams are read and decoded in chunks in a worker thread, as
+    are bytes and memory maps. The decoded lines are parsed on the event loop
+    as they come, in batches, with a pause after each of them.
+    Alternatively, it can be offloaded entirely to an executor - a process
+    pool, for example, keeps the GIL free for the event loop.
+
+    :param source: a string, bytes, a memory map, a readable text or binary
+        stream, or a path; see read_ass()
+    :param preserve_original: see read_ass()
+    :param raw_extra_sections: see read_ass()
+    :param executor: optional executor to parse the file in
+    :param encoding: see read_ass()
+    :param time_range: see read_ass()
+    :return: parsed ASS file
+    """
+    batches = _iter_line_batches(source, encoding)
+    try:
+        if executor is not None:
+            lines = [line async for batch in batches for line in batch]
+            return await asyncio.get_running_loop().run_in_executor(
+                executor,
+                partial(
+                    read_ass,
+                    "\n".join(lines),
+                    preserve_original,
+                    raw_extra_sections,
+                    time_range=time_range,
+                ),
+            )
+
+        # the parser pulls lines synchronously, so each of its batches is
+        # read in advance
+        buffer: deque[str] = deque()
+        is_exhausted = False
+
+        def iter_buffered_lines() -> Iterator[str]:
+            while True:
+                while buffer:
+                    yield buffer.popleft()
+                if is_exhausted:
+                    return
+                raise RuntimeError("ran out of buffered lines")
+
+        ass_file = AssFile()
+        parser = ass_file.iter_consume_ass_stream(
+            iter_buffered_lines(),
+            preserve_original,
+            raw_extra_sections,
+            time_range,
+            PARSE_BATCH_SIZE,
+        )
+        while True:
+            while not is_exhausted and len(buffer) < PARSE_BATCH_SIZE:
+                try:
+                    buffer.extend(await batches.__anext__())
+                except StopAsyncIteration:
+                    is_exhausted = True
+            try:
+                next(parser)
+            except StopIteration:
+                return ass_file
+            await asyncio.sleep(0)
+    finally:
+        await batches.aclose()
@@ -0,0 +1,71 @@
+"""Plain tuple counterparts of events and styles."""
+from typing import NamedTuple
+
+from ass_parser.ass_color import AssColor
+from ass_parser.ass_event import AssEvent
+from ass_parser.ass_style import AssStyle
+
+
+class AssEventRecord(NamedTuple):
+    """Lightweight read-only copy of the field values of an event.
+
+    The fields follow the order of the AssEvent constructor.
+    """
+
+    start: int
+    end: int
+    style_name: str
+    actor: str
+    text: str
+    note: str
+    effect: str
+    layer: int
+    margin_left: int
+    margin_right: int
+    margin_vertical: int
+    is_comment: bool
+
+    def to_event(self) -> AssEvent:
+        """Create a standalone event with the values of self.
+
+        :return: event
+        """
+        return AssEvent(*self)
+
+
+class AssStyleRecord(NamedTuple):
+    """Lightweight read-only copy of the field values of a style.
+
+    The fields follow the order of the AssStyle constructor.
+    """
+
+    name: str
+    font_name: str
+    font_size: int
+    primary_color: AssColor
+    secondary_color: AssColor
+    outline_color: AssColor
+    back_color: AssColor
+    bold: bool
+    italic: bool
+    underline: bool
+    strike_out: bool
+    scale_x: float
+    scale_y: float
+    spacing: float
+    angle: float
+    border_style: int
+    outline: float
+    shadow: float
+    alignment: int
+    margin_left: int
+    margin_right: int
+    margin_vertical: int
+    encoding: int
+
+    def to_style(self) -> AssStyle:
+        """Create a standalone style with the values of self.
+
+        :return: style
+        """
+        return AssStyle(*self)
@@ -0,0 +1,327 @@
+"""Sharing the events of an ASS file between processes."""
+import os
+import struct
+import sys
+import weakref
+from array import array
+from collections.abc import Iterable, Sequence
+from itertools import accumulate
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Optional, Union, cast, overload
+
+from ass_parser.ass_event import AssEvent
+from ass_parser.records import AssEventRecord
+from ass_parser.util import content_columns
+
+# event fields stored as columns of signed 64-bit integers
+INT_FIELDS = (
+    "start",
+    "end",
+    "layer",
+    "margin_left",
+    "margin_right",
+    "margin_vertical",
+    "is_comment",
+)
+# event fields stored as columns of indices in a table of distinct strings
+STRING_FIELDS = ("style_name", "actor", "text", "note", "effect")
+
+_MAGIC = b"ASSEVT\x01\n"
+# magic, number of events, number of distinct strings, size of their text
+_HEADER = struct.Struct("<8sQQQ")
+_INT_SIZE = array("q").itemsize
+
+# before Python 3.13, attaching to a block registers it with the resource
+# tracker of the attaching process, which unlinks the block once that process
+# exits, so attach() has to unregister it
+_UNREGISTER_ATTACHED = sys.version_info < (3, 13) and os.name == "posix"
+
+
+def _release(views: list[memoryview], shm: SharedMemory) -> None:
+    """Release the views of a shared memory block, then close it.
+
+    The block cannot be closed while any view of it is alive.
+
+    :param views: views of the block, the latest ones last
+    :param shm: shared memory block
+    """
+    while views:
+        views.pop().release()
+    shm.close()
+
+
+class AssSharedEvents(Sequence[AssEventRecord]):
+    """Read-only columns of event fields in a shared memory block.
+
+    The block is created with create() and other processes attach to it by
+    its name with attach(). Pickling an instance, for example to pass it to
+    a process pool, pickles only the name, so all the workers read the same
+    copy of the events.
+
+    Integer fields are available as zero-copy views, see get_column().
+    Each distinct string is stored once, as UTF-8 text located by a column
+    of offsets, and string fields hold indices of these strings. Items are
+    AssEventRecord tuples that decode their strings on access.
+
+    The process that created the block must unlink() it once the other
+    processes are done, which leaving the context manager does.
+    """
+
+    def __init__(self, shm: SharedMemory, owner: bool = False) -> None:
+        """Initialize self.
+
+        :param shm: shared memory block filled by create()
+        :param owner: whether self is responsible for unlinking the block
+        """
+        self._shm = shm
+        self._owner = owner
+        view = cast(memoryview, shm.buf).toreadonly()
+        self._views = [view]
+        # instances garbage collected without being closed release the views
+        # before SharedMemory.__del__() closes the block
+        self._finalizer = weakref.finalize(self, _release, self._views, shm)
+        magic, count, string_count, text_size = _HEADER.unpack_from(view)
+        if magic != _MAGIC:
+            self.close()
+            raise ValueError(f'"{shm.name}" does not hold shared events')
+        self._count: int = count
+        pos = _HEADER.size
+        self._int_columns: dict[str, memoryview] = {}
+        for name in INT_FIELDS:
+            self._int_columns[name] = self._slice(pos, count)
+            pos += count * _INT_SIZE
+        self._string_ids: dict[str, memoryview] = {}
+        for name in STRING_FIELDS:
+            self._string_ids[name] = self._slice(pos, count)
+            pos += count * _INT_SIZE
+        self._offsets = self._slice(pos, string_count + 1)
+        pos += (string_count + 1) * _INT_SIZE
+        self._text = view[pos : pos + text_size]
+        self._views.append(self._text)
+        # decoded strings, filled on first use
+        self._strings: list[Optional[str]] = [None] * string_count
+
+    def _slice(self, pos: int, count: int) -> memoryview:
+        """Return a view of the given integers of the block.
+
+        :param pos: byte offset of the first integer
+        :param count: number of integers
+        :return: read-only view
+        """
+        view = self._views[0][pos : pos + count * _INT_SIZE]
+        column = view.cast("q")
+        self._views += [view, column]
+        return column
+
+    @classmethod
+    def create(
+        cls, events: Iterable[AssEvent], name: Optional[str] = None
+    ) -> "AssSharedEvents":
+        """Copy the field values of the given events into a new shared memory
+        block.
+
+        :param events: events to share
+        :param name: name of the block; generated if not given
+        :return: view of the block, responsible for unlinking it
+        """
+        columns = dict(zip(AssEventRecord._fields, content_columns(events)))
+        count = len(columns.get("start", ()))
+        arrays = [
+            array("q", columns.get(field_name, ()))
+            for field_name in INT_FIELDS
+        ]
+        string_ids: dict[str, int] = {}
+        for field_name in STRING_FIELDS:
+            arrays.append(
+                array(
+                    "q",
+                    [
+                        string_ids.setdefault(value, len(string_ids))
+                        for value in columns.get(field_name, ())
+                    ],
+                )
+            )
+        encoded = [value.encode() for value in string_ids]
+        arrays.append(array("q", accumulate(map(len, encoded), initial=0)))
+        text = b"".join(encoded)
+
+        size = _HEADER.size + sum(len(values) * _INT_SIZE for values in arrays)
+        shm = SharedMemory(name=name, create=True, size=size + len(text))
+        try:
+            buf = cast(memoryview, shm.buf)
+            _HEADER.pack_into(
+                buf, 0, _MAGIC, count, len(string_ids), len(text)
+            )
+            pos = _HEADER.size
+            for values in arrays:
+                with memoryview(values) as view:
+                    buf[pos : pos + view.nbytes] = view.cast("B")
+                    pos += view.nbytes
+            buf[pos : pos + len(text)] = text
+            return cls(shm, owner=True)
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+
+    @classmethod
+    def attach(cls, name: str) -> "AssSharedEvents":
+        """Attach to a block made by create(), possibly in another process.
+
+        Only the process that created the block unlinks it.
+
+        :param name: name of the block
+        :return: view of the block
+        """
+        if sys.version_info >= (3, 13):
+            return cls(SharedMemory(name=name, track=False))
+        shm = SharedMemory(name=name)
+        if _UNREGISTER_ATTACHED:
+            resource_tracker.unregister(getattr(shm, "_name"), "shared_memory")
+        return cls(shm)
+
+    @property
+    def name(self) -> str:
+        """Return the name of the shared memory block.
+
+        :return: name to pass to attach()
+        """
+        return self._shm.name
+
+    def __len__(self) -> int:
+        """Return the number of events.
+
+        :return: number of events
+        """
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> AssEventRecord:
+        ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, index: slice) -> list[AssEventRecord]:
+        ...  # pragma: no cover
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[AssEventRecord, list[AssEventRecord]]:
+        """Read the event or events at the given index.
+
+        :param index: event index or slice
+        :return: record or list of records
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("event index out of range")
+        ints = self._int_columns
+        ids = self._string_ids
+        return AssEventRecord(
+            start=ints["start"][index],
+            end=ints["end"][index],
+            style_name=self._get_string(ids["style_name"][index]),
+            actor=self._get_string(ids["actor"][index]),
+            text=self._get_string(ids["text"][index]),
+            note=self._get_string(ids["note"][index]),
+            effect=self._get_string(ids["effect"][index]),
+            layer=ints["layer"][index],
+            margin_left=ints["margin_left"][index],
+            margin_right=ints["margin_right"][index],
+            margin_vertical=ints["margin_vertical"][index],
+            is_comment=bool(ints["is_comment"][index]),
+        )
+
+    def get_column(self, field_name: str) -> memoryview:
+        """Return a zero-copy view of an integer field of all events.
+
+        The view is valid until self is closed.
+
+        :param field_name: one of INT_FIELDS
+        :return: read-only view of signed 64-bit integers
+        """
+        try:
+            return self._int_columns[field_name]
+        except KeyError as exc:
+            raise ValueError(f'not an integer field: "{field_name}"') from exc
+
+    def get_string(self, field_name: str, index: int) -> str:
+        """Decode a string field of a single event.
+
+        :param field_name: one of STRING_FIELDS
+        :param index: event index
+        :return: field value
+        """
+        try:
+            ids = self._string_ids[field_name]
+        except KeyError as exc:
+            raise ValueError(f'not a string field: "{field_name}"') from exc
+        return self._get_string(ids[index])
+
+    def _get_string(self, string_id: int) -> str:
+        """Return a distinct string, decoding it on first use.
+
+        :param string_id: index of the string
+        :return: decoded string
+        """
+        value = self._strings[string_id]
+        if value is None:
+            offsets = self._offsets
+            value = str(
+                self._text[offsets[string_id] : offsets[string_id + 1]],
+                "utf-8",
+            )
+            self._strings[string_id] = value
+        return value
+
+    def close(self) -> None:
+        """Release the views and detach from the block.
+
+        Records read so far remain usable.
+        """
+        self._int_columns = {}
+        self._string_ids = {}
+        self._strings = []
+        self._count = 0
+        self._finalizer()
+
+    def unlink(self) -> None:
+        """Free the block once all processes close it."""
+        if _UNREGISTER_ATTACHED:
+            # workers of a process pool share the resource tracker of their
+            # parent, so attaching there unregistered the block of the owner;
+            # registering it again is a no-op otherwise
+            resource_tracker.register(
+                getattr(self._shm, "_name"), "shared_memory"
+            )
+        self._shm.unlink()
+
+    def __enter__(self) -> "AssSharedEvents":
+        """Enter the runtime context.
+
+        :return: self
+        """
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit the runtime context, closing self and unlinking the block
+        if self created it.
+
+        :param args: exception details
+        """
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Return pickle compatible object representation.
+
+        Only the name of the block is pickled; the unpickled copy attaches to
+        it and is not responsible for unlinking it.
+
+        :return: object representation
+        """
+        return type(self).attach, (self.name,)
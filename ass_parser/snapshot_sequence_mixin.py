@@ -0,0 +1,206 @@
+"""SnapshotSequenceMixin definition."""
+import threading
+import weakref
+from collections.abc import Iterable, Iterator, Sequence
+from copy import copy
+from typing import Any, TypeVar, Union, overload
+
+from ass_parser.observable_sequence_mixin import ObservableSequenceMixin
+
+TItem = TypeVar("TItem")
+
+
+class SequenceSnapshot(Sequence[TItem]):
+    """Read-only snapshot of a SnapshotSequenceMixin.
+
+    The snapshot shares its items with the live sequence. An item gets copied
+    only once it is about to be modified or removed from the live sequence,
+    so taking a snapshot is O(1).
+
+    Items retrieved from the snapshot are detached copies - modifying them
+    does not affect neither the snapshot nor the live sequence. Reading from
+    the snapshot is safe while another thread modifies the live sequence.
+    """
+
+    def __init__(self, name: str, data: list[TItem], generation: int) -> None:
+        """Initialize self.
+
+        :param name: section name
+        :param data: the list of items shared with the live sequence
+        :param generation: generation of the live sequence at the time the
+            snapshot was taken
+        """
+        self.name = name
+        self._data = data
+        self._generation = generation
+        self._preserved: dict[int, TItem] = {}
+        self._lock = threading.Lock()
+
+    def _preserve(self, item: TItem) -> None:
+        """Remember the current state of an item that is about to change.
+
+        :param item: item of the live sequence
+        """
+        if getattr(item, "_generation") > self._generation:
+            return
+        with self._lock:
+            if id(item) not in self._preserved:
+                self._preserved[id(item)] = copy(item)
+
+    def _resolve(self, item: TItem) -> TItem:
+        return copy(self._preserved.get(id(item), item))
+
+    def __len__(self) -> int:
+        """Return number of items.
+
+        :return: number of items
+        """
+        return len(self._data)
+
+    @overload
+    def __getitem__(self, index: int) -> TItem:
+        ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, index: slice) -> list[TItem]:
+        ...  # pragma: no cover
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[TItem, list[TItem]]:
+        """Return a copy of the item as it was when the snapshot was taken.
+
+        :param index: item index or slice
+        :return: item copy or a list of item copies
+        """
+        with self._lock:
+            if isinstance(index, slice):
+                return [self._resolve(item) for item in self._data[index]]
+            return self._resolve(self._data[index])
+
+    def __iter__(self) -> Iterator[TItem]:
+        """Iterate over copies of the items.
+
+        :return: iterator over item copies
+        """
+        for i in range(len(self._data)):
+            yield self[i]
+
+
+class SnapshotSequenceMixin(ObservableSequenceMixin[TItem]):
+    """Observable sequence that supports cheap copy-on-write snapshots.
+
+    Items must call ._before_item_change() on their parent sequence before
+    they change.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize self."""
+        super().__init__(*args, **kwargs)
+        self._snapshots: weakref.WeakSet[
+            SequenceSnapshot[TItem]
+        ] = weakref.WeakSet()
+        self._generation = 0
+        self._is_data_shared = False
+
+    def snapshot(self) -> SequenceSnapshot[TItem]:
+        """Take a read-only snapshot of self.
+
+        :return: snapshot
+        """
+        name: str = getattr(self, "name", "")
+        snapshot = SequenceSnapshot[TItem](name, self._data, self._generation)
+        self._snapshots.add(snapshot)
+        self._generation += 1
+        self._is_data_shared = True
+        return snapshot
+
+    def _before_item_change(self, item: TItem) -> None:
+        """Preserve the item state in the snapshots that share it.
+
+        :param item: item that is about to change
+        """
+        if self._snapshots:
+            for snapshot in self._snapshots:
+                snapshot._preserve(item)  # pylint: disable=protected-access
+
+    def _after_items_insertion(self, items: Iterable[TItem]) -> None:
+        for item in items:
+            setattr(item, "_generation", self._generation)
+
+    def _before_structure_change(self, removed: Iterable[TItem]) -> None:
+        if not self._snapshots:
+            return
+        if self._is_data_shared:
+            self._data = self._data[:]
+            self._is_data_shared = False
+        for item in removed:
+            self._before_item_change(item)
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        if isinstance(index, slice):
+            self._before_structure_change(self._data[index])
+        else:
+            self._before_structure_change([self._data[index]])
+        super().__delitem__(index)
+
+    @overload
+    def __setitem__(self, index: int, value: TItem) -> None:
+        ...  # pragma: no cover
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[TItem]) -> None:
+        ...  # pragma: no cover
+
+    def __setitem__(
+        self,
+        index: Union[int, slice],
+        value: Union[TItem, Iterable[TItem]],
+    ) -> None:
+        inserted: list[TItem]
+        if isinstance(index, slice):
+            if not isinstance(value, Iterable):
+                raise TypeError("can only assign an iterable")
+            inserted = list(value)
+            self._before_structure_change(self._data[index])
+            super().__setitem__(index, inserted)
+        else:
+            inserted = [value]  # type: ignore
+            self._before_structure_change([self._data[index]])
+            super().__setitem__(index, value)  # type: ignore
+        self._after_items_insertion(inserted)
+
+    def insert(self, index: int, value: TItem) -> None:
+        self._before_structure_change([])
+        super().insert(index, value)
+        self._after_items_insertion([value])
+
+    def clear(self) -> None:
+        self._before_structure_change(self._data)
+        super().clear()
+
+    def extend(self, values: Iterable[TItem]) -> None:
+        values = list(values)
+        self._before_structure_change([])
+        super().extend(values)
+        self._after_items_insertion(values)
+
+    def __getstate__(self) -> Any:
+        """Return pickle compatible object representation.
+
+        The pickled copy does not have snapshots.
+
+        :return: object representation
+        """
+        state = self.__dict__.copy()
+        del state["_snapshots"]
+        state["_is_data_shared"] = False
+        return state
+
+    def __setstate__(self, state: Any) -> None:
+        """Load class state from pickle compatible object representation.
+
+        :param state: object representation
+        """
+        self.__dict__.update(state)
+        self._snapshots = weakref.WeakSet()
@@ -0,0 +1,166 @@
+"""StringPool definition."""
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ass_parser.ass_file import AssFile  # pragma: no coverage
+
+# number of distinct strings a pool may hold before it first looks for
+# strings that nothing else uses anymore
+MIN_SWEEP_SIZE = 1024
+
+
+def _iter_refcounts(strings: dict[str, str]) -> Iterator[tuple[str, int]]:
+    """Yield the pooled strings along with their reference counts.
+
+    :param strings: entries of a pool
+    :return: a generator of tuples (string, reference count)
+    """
+    getrefcount = sys.getrefcount
+    for value in strings:
+        yield value, getrefcount(value)
+
+
+def _count_pool_only_refs() -> int:
+    """Measure the reference count _iter_refcounts() reports for a string
+    that nothing but the pool references.
+
+    The count includes the pool entry and the references taken by the
+    interpreter while counting, which vary between Python versions, so it
+    is measured rather than hard-coded.
+
+    :return: reference count
+    """
+    strings: dict[str, str] = {}
+    value = str(object())
+    strings[value] = value
+    del value
+    return next(_iter_refcounts(strings))[1]
+
+
+# reference count of the strings that only the pool still references
+_POOL_ONLY_REFS = _count_pool_only_refs()
+
+
+class StringPool:
+    """Interning table that makes equal strings share a single object.
+
+    Subtitle scripts repeat the same style names, actors, effects and often
+    whole texts thousands of times. Passing such values through the pool
+    keeps only one copy of each of them in memory.
+
+    Strings that only the pool still references, such as the previous
+    texts of edited events, are evicted whenever the pool doubles in size,
+    so it stays proportional to the number of strings in use.
+    """
+
+    def __init__(self) -> None:
+        """Initialize self."""
+        self._strings: dict[str, str] = {}
+        self._sweep_size = MIN_SWEEP_SIZE
+
+    def __len__(self) -> int:
+        """Return number of distinct strings held by the pool.
+
+        :return: number of distinct strings
+        """
+        return len(self._strings)
+
+    def intern(self, value: str) -> str:
+        """Return the pooled string equal to the given value.
+
+        If there is no such string yet, the value becomes the pooled string.
+
+        :param value: string to intern
+        :return: pooled string equal to value
+        """
+        strings = self._strings
+        pooled = strings.setdefault(value, value)
+        if len(strings) > self._sweep_size:
+            self._sweep()
+        return pooled
+
+    def intern_all(self, values: Sequence[str]) -> tuple[str, ...]:
+        """Intern many strings at once.
+
+        Faster than calling intern() for each of the values.
+
+        :param values: strings to intern
+        :return: pooled strings equal to values, in the same order
+        """
+        pooled = tuple(map(self._strings.setdefault, values, values))
+        if len(self._strings) > self._sweep_size:
+            self._sweep()
+        return pooled
+
+    def clear(self) -> None:
+        """Forget all pooled strings."""
+        self._strings.clear()
+        self._sweep_size = MIN_SWEEP_SIZE
+
+    def _sweep(self) -> None:
+        """Evict the strings that are referenced only by the pool."""
+        self._strings = {
+            value: value
+            for value, refcount in _iter_refcounts(self._strings)
+            if refcount > _POOL_ONLY_REFS
+        }
+        self._sweep_size = max(MIN_SWEEP_SIZE, 2 * len(self._strings))
+
+
+@dataclass
+class StringMemoryReport:
+    """Memory used by the string fields of an ASS file."""
+
+    total_strings: int
+    distinct_objects: int
+    distinct_values: int
+    stored_bytes: int
+    unshared_bytes: int
+
+    @property
+    def saved_bytes(self) -> int:
+        """Return how many bytes are saved thanks to sharing strings.
+
+        :return: number of bytes
+        """
+        return self.unshared_bytes - self.stored_bytes
+
+
+def _iter_string_fields(ass_file: "AssFile") -> Iterable[str]:
+    # pylint: disable=protected-access
+    for event in ass_file.events:
+        yield event._style_name
+        yield event._actor
+        yield event._effect
+        yield event._text
+        yield event._note
+    for style in ass_file.styles:
+        yield style.name
+        yield style.font_name
+
+
+def string_memory_report(ass_file: "AssFile") -> StringMemoryReport:
+    """Measure how much memory the string fields of an ASS file take, and
+    how much they would take if every value was stored separately.
+
+    :param ass_file: file to measure
+    :return: memory report
+    """
+    total_strings = 0
+    unshared_bytes = 0
+    objects: dict[int, str] = {}
+    for value in _iter_string_fields(ass_file):
+        size = sys.getsizeof(value)
+        total_strings += 1
+        unshared_bytes += size
+        objects[id(value)] = value
+    return StringMemoryReport(
+        total_strings=total_strings,
+        distinct_objects=len(objects),
+        distinct_values=len(set(objects.values())),
+        stored_bytes=sum(map(sys.getsizeof, objects.values())),
+        unshared_bytes=unshared_bytes,
+    )
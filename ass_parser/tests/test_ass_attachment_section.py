@@ -0,0 +1,107 @@
+"""Tests for the AssAttachmentSection class."""
+import io
+from pathlib import Path
+
+import pytest
+
+from ass_parser import (
+    AssAttachment,
+    AssAttachmentSection,
+    AssEvent,
+    AssFile,
+    AssKeyValueMapping,
+    AssStyle,
+    CorruptAssError,
+    read_ass,
+    write_ass,
+)
+
+DATA = bytes(range(256)) * 20 + b"end"
+
+
+def test_attachment_encoding() -> None:
+    """Test that attachments use the ASS flavor of uuencoding."""
+    section = AssAttachmentSection(name="Fonts")
+    section.append(AssAttachment("a.ttf", b"\x00\x00\x00\xff"))
+    assert section.to_ass_string() == "[Fonts]\nfontname: a.ttf\n!!!!`Q\n"
+
+
+def test_attachment_round_trip(tmp_path: Path) -> None:
+    """Test that attachments survive writing and reading back."""
+    path = tmp_path / "image.png"
+    path.write_bytes(DATA[::-1])
+    ass_file = AssFile()
+    ass_file.styles.append(AssStyle(name="Default"))
+    ass_file.events.append(AssEvent(text="test"))
+    fonts = AssAttachmentSection(name="Fonts")
+    fonts.append(AssAttachment("font.ttf", DATA))
+    graphics = AssAttachmentSection(name="Graphics")
+    graphics.append(AssAttachment.from_path(path))
+    ass_file.extra_sections.extend([fonts, graphics])
+
+    text = write_ass(ass_file)
+    assert "\nfilename: image.png\n" in text
+    attachment_lines = text[text.index("[Fonts]") :].splitlines()
+    assert all(len(line) <= 80 for line in attachment_lines)
+
+    result = read_ass(text)
+    font_section, graphic_section = result.extra_sections
+    assert isinstance(font_section, AssAttachmentSection)
+    assert isinstance(graphic_section, AssAttachmentSection)
+    font = font_section[0]
+    assert font.name == "font.ttf"
+    assert font.size == len(DATA)
+    assert font.read() == DATA
+    assert font == fonts[0]
+    assert graphic_section[0].read() == DATA[::-1]
+    assert result == ass_file
+
+    handle = io.BytesIO()
+    font.save(handle)
+    assert handle.getvalue() == DATA
+    assert b"".join(font.iter_bytes(chunk_size=100)) == DATA
+
+
+def test_attachment_lines_are_not_comments_or_headings() -> None:
+    """Test that encoded lines that look like comments or section headings
+    are kept as data.
+    """
+    ass_file = read_ass("[Fonts]\nfontname: a.ttf\n;;;;\n[AB]\n")
+    assert len(ass_file.extra_sections) == 1
+    section = ass_file.extra_sections[0]
+    assert isinstance(section, AssAttachmentSection)
+    assert section[0].size == 6
+    assert section[0] == AssAttachment.from_encoded("a.ttf", ";;;;[AB]")
+
+
+def test_attachment_data_ends_at_heading() -> None:
+    """Test that a heading that looks like encoded data starts a new section
+    when the body of a section follows it.
+    """
+    ass_file = read_ass(
+        "[Fonts]\nfontname: a.ttf\n;;;;\n[AEGISUB]\nKey: value\n"
+        "[Graphics]\nfilename: b.png\n[AB]\nfilename: c.png\n;;;;\n"
+    )
+    fonts, extra, graphics = ass_file.extra_sections
+    assert isinstance(fonts, AssAttachmentSection)
+    assert isinstance(extra, AssKeyValueMapping)
+    assert isinstance(graphics, AssAttachmentSection)
+    assert extra.name == "AEGISUB"
+    assert dict(extra) == {"Key": "value"}
+    assert list(fonts) == [AssAttachment.from_encoded("a.ttf", ";;;;")]
+    assert list(graphics) == [
+        AssAttachment.from_encoded("b.png", "[AB]"),
+        AssAttachment.from_encoded("c.png", ";;;;"),
+    ]
+    # each attachment keeps only its own data
+    # pylint: disable=protected-access
+    assert [attachment._encoded for attachment in graphics] == ["[AB]", ";;;;"]
+
+
+def test_corrupt_attachment() -> None:
+    """Test that badly encoded attachments raise an error once decoded."""
+    ass_file = read_ass("[Fonts]\nfontname: a.ttf\n!!!!!\n")
+    section = ass_file.extra_sections[0]
+    assert isinstance(section, AssAttachmentSection)
+    with pytest.raises(CorruptAssError):
+        section[0].read()
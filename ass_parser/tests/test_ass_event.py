@@ -1,7 +1,12 @@
 """Tests for the AssEvent class."""
+import dataclasses
+import pickle
 from unittest.mock import Mock
 
-from ass_parser import AssEvent
+import pytest
+
+from ass_parser import AssEvent, AssEventList, AssEventRecord
+from ass_parser.util import content_key, content_positions
 
 
 def test_ass_event_default_text() -> None:
@@ -74,3 +79,62 @@ def test_ass_event_equality() -> None:
     assert event1 == event2
     event1.text = "changed"
     assert event1 != event2
+
+
+def test_ass_event_fingerprint() -> None:
+    """Test that event fingerprints follow the event contents."""
+    event = AssEvent(text="test")
+    fingerprint = event.fingerprint
+    assert fingerprint == AssEvent(text="test").fingerprint
+    assert fingerprint != AssEvent(text="changed").fingerprint
+    event.text = "changed"
+    assert event.fingerprint != fingerprint
+    event.text = "test"
+    assert event.fingerprint == fingerprint
+
+
+def test_ass_event_pickling() -> None:
+    """Test that an unpickled event is detached from the parent list."""
+    event = AssEvent(start=1, end=2, text="test", note="note")
+    events = AssEventList(data=[event])
+    new_event = pickle.loads(pickle.dumps(event))
+    assert new_event == event
+    assert new_event.parent is None
+    assert events[0].parent is events
+
+
+def test_ass_event_record_fields() -> None:
+    """Test that the record fields follow the event content_key() order."""
+    assert tuple(content_positions(AssEvent)) == AssEventRecord._fields
+
+
+def test_ass_event_format_ass_table_values() -> None:
+    """Test that content_key() tuples format like the events themselves."""
+    event = AssEvent(
+        start=1,
+        end=2,
+        style_name="style",
+        actor="actor",
+        text="text",
+        effect="effect",
+        layer=3,
+        margin_left=4,
+        is_comment=True,
+    )
+    assert AssEventList.format_ass_table_values(content_key(event)) == (
+        "Comment: 3,0:00:00.00,0:00:00.00,style,actor,4,0,0,effect,"
+        "{TIME:1,2}text"
+    )
+
+
+def test_ass_event_cached_state_is_not_a_field() -> None:
+    """Test that cached derived values are not dataclass fields."""
+    item = AssEvent(text="test")
+    item.fingerprint  # pylint: disable=pointless-statement
+    assert "_fingerprint" not in repr(item)
+    assert not any(
+        field.name in {"_fingerprint", "_ass_line"}
+        for field in dataclasses.fields(item)
+    )
+    with pytest.raises(TypeError):
+        AssEvent(text="test", _ass_line="stale")  # type: ignore
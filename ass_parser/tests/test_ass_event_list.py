@@ -111,6 +111,26 @@ def test_ass_event_list_removal_reindex() -> None:
     assert event3.number == 2
 
 
+@pytest.mark.parametrize("index", [-10, -2, -1, 0, 1, 2, 3, 10])
+def test_ass_event_list_insertion_reindex(index: int) -> None:
+    """Test that inserting anywhere keeps event.index properties in sync."""
+    events = AssEventList(data=[AssEvent(), AssEvent(), AssEvent()])
+    events.insert(index, AssEvent())
+    assert [event.index for event in events] == list(range(len(events)))
+
+
+@pytest.mark.parametrize("index", [-3, -2, -1, 0, 1, 2])
+def test_ass_event_list_replacement_reindex(index: int) -> None:
+    """Test that replacing and removing events keeps event.index properties
+    in sync.
+    """
+    events = AssEventList(data=[AssEvent(), AssEvent(), AssEvent()])
+    events[index] = AssEvent()
+    assert [event.index for event in events] == list(range(len(events)))
+    del events[index]
+    assert [event.index for event in events] == list(range(len(events)))
+
+
 def test_ass_event_list_prev_next_ass_event_without_parent() -> None:
     """Test AssEvent.prev and AssEvent.next property without a parent list."""
     event = AssEvent()
@@ -158,6 +178,33 @@ def test_ass_event_list_pickling_preserves_event_parenthood() -> None:
     assert new_events[0].parent is not events
 
 
+def test_ass_event_list_pickling() -> None:
+    """Test that an unpickled event list has indexed events, keeps the
+    preserved source lines and links the events added later.
+    """
+    source = """[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,first
+Dialogue: 0,0:00:03.00,0:00:04.00,Default,,0,0,0,,second"""
+    events = AssEventList()
+    events.preserve_original = True
+    events.consume_ass_lines(list(enumerate(source.splitlines(), start=1)))
+    events[1].text = "changed"
+    new_events = pickle.loads(pickle.dumps(events))
+    assert new_events == events
+    assert [event.index for event in new_events] == [0, 1]
+    assert new_events.preserve_original
+    assert (
+        new_events[0]._ass_line  # pylint: disable=protected-access
+        == "Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,first"
+    )
+    assert new_events[1]._ass_line is None  # pylint: disable=protected-access
+    assert new_events[0].style_name is new_events[1].style_name
+    new_events.append(AssEvent(text="third"))
+    assert new_events[2].parent is new_events
+    assert new_events[2].index == 2
+
+
 def test_ass_event_list_default_section_name() -> None:
     """Test that AssEventList.name defaults to a generic name."""
     assert AssEventList().name == "Events"
@@ -288,3 +335,47 @@ def test_ass_event_list_equality() -> None:
     assert AssEventList(data=[AssEvent()]) != AssEventList(
         data=[AssEvent(actor="changed")]
     )
+
+
+def test_ass_event_list_fingerprint_follows_event_changes() -> None:
+    """Test that modifying an event changes the list fingerprint."""
+    events = AssEventList(data=[AssEvent(), AssEvent()])
+    fingerprint = events.fingerprint
+    events[1].text = "changed"
+    assert events.fingerprint != fingerprint
+    events[1].text = ""
+    assert events.fingerprint == fingerprint
+    del events[1]
+    assert events.fingerprint != fingerprint
+
+
+def test_ass_event_list_produce_ass_table_line() -> None:
+    """Test that events are serialized the same way as their row dicts."""
+    events = AssEventList()
+    events.append(
+        AssEvent(
+            start=1234,
+            end=5678,
+            style_name="Style, with comma",
+            actor="Ako",
+            text="text, with comma",
+            note="note\nwith {braces}",
+            effect="Banner;30",
+            layer=2,
+            margin_vertical=15,
+            is_comment=True,
+        )
+    )
+    assert events.produce_ass_table_line(events[0]) == (
+        "Comment: 2,0:00:01.23,0:00:05.67,Style; with comma,Ako,0,0,15,"
+        "Banner;30,{TIME:1234,5678}text, with comma"
+        "{NOTE:note\\\\Nwith \\[braces\\]}"
+    )
+
+
+def test_ass_event_list_produce_ass_table_line_after_change() -> None:
+    """Test that the cached event lines follow the event changes."""
+    events = AssEventList(data=[AssEvent(text="old")])
+    assert events.produce_ass_table_line(events[0]).endswith("}old")
+    events[0].text = "new"
+    assert events.produce_ass_table_line(events[0]).endswith("}new")
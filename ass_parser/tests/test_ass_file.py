@@ -1,5 +1,20 @@
 """Tests for the AssFile class."""
-from ass_parser import AssFile
+import gc
+import pickle
+import weakref
+
+import pytest
+
+from ass_parser import (
+    AssEvent,
+    AssFile,
+    AssKeyValueMapping,
+    AssRawSection,
+    AssSectionList,
+    AssStringTable,
+    read_ass,
+    write_ass,
+)
 
 
 def test_ass_file_equality() -> None:
@@ -15,3 +30,182 @@ def test_ass_file_equality() -> None:
 
     file2.script_info["key"] = "changed"
     assert file1 != file2
+
+
+def test_ass_file_fingerprint(dummy_ass_file: str) -> None:
+    """Test that file fingerprints tell whether anything changed."""
+    ass_file = read_ass(dummy_ass_file)
+    fingerprint = ass_file.fingerprint
+    assert fingerprint == read_ass(dummy_ass_file).fingerprint
+    ass_file.events[0].start += 1
+    assert ass_file.fingerprint != fingerprint
+    ass_file.events[0].start -= 1
+    assert ass_file.fingerprint == fingerprint
+    ass_file.extra_sections[0].name = "changed"
+    assert ass_file.fingerprint != fingerprint
+
+
+def test_ass_file_equality_is_exact() -> None:
+    """Test that files with fields that join into the same text are not
+    equal.
+    """
+    file1 = AssFile()
+    file2 = AssFile()
+    file1.events.append(AssEvent(text="a\x1fb", note=""))
+    file2.events.append(AssEvent(text="a", note="b\x1f"))
+    assert file1.fingerprint != file2.fingerprint
+    assert file1.events != file2.events
+    assert file1 != file2
+
+
+def test_ass_file_equality_compares_matching_contents(
+    dummy_ass_file: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that only files with different fingerprints are told apart
+    without comparing their events.
+    """
+    compared: list[AssEvent] = []
+
+    def counting_eq(self: AssEvent, other: object) -> bool:
+        compared.append(self)
+        return True
+
+    monkeypatch.setattr(AssEvent, "__eq__", counting_eq)
+    ass_file = read_ass(dummy_ass_file)
+    same = read_ass(dummy_ass_file)
+    changed = read_ass(dummy_ass_file)
+    changed.events[0].start += 1
+    assert ass_file == ass_file
+    assert ass_file != changed
+    assert not compared
+    assert ass_file.fingerprint == same.fingerprint
+    assert ass_file == same
+    assert len(compared) == len(ass_file.events)
+
+
+def test_ass_file_string_table_edit_in_place(dummy_ass_file: str) -> None:
+    """Test that changing a string table row in place changes the file."""
+    ass_file = read_ass(dummy_ass_file)
+    fingerprint = ass_file.fingerprint
+    table = ass_file.extra_sections[1]
+    assert isinstance(table, AssStringTable)
+    key = next(iter(table[0][1]))
+    table[0][1][key] = "changed"
+    assert ass_file.fingerprint != fingerprint
+    assert ass_file != read_ass(dummy_ass_file)
+
+
+def test_ass_file_snapshot(dummy_ass_file: str) -> None:
+    """Test that ASS file snapshots do not change with the file."""
+    ass_file = read_ass(dummy_ass_file)
+    expected = write_ass(ass_file)
+    snapshot = ass_file.snapshot()
+    ass_file.script_info["Title"] = "changed"
+    ass_file.styles[0].name = "changed"
+    ass_file.events[0].text = "changed"
+    ass_file.events.append(AssEvent())
+    del ass_file.extra_sections[0]
+    assert snapshot.script_info["Title"] == "Default Aegisub file"
+    assert write_ass(snapshot.to_ass_file()) == expected
+    assert write_ass(ass_file) != expected
+
+
+def test_ass_file_snapshot_extra_sections(dummy_ass_file: str) -> None:
+    """Test that snapshots share the extra sections until they change."""
+    ass_file = read_ass(dummy_ass_file)
+    garbage = ass_file.extra_sections[0]
+    table = ass_file.extra_sections[1]
+    assert isinstance(garbage, AssKeyValueMapping)
+    assert isinstance(table, AssStringTable)
+    snapshot = ass_file.snapshot()
+    expected = list(snapshot.extra_sections)
+    garbage.name = "renamed"
+    garbage["Video File"] = "changed"
+    key = next(iter(table[0][1]))
+    table[0][1][key] = "changed"
+    assert list(snapshot.extra_sections) == expected
+    assert snapshot.extra_sections[0].name == "Aegisub Project Garbage"
+    assert snapshot.extra_sections[0] != garbage
+    assert snapshot.extra_sections[1] != table
+
+
+def test_ass_file_snapshot_keeps_raw_sections(dummy_ass_file: str) -> None:
+    """Test that snapshots do not parse the raw extra sections."""
+    ass_file = read_ass(dummy_ass_file, raw_extra_sections=True)
+    expected = write_ass(ass_file)
+    snapshot = ass_file.snapshot()
+    assert all(
+        isinstance(section, AssRawSection)
+        for section in ass_file.extra_sections.iter_stored()
+    )
+    assert all(
+        not isinstance(section, AssRawSection)
+        for section in snapshot.extra_sections
+    )
+    assert write_ass(snapshot.to_ass_file()) == expected
+
+
+def test_ass_file_pickling(dummy_ass_file: str) -> None:
+    """Test that an unpickled ASS file shares a single string pool."""
+    ass_file = read_ass(dummy_ass_file)
+    new_ass_file = pickle.loads(pickle.dumps(ass_file))
+    assert new_ass_file == ass_file
+    assert new_ass_file.events.string_pool is new_ass_file.string_pool
+    assert new_ass_file.styles.string_pool is new_ass_file.string_pool
+    assert new_ass_file.events[0].style_name is new_ass_file.styles[0].name
+    assert new_ass_file.events[0].parent is new_ass_file.events
+
+
+def test_ass_file_freeze(dummy_ass_file: str) -> None:
+    """Test that frozen ASS files are hashable and thaw back to equal files."""
+    ass_file = read_ass(dummy_ass_file)
+    expected = write_ass(ass_file)
+    frozen = ass_file.freeze()
+    assert frozen == read_ass(dummy_ass_file).freeze()
+    assert hash(frozen) == hash(read_ass(dummy_ass_file).freeze())
+    assert frozen.events[0].to_event() == ass_file.events[0]
+    ass_file.events[0].text = "changed"
+    assert frozen != ass_file.freeze()
+    assert frozen.events[0].text != "changed"
+
+    thawed = frozen.thaw()
+    assert write_ass(thawed) == expected
+    assert thawed.events[0].parent is thawed.events
+    assert thawed.events[0].style_name is thawed.styles[0].name
+    thawed.events.append(AssEvent())
+    assert thawed.events[-1].index == len(thawed.events) - 1
+
+
+def test_ass_file_extra_sections_assignment(dummy_ass_file: str) -> None:
+    """Test that extra sections can be replaced with a plain list."""
+    ass_file = read_ass(dummy_ass_file)
+    expected = write_ass(ass_file)
+    frozen = ass_file.freeze()
+    sections = list(ass_file.extra_sections)
+    ass_file.extra_sections = sections
+    assert isinstance(ass_file.extra_sections, AssSectionList)
+    assert list(ass_file.extra_sections) == sections
+    assert write_ass(ass_file) == expected
+    assert ass_file.freeze() == frozen
+    assert ass_file.snapshot().to_ass_file() == ass_file
+
+
+def test_ass_file_freed_without_gc(dummy_ass_file: str) -> None:
+    """Test that ASS files do not form reference cycles, so that they are
+    freed as soon as they are dropped.
+    """
+    ass_file = read_ass(dummy_ass_file)
+    assert gc.isenabled()
+    event = ass_file.events[0]
+    refs = [
+        weakref.ref(obj)
+        for obj in (ass_file, ass_file.events, ass_file.styles[0], event)
+    ]
+    gc.disable()
+    try:
+        del ass_file
+        assert event.parent is None
+        del event
+        assert all(ref() is None for ref in refs)
+    finally:
+        gc.enable()
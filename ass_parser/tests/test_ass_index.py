@@ -0,0 +1,112 @@
+"""Tests for the AssIndex class and sidecar index files."""
+import os
+from pathlib import Path
+
+import pytest
+
+from ass_parser import (
+    AssEvent,
+    AssFile,
+    AssIndex,
+    AssMappedFile,
+    AssStyle,
+    ass_index,
+    write_ass,
+)
+from ass_parser.ass_index import index_path_for
+
+
+@pytest.fixture(name="path")
+def fixture_path(tmp_path: Path) -> Path:
+    """Create an ASS file with five events, one of them late."""
+    ass_file = AssFile()
+    ass_file.styles.append(AssStyle(name="Default"))
+    for i in range(5):
+        ass_file.events.append(
+            AssEvent(start=i * 1000, end=i * 1000 + 500, text=str(i))
+        )
+    ass_file.events[2].end = 100_000
+    path = tmp_path / "test.ass"
+    write_ass(ass_file, path)
+    return path
+
+
+def test_sidecar_index(path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the sidecar index is created and used on reopening."""
+    monkeypatch.setattr(ass_index, "EVENT_BLOCK_SIZE", 2)
+    with AssMappedFile(path, use_index=True) as mapped:
+        expected = list(mapped.events)
+        assert mapped.index.block_times is not None
+        assert list(mapped.index.block_times) == [
+            0,
+            1509,
+            2000,
+            100_009,
+            4000,
+            4509,
+        ]
+    assert index_path_for(path).exists()
+
+    def fail(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("the file should not be scanned")
+
+    with monkeypatch.context() as context:
+        context.setattr(AssIndex, "scan", fail)
+        with AssMappedFile(path, use_index=True) as mapped:
+            assert list(mapped.events) == expected
+
+
+def test_stale_sidecar_index(path: Path) -> None:
+    """Test that out of date and corrupt sidecar indexes are rebuilt."""
+    AssMappedFile(path, use_index=True).close()
+    index_path = index_path_for(path)
+    saved = index_path.read_bytes()
+
+    path.write_text(
+        path.read_text().replace("Dialogue: 0,0:00:04", "Dialogue: 0,0:00:05")
+    )
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    with AssMappedFile(path, use_index=True) as mapped:
+        assert mapped.events[4].start == 5000
+    assert index_path.read_bytes() != saved
+
+    index_path.write_bytes(saved[:40])
+    with AssMappedFile(path, use_index=True) as mapped:
+        assert mapped.events[4].start == 5000
+
+
+def test_failed_sidecar_index_save(
+    path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that failing to save the sidecar index leaves no files
+    behind.
+    """
+
+    def fail(*_args: object, **_kwargs: object) -> None:
+        raise OSError("read-only location")
+
+    monkeypatch.setattr(os, "replace", fail)
+    with AssMappedFile(path, use_index=True) as mapped:
+        assert len(mapped.events) == 5
+    assert sorted(path.parent.iterdir()) == [path]
+
+
+@pytest.mark.parametrize("use_index", [False, True])
+def test_iter_time_range(
+    path: Path, monkeypatch: pytest.MonkeyPatch, use_index: bool
+) -> None:
+    """Test that time windows skip the blocks of events outside of them."""
+    monkeypatch.setattr(ass_index, "EVENT_BLOCK_SIZE", 2)
+    with AssMappedFile(path, use_index=use_index) as mapped:
+        decoded: list[int] = []
+        decode_event = mapped.events._decode_event
+
+        def spy(index: int) -> AssEvent:
+            decoded.append(index)
+            return decode_event(index)
+
+        monkeypatch.setattr(mapped.events, "_decode_event", spy)
+        events = list(mapped.events.iter_time_range(3500, 5000))
+        assert [event.text for event in events] == ["2", "4"]
+        assert decoded == ([2, 3, 4] if use_index else [0, 1, 2, 3, 4])
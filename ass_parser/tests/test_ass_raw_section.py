@@ -0,0 +1,117 @@
+"""Tests for the AssRawSection class."""
+from ass_parser import (
+    AssKeyValueMapping,
+    AssRawSection,
+    AssStringTable,
+    read_ass,
+    write_ass,
+)
+
+SOURCE = """[Script Info]
+Title: Test
+
+[Aegisub Project Garbage]
+Video Zoom Percent:0.375000
+Scroll Position: 33
+
+[Favorite Meals]
+Format: Name, Rating
+Cuisine: Pizza, 10
+"""
+
+
+def test_raw_sections_are_not_parsed_until_accessed() -> None:
+    """Test that raw sections are kept unparsed and written verbatim."""
+    ass_file = read_ass(SOURCE, raw_extra_sections=True)
+    raw_sections = list(ass_file.extra_sections.iter_stored())
+    assert all(isinstance(section, AssRawSection) for section in raw_sections)
+    assert [section.name for section in raw_sections] == [
+        "Aegisub Project Garbage",
+        "Favorite Meals",
+    ]
+    assert write_ass(ass_file).endswith(SOURCE[SOURCE.index("\n[Aegisub") :])
+
+
+def test_raw_sections_are_parsed_on_access() -> None:
+    """Test that accessing a raw section parses it."""
+    ass_file = read_ass(SOURCE, raw_extra_sections=True)
+    garbage = ass_file.extra_sections[0]
+    assert isinstance(garbage, AssKeyValueMapping)
+    assert garbage["Scroll Position"] == "33"
+    meals = ass_file.extra_sections[1]
+    assert isinstance(meals, AssStringTable)
+    assert meals[0] == ("Cuisine", {"Name": "Pizza", "Rating": " 10"})
+    assert ass_file.extra_sections[0] is garbage
+
+
+def test_parsed_raw_sections_are_written_verbatim_until_modified() -> None:
+    """Test that parsed raw sections keep their source text until they
+    change.
+    """
+    ass_file = read_ass(SOURCE, raw_extra_sections=True)
+    garbage = ass_file.extra_sections[0]
+    assert isinstance(garbage, AssKeyValueMapping)
+    assert "Video Zoom Percent:0.375000" in write_ass(ass_file)
+    garbage["Scroll Position"] = "34"
+    result = write_ass(ass_file)
+    assert "Video Zoom Percent: 0.375000" in result
+    assert "Scroll Position: 34" in result
+
+
+def test_section_list_accessors_parse_raw_sections() -> None:
+    """Test that no list accessor exposes raw sections."""
+    ass_file = read_ass(SOURCE, raw_extra_sections=True)
+    sections = ass_file.extra_sections
+    copy = sections.copy()
+    assert not any(isinstance(section, AssRawSection) for section in copy)
+    assert not any(
+        isinstance(section, AssRawSection) for section in reversed(sections)
+    )
+    assert sections == read_ass(SOURCE).extra_sections
+    meals = sections.pop()
+    assert isinstance(meals, AssStringTable)
+    assert meals not in sections
+    assert sections.index(sections[0]) == 0
+
+
+def test_parsed_raw_sections_preserve_original() -> None:
+    """Test that raw sections parse with the preserve_original setting of
+    the file.
+    """
+    ass_file = read_ass(
+        SOURCE, raw_extra_sections=True, preserve_original=True
+    )
+    garbage = ass_file.extra_sections[0]
+    assert isinstance(garbage, AssKeyValueMapping)
+    garbage["Scroll Position"] = "34"
+    result = write_ass(ass_file)
+    assert "Video Zoom Percent:0.375000" in result
+    assert "Scroll Position: 34" in result
+
+
+def test_parsed_raw_tables_edited_in_place() -> None:
+    """Test that changing a row of a parsed raw table in place is written."""
+    ass_file = read_ass(SOURCE, raw_extra_sections=True)
+    meals = ass_file.extra_sections[1]
+    assert isinstance(meals, AssStringTable)
+    assert "Cuisine: Pizza, 10" in write_ass(ass_file)
+    meals[0][1]["Rating"] = "11"
+    assert "Cuisine: Pizza,11" in write_ass(ass_file)
+
+
+def test_fingerprint_does_not_parse_raw_sections() -> None:
+    """Test that the file fingerprint leaves raw sections unparsed, and that
+    parsing them does not change it.
+    """
+    ass_file = read_ass(SOURCE, raw_extra_sections=True)
+    fingerprint = ass_file.fingerprint
+    assert all(
+        isinstance(section, AssRawSection)
+        for section in ass_file.extra_sections.iter_stored()
+    )
+    table = ass_file.extra_sections[1]
+    assert isinstance(table, AssStringTable)
+    assert ass_file.fingerprint == fingerprint
+    table[0][1]["Rating"] = "9"
+    assert ass_file.fingerprint != fingerprint
+    assert write_ass(ass_file) != SOURCE
@@ -1,7 +1,11 @@
 """Tests for the AssStyle class."""
+import dataclasses
 from unittest.mock import Mock
 
-from ass_parser import AssStyle
+import pytest
+
+from ass_parser import AssStyle, AssStyleRecord
+from ass_parser.util import content_positions
 
 
 def test_ass_style_default_properties() -> None:
@@ -76,3 +80,21 @@ def test_ass_style_equality() -> None:
     assert style1 == style2
     style1.name = "changed"
     assert style1 != style2
+
+
+def test_ass_style_record_fields() -> None:
+    """Test that the record fields follow the style content_key() order."""
+    assert tuple(content_positions(AssStyle)) == AssStyleRecord._fields
+
+
+def test_ass_style_cached_state_is_not_a_field() -> None:
+    """Test that cached derived values are not dataclass fields."""
+    item = AssStyle(name="test")
+    item.fingerprint  # pylint: disable=pointless-statement
+    assert "_fingerprint" not in repr(item)
+    assert not any(
+        field.name in {"_fingerprint", "_ass_line"}
+        for field in dataclasses.fields(item)
+    )
+    with pytest.raises(TypeError):
+        AssStyle(name="test", _ass_line="stale")  # type: ignore
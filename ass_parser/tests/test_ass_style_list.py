@@ -229,3 +229,15 @@ def test_ass_style_list_equality() -> None:
     assert AssStyleList(data=[AssStyle(name="dummy style")]) != AssStyleList(
         data=[AssStyle(name="changed")]
     )
+
+
+def test_ass_style_list_produce_ass_table_line_after_change() -> None:
+    """Test that the cached style lines follow the style changes."""
+    styles = AssStyleList(data=[AssStyle(name="Default")])
+    assert styles.produce_ass_table_line(styles[0]).startswith(
+        "Style: Default,Arial,20,"
+    )
+    styles[0].scale(2)
+    assert styles.produce_ass_table_line(styles[0]).startswith(
+        "Style: Default,Arial,40,"
+    )
@@ -0,0 +1,60 @@
+"""Tests for the batch module."""
+from pathlib import Path
+
+from ass_parser import (
+    CorruptAssLineError,
+    read_ass,
+    read_ass_many,
+    write_ass,
+    write_ass_many,
+)
+
+
+def test_read_ass_many(dummy_ass_file: str, tmp_path: Path) -> None:
+    """Test that files are read in workers and that errors do not abort the
+    batch.
+    """
+    good_paths = [tmp_path / f"{i}.ass" for i in range(3)]
+    for path in good_paths:
+        path.write_text(dummy_ass_file, encoding="utf-8")
+    bad_path = tmp_path / "bad.ass"
+    bad_path.write_text("no sections")
+    missing_path = tmp_path / "missing.ass"
+
+    results = {
+        result.path: result
+        for result in read_ass_many(
+            [bad_path, *good_paths, missing_path], workers=2
+        )
+    }
+
+    expected = read_ass(dummy_ass_file)
+    for path in good_paths:
+        assert results[path].error is None
+        assert results[path].ass_file == expected
+    assert isinstance(results[bad_path].error, CorruptAssLineError)
+    assert "no sections" in str(results[bad_path].error)
+    assert isinstance(results[missing_path].error, FileNotFoundError)
+    assert results[missing_path].ass_file is None
+
+
+def test_write_ass_many(dummy_ass_file: str, tmp_path: Path) -> None:
+    """Test that files are written in workers and that errors do not abort
+    the batch.
+    """
+    ass_file = read_ass(dummy_ass_file)
+    paths = [tmp_path / f"{i}.ass" for i in range(3)]
+    bad_path = tmp_path / "missing" / "bad.ass"
+
+    results = list(
+        write_ass_many(
+            [(ass_file, path) for path in [*paths, bad_path]], workers=2
+        )
+    )
+
+    assert len(results) == 4
+    errors = {result.path: result.error for result in results}
+    assert isinstance(errors.pop(bad_path), FileNotFoundError)
+    assert errors == dict.fromkeys(paths)
+    for path in paths:
+        assert path.read_text(encoding="utf-8") == write_ass(ass_file)
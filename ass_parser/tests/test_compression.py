@@ -0,0 +1,115 @@
+"""Tests for the transparent compression of ASS files."""
+import asyncio
+import bz2
+import gzip
+import io
+import lzma
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+
+from ass_parser import read_ass, read_ass_async, write_ass, write_ass_async
+
+DECOMPRESSORS: dict[str, Callable[[bytes], bytes]] = {
+    "gz": gzip.decompress,
+    "xz": lzma.decompress,
+    "bz2": bz2.decompress,
+}
+COMPRESSORS: dict[str, Callable[[bytes], bytes]] = {
+    "gz": gzip.compress,
+    "xz": lzma.compress,
+    "bz2": bz2.compress,
+}
+
+
+@pytest.mark.parametrize("compression", ["gz", "xz", "bz2"])
+def test_compressed_path(
+    dummy_ass_file: str, tmp_path: Path, compression: str
+) -> None:
+    """Test that paths with compression suffixes are compressed on write
+    and decompressed on read.
+    """
+    ass_file = read_ass(dummy_ass_file)
+    path = tmp_path / f"test.ass.{compression}"
+    write_ass(ass_file, path)
+    decompress = DECOMPRESSORS[compression]
+    assert decompress(path.read_bytes()).decode() == write_ass(ass_file)
+    assert read_ass(path) == ass_file
+
+
+@pytest.mark.parametrize("compression", ["gz", "xz", "bz2", None])
+def test_binary_stream(dummy_ass_file: str, compression: str) -> None:
+    """Test that binary streams get decompressed according to their magic
+    number and compressed on request, and that they are left open.
+    """
+    ass_file = read_ass(dummy_ass_file)
+    with io.BytesIO() as handle:
+        write_ass(ass_file, handle, compression=compression)
+        data = handle.getvalue()
+    text = write_ass(ass_file).encode()
+    if compression:
+        assert DECOMPRESSORS[compression](data) == text
+    else:
+        assert data == text
+
+    with io.BytesIO(data) as handle:
+        assert read_ass(handle) == ass_file
+        assert not handle.closed
+
+
+def test_non_seekable_binary_stream(dummy_ass_file: str) -> None:
+    """Test that detecting the compression does not need seeking."""
+
+    class Pipe(io.BytesIO):
+        def seekable(self) -> bool:
+            return False
+
+        def seek(self, *_args: Any) -> int:
+            raise OSError("not seekable")
+
+        def read(self, size: Optional[int] = -1) -> bytes:
+            # short reads, like a pipe
+            if size is not None and size > 0:
+                size = 1
+            return super().read(size)
+
+    data = COMPRESSORS["gz"](dummy_ass_file.encode())
+    assert read_ass(Pipe(data)) == read_ass(dummy_ass_file)
+
+
+def test_unknown_compression(dummy_ass_file: str) -> None:
+    """Test that an unknown compression raises an error."""
+    with pytest.raises(ValueError):
+        write_ass(read_ass(dummy_ass_file), io.BytesIO(), compression="zip")
+
+
+def test_compression_of_other_targets(
+    dummy_ass_file: str, tmp_path: Path
+) -> None:
+    """Test that compression is refused for targets that cannot honour it."""
+    ass_file = read_ass(dummy_ass_file)
+    path = tmp_path / "test.ass"
+    for target in [path, io.StringIO(), None]:
+        with pytest.raises(ValueError):
+            write_ass(ass_file, target, compression="gz")  # type: ignore
+        with pytest.raises(ValueError):
+            asyncio.run(
+                write_ass_async(
+                    ass_file, target, compression="gz"  # type: ignore
+                )
+            )
+    assert not path.exists()
+
+
+def test_compressed_async(dummy_ass_file: str, tmp_path: Path) -> None:
+    """Test that the asynchronous functions handle compression too."""
+    ass_file = read_ass(dummy_ass_file)
+    path = tmp_path / "test.ass.xz"
+    asyncio.run(write_ass_async(ass_file, path))
+    assert asyncio.run(read_ass_async(path)) == ass_file
+    with io.BytesIO() as handle:
+        asyncio.run(write_ass_async(ass_file, handle, compression="gz"))
+        handle.seek(0)
+        assert asyncio.run(read_ass_async(handle)) == ass_file
@@ -0,0 +1,98 @@
+"""Tests for the diff_ass function."""
+from copy import copy
+
+from ass_parser import AssEvent, AssFile, AssStyle, diff_ass
+
+
+def make_ass_file(texts: list[str]) -> AssFile:
+    """Create an ASS file with one event per text.
+
+    :param texts: event texts
+    :return: ASS file
+    """
+    ass_file = AssFile()
+    ass_file.styles.append(AssStyle(name="Default"))
+    for i, text in enumerate(texts):
+        ass_file.events.append(AssEvent(start=i * 1000, text=text))
+    return ass_file
+
+
+def test_diff_ass_equal_files() -> None:
+    """Test that diffing equal files gives no differences."""
+    diff = diff_ass(make_ass_file(["a", "b"]), make_ass_file(["a", "b"]))
+    assert diff.is_empty
+
+
+def test_diff_ass_inserted_and_deleted_events() -> None:
+    """Test that added and removed events are reported."""
+    old = make_ass_file(["a", "b", "c"])
+    new = make_ass_file(["a", "b", "c"])
+    del new.events[1]
+    new.events.append(AssEvent(start=5000, text="d"))
+    diff = diff_ass(old, new)
+    assert [(i, event.text) for i, event in diff.events.deleted] == [(1, "b")]
+    assert [(i, event.text) for i, event in diff.events.inserted] == [(2, "d")]
+    assert not diff.events.modified
+    assert not diff.events.moved
+
+
+def test_diff_ass_modified_events() -> None:
+    """Test that modified events are reported with the changed fields."""
+    old = make_ass_file(["a", "b", "c"])
+    new = make_ass_file(["a", "b", "c"])
+    new.events[1].text = "B"
+    new.events[1].actor = "Ako"
+    diff = diff_ass(old, new)
+    assert not diff.events.inserted
+    assert not diff.events.deleted
+    assert len(diff.events.modified) == 1
+    modification = diff.events.modified[0]
+    assert modification.old_index == 1
+    assert modification.new_index == 1
+    assert modification.changes == {
+        "text": ("b", "B"),
+        "actor": ("", "Ako"),
+    }
+
+
+def test_diff_ass_moved_events() -> None:
+    """Test that reordered events are reported as moved."""
+    old = make_ass_file(["a", "b", "c", "d"])
+    new = AssFile()
+    for i in (3, 0, 1, 2):
+        new.events.append(copy(old.events[i]))
+    diff = diff_ass(old, new)
+    assert diff.events.moved == [(3, 0)]
+    assert not diff.events.inserted
+    assert not diff.events.deleted
+    assert not diff.events.modified
+
+
+def test_diff_ass_styles_matched_by_name() -> None:
+    """Test that styles are matched by their names regardless of order."""
+    old = AssFile()
+    old.styles.append(AssStyle(name="Default"))
+    old.styles.append(AssStyle(name="Signs"))
+    new = AssFile()
+    new.styles.append(AssStyle(name="Signs", font_size=40))
+    new.styles.append(AssStyle(name="Default"))
+    diff = diff_ass(old, new)
+    assert len(diff.styles.modified) == 1
+    modification = diff.styles.modified[0]
+    assert (modification.old_index, modification.new_index) == (1, 0)
+    assert modification.changes == {"font_size": (20, 40)}
+    assert not diff.styles.inserted
+    assert not diff.styles.deleted
+
+
+def test_diff_ass_script_info() -> None:
+    """Test that script info changes are reported per key."""
+    old = AssFile()
+    old.script_info.update({"Title": "Old", "PlayResX": "640"})
+    new = AssFile()
+    new.script_info.update({"Title": "New", "PlayResY": "480"})
+    assert diff_ass(old, new).script_info == {
+        "Title": ("Old", "New"),
+        "PlayResX": ("640", None),
+        "PlayResY": (None, "480"),
+    }
@@ -0,0 +1,78 @@
+"""Tests for the AssMappedFile class."""
+from pathlib import Path
+
+import pytest
+
+from ass_parser import AssMappedFile, CorruptAssLineError, read_ass
+
+
+def test_mapped_file(tmp_path: Path, dummy_ass_file: str) -> None:
+    """Test that events are decoded on demand from all [Events] sections of
+    concatenated files.
+    """
+    path = tmp_path / "dump.ass"
+    path.write_bytes(dummy_ass_file.replace("\n", "\r\n").encode() * 3)
+    expected = list(read_ass(dummy_ass_file).events) * 3
+    with AssMappedFile(path, cache_size=2) as mapped:
+        assert mapped.script_info["Title"] == "Default Aegisub file"
+        assert len(mapped.styles) == 3
+        assert [name for name, _start, _end in mapped.sections][:4] == [
+            "Script Info",
+            "Aegisub Project Garbage",
+            "V4+ Styles",
+            "Events",
+        ]
+        assert len(mapped.events) == len(expected)
+        assert mapped.events[-1] == expected[-1]
+        assert mapped.events[1:5] == expected[1:5]
+        assert list(mapped.events) == expected
+        assert mapped.events[0] is mapped.events[0]
+        assert len(mapped.events._cache) == 2
+        assert mapped.events[0].parent is None
+        assert mapped.events.read_line(0).startswith("Dialogue: 0,")
+        with pytest.raises(IndexError):
+            mapped.events[len(expected)]
+
+
+def test_mapped_file_corrupt_event(tmp_path: Path) -> None:
+    """Test that corrupt events raise an error once decoded."""
+    path = tmp_path / "corrupt.ass"
+    path.write_text(
+        "[Events]\nFormat: Start, End, Text\n"
+        "Dialogue: 0:00:00.00,0:00:01.00,ok\nDialogue: bad\n"
+    )
+    with AssMappedFile(path) as mapped:
+        assert len(mapped.events) == 2
+        with pytest.raises(CorruptAssLineError) as exc_info:
+            mapped.events[1]
+        assert exc_info.value.line_num == 4
+
+
+def test_mapped_file_requires_ascii_compatible_encoding(
+    tmp_path: Path,
+) -> None:
+    """Test that UTF-16 files are rejected."""
+    path = tmp_path / "utf16.ass"
+    path.write_text("[Script Info]\n", encoding="utf-16")
+    with pytest.raises(ValueError):
+        AssMappedFile(path)
+
+
+def test_mapped_file_attachment_data_ends_at_heading(tmp_path: Path) -> None:
+    """Test that headings that look like encoded data are told apart from
+    attachment data the same way as by read_ass().
+    """
+    text = (
+        "[Fonts]\nfontname: a.ttf\n[AB]\nfontname: b.ttf\n;;;;\n"
+        "[AEGISUB]\nKey: value\n"
+    )
+    path = tmp_path / "fonts.ass"
+    path.write_text(text)
+    with AssMappedFile(path) as mapped:
+        assert [name for name, _start, _end in mapped.sections] == [
+            section.name for section in read_ass(text).extra_sections
+        ]
+        assert [name for name, _start, _end in mapped.sections] == [
+            "Fonts",
+            "AEGISUB",
+        ]
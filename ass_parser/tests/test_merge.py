@@ -0,0 +1,145 @@
+"""Tests for the merge_ass function."""
+from ass_parser import (
+    AssEvent,
+    AssFile,
+    AssMergeConflict,
+    AssStringTable,
+    AssStyle,
+    merge_ass,
+    read_ass,
+    write_ass,
+)
+
+
+def make_ass_file(texts: list[str]) -> AssFile:
+    """Create an ASS file with one event per text.
+
+    :param texts: event texts
+    :return: ASS file
+    """
+    ass_file = AssFile()
+    ass_file.script_info["Title"] = "Test"
+    ass_file.styles.append(AssStyle(name="Default"))
+    for i, text in enumerate(texts):
+        ass_file.events.append(AssEvent(start=i * 1000, text=text))
+    return ass_file
+
+
+def test_merge_ass_unchanged(dummy_ass_file: str) -> None:
+    """Test that merging three equal revisions gives the same file."""
+    result = merge_ass(
+        read_ass(dummy_ass_file),
+        read_ass(dummy_ass_file),
+        read_ass(dummy_ass_file),
+    )
+    assert not result.conflicts
+    assert write_ass(result.ass_file) == write_ass(read_ass(dummy_ass_file))
+
+
+def test_merge_ass_combines_event_changes() -> None:
+    """Test that changes to different events and fields are combined."""
+    base = make_ass_file(["a", "b", "c", "d"])
+    ours = make_ass_file(["a", "b", "c", "d"])
+    theirs = make_ass_file(["a", "b", "c", "d"])
+    ours.events[0].text = "A"
+    ours.events[1].actor = "Ako"
+    del ours.events[3]
+    theirs.events[1].text = "B"
+    theirs.events.insert(3, AssEvent(start=2500, text="c2"))
+
+    result = merge_ass(base, ours, theirs)
+
+    assert not result.conflicts
+    assert [(event.text, event.actor) for event in result.ass_file.events] == [
+        ("A", ""),
+        ("B", "Ako"),
+        ("c", ""),
+        ("c2", ""),
+    ]
+
+
+def test_merge_ass_same_insertion_on_both_sides() -> None:
+    """Test that an event inserted identically on both sides appears once."""
+    base = make_ass_file(["a"])
+    ours = make_ass_file(["a", "b"])
+    theirs = make_ass_file(["a", "b"])
+    result = merge_ass(base, ours, theirs)
+    assert not result.conflicts
+    assert [event.text for event in result.ass_file.events] == ["a", "b"]
+
+
+def test_merge_ass_field_conflict() -> None:
+    """Test that conflicting field changes keep our value."""
+    base = make_ass_file(["a", "b"])
+    ours = make_ass_file(["a", "ours"])
+    theirs = make_ass_file(["a", "theirs"])
+    result = merge_ass(base, ours, theirs)
+    assert result.conflicts == [
+        AssMergeConflict(
+            section="Events",
+            key=1,
+            field="text",
+            base="b",
+            ours="ours",
+            theirs="theirs",
+        )
+    ]
+    assert result.ass_file.events[1].text == "ours"
+
+
+def test_merge_ass_delete_modify_conflict() -> None:
+    """Test that deleting an event modified on the other side conflicts."""
+    base = make_ass_file(["a", "b"])
+    ours = make_ass_file(["a"])
+    theirs = make_ass_file(["a", "B"])
+    result = merge_ass(base, ours, theirs)
+    assert len(result.conflicts) == 1
+    assert result.conflicts[0].field is None
+    assert result.conflicts[0].ours is None
+    assert [event.text for event in result.ass_file.events] == ["a"]
+
+
+def test_merge_ass_styles_and_script_info() -> None:
+    """Test merging styles and script info."""
+    base = make_ass_file([])
+    ours = make_ass_file([])
+    theirs = make_ass_file([])
+    ours.styles[0].font_size = 40
+    theirs.styles[0].italic = True
+    theirs.styles.append(AssStyle(name="Signs"))
+    ours.script_info["PlayResX"] = "1920"
+    theirs.script_info["Title"] = "New"
+
+    result = merge_ass(base, ours, theirs)
+
+    assert not result.conflicts
+    assert dict(result.ass_file.script_info) == {
+        "Title": "New",
+        "PlayResX": "1920",
+    }
+    assert [style.name for style in result.ass_file.styles] == [
+        "Default",
+        "Signs",
+    ]
+    assert result.ass_file.styles[0].font_size == 40
+    assert result.ass_file.styles[0].italic
+
+
+def test_merge_ass_extra_sections() -> None:
+    """Test merging extra sections."""
+    base = make_ass_file([])
+    ours = make_ass_file([])
+    theirs = make_ass_file([])
+    sections = []
+    for ass_file in (base, ours, theirs):
+        section = AssStringTable(name="Fonts")
+        section.append(("Font", {"Name": "a"}))
+        ass_file.extra_sections.append(section)
+        sections.append(section)
+    sections[2].append(("Font", {"Name": "b"}))
+    result = merge_ass(base, ours, theirs)
+    assert not result.conflicts
+    assert len(result.ass_file.extra_sections) == 1
+    assert result.ass_file.extra_sections[0].to_ass_string() == (
+        sections[2].to_ass_string()
+    )
@@ -1,8 +1,13 @@
 """Tests for the Observable class."""
+import gc
 import pickle
+import tracemalloc
+import weakref
 from copy import deepcopy
 from unittest.mock import Mock
 
+import pytest
+
 from ass_parser.observable import Event, Observable
 
 
@@ -87,3 +92,131 @@ def test_unpickled_observable_still_works() -> None:
     assert clone.prop == 6
     subscriber.assert_not_called()
     clone_subscriber.assert_called_once()
+
+
+class DummyView:
+    """Dummy consumer of object changes."""
+
+    def __init__(self) -> None:
+        self.events: list[DummyEvent] = []
+
+    def on_change(self, event: DummyEvent) -> None:
+        """Record the event.
+
+        :param event: change event
+        """
+        self.events.append(event)
+
+
+def test_unsubscribing_with_handle() -> None:
+    """Test that the handle returned by subscribe() unsubscribes the
+    callback.
+    """
+    subscriber = Mock()
+    obj = DummyObject(5)
+    subscription = obj.changed.subscribe(subscriber)
+    assert subscription.is_active
+    subscription.unsubscribe()
+    assert not subscription.is_active
+    obj.prop = 6
+    subscriber.assert_not_called()
+    subscription.unsubscribe()
+
+
+def test_unsubscribing_with_context_manager() -> None:
+    """Test that leaving the handle context unsubscribes the callback."""
+    subscriber = Mock()
+    obj = DummyObject(5)
+    with obj.changed.subscribe(subscriber):
+        obj.prop = 6
+    obj.prop = 7
+    subscriber.assert_called_once()
+
+
+def test_unsubscribing_bound_method() -> None:
+    """Test unsubscribing a bound method by value."""
+    obj = DummyObject(5)
+    view = DummyView()
+    obj.changed.subscribe(view.on_change)
+    obj.changed.unsubscribe(view.on_change)
+    obj.prop = 6
+    assert not view.events
+    assert not obj.changed.callbacks
+    with pytest.raises(ValueError):
+        obj.changed.unsubscribe(view.on_change)
+
+
+def test_unsubscribing_while_emitting() -> None:
+    """Test that unsubscribing during an emit does not skip other
+    subscribers.
+    """
+    obj = DummyObject(5)
+    subscriber = Mock()
+    subscription = obj.changed.subscribe(
+        lambda _event: subscription.unsubscribe()
+    )
+    obj.changed.subscribe(subscriber)
+    obj.prop = 6
+    subscriber.assert_called_once()
+    assert len(obj.changed.callbacks) == 1
+
+
+def test_weak_subscription() -> None:
+    """Test that weak subscriptions do not keep their objects alive and are
+    pruned once the objects die.
+    """
+    obj = DummyObject(5)
+    view = DummyView()
+    subscription = obj.changed.subscribe(view.on_change, weak=True)
+    obj.prop = 6
+    assert len(view.events) == 1
+    view_ref = weakref.ref(view)
+    del view
+    assert view_ref() is None
+    assert not subscription.is_active
+    assert not obj.changed.callbacks
+    obj.prop = 7
+
+
+def test_subscription_does_not_keep_observable_alive() -> None:
+    """Test that subscription handles do not reference observables
+    strongly.
+    """
+    obj = DummyObject(5)
+    subscription = obj.changed.subscribe(Mock())
+    obj_ref = weakref.ref(obj)
+    del obj
+    gc.collect()
+    assert obj_ref() is None
+    assert not subscription.is_active
+    subscription.unsubscribe()
+
+
+@pytest.mark.parametrize("weak", [False, True])
+def test_subscription_memory_stays_flat(weak: bool) -> None:
+    """Test that repeatedly subscribing and tearing down consumers does not
+    leak memory.
+
+    :param weak: whether to subscribe weakly and just drop the consumers
+    """
+
+    def cycle() -> None:
+        view = DummyView()
+        subscription = obj.changed.subscribe(view.on_change, weak=weak)
+        obj.prop += 1
+        if not weak:
+            subscription.unsubscribe()
+
+    obj = DummyObject(0)
+    for _ in range(100):
+        cycle()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(10_000):
+            cycle()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert not obj.changed.callbacks
+    assert after - before < 10_000
@@ -1,6 +1,8 @@
 """Tests for the ObservableObjectMixin class."""
+import copy
+import pickle
 from dataclasses import dataclass
-from typing import Type
+from typing import Any, Callable, Type
 from unittest.mock import Mock
 
 import pytest
@@ -46,3 +48,71 @@ def test_throttling_property_updates(cls: Type[DummyObject]) -> None:
     subscriber.assert_not_called()
     obj.end_update()
     subscriber.assert_called_once()
+
+
+def test_construction_does_not_track_changes() -> None:
+    """Test that dataclass construction does not trigger change callbacks."""
+    after_change = Mock()
+
+    @dataclass
+    class CountingObject(DummyDataclassObject):
+        """Test ObservableObjectMixin implementation counting changes."""
+
+        def _after_change(self) -> None:
+            after_change()
+
+    obj = CountingObject(name="test", count=1)
+    after_change.assert_not_called()
+    obj.count = 2
+    after_change.assert_called_once()
+
+
+def test_own_post_init_does_not_break_tracking() -> None:
+    """Test that changes are tracked even if a subclass defines its own
+    __post_init__ without calling super().
+    """
+
+    @dataclass
+    class PostInitObject(DummyDataclassObject):
+        """Test ObservableObjectMixin implementation with __post_init__."""
+
+        def __post_init__(self) -> None:
+            self.name = self.name.upper()
+
+    subscriber = Mock()
+    obj = PostInitObject(name="test", count=1)
+    assert obj.name == "TEST"
+    obj.changed.subscribe(subscriber)
+    obj.count = 2
+    subscriber.assert_called_once()
+
+
+def test_unchanged_value_does_not_emit_change_event() -> None:
+    """Test that assigning the same value again does not emit an event."""
+    subscriber = Mock()
+    obj = DummyDataclassObject(name="test", count=1)
+    obj.changed.subscribe(subscriber)
+    obj.count = 1
+    subscriber.assert_not_called()
+
+
+def test_underscore_properties_are_not_tracked() -> None:
+    """Test that changing private properties does not emit an event."""
+    subscriber = Mock()
+    obj = DummyDataclassObject(name="test", count=1)
+    obj.changed.subscribe(subscriber)
+    setattr(obj, "_private", 5)
+    subscriber.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "duplicate",
+    [copy.copy, copy.deepcopy, lambda obj: pickle.loads(pickle.dumps(obj))],
+)
+def test_copies_track_changes(duplicate: Callable[[Any], Any]) -> None:
+    """Test that copied and unpickled objects keep tracking changes."""
+    subscriber = Mock()
+    obj = duplicate(DummyDataclassObject(name="test", count=1))
+    obj.changed.subscribe(subscriber)
+    obj.count = 5
+    subscriber.assert_called_once()
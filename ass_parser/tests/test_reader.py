@@ -1,11 +1,26 @@
 """Test reader module."""
+import asyncio
 import io
+import mmap
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 import pytest
 
-from ass_parser import AssFile, AssStringTable, CorruptAssLineError, read_ass
+from ass_parser import (
+    AssEvent,
+    AssFile,
+    AssStringTable,
+    AssStyle,
+    CorruptAssLineError,
+    decoding,
+    read_ass,
+    read_ass_async,
+    reader,
+    write_ass,
+)
 
 
 def verify_result(result: AssFile) -> None:
@@ -51,3 +66,204 @@ def test_read_ass_corrupt_ass() -> None:
     """Test read_ass function raises an error when there are no sections."""
     with pytest.raises(CorruptAssLineError):
         read_ass("no sections")
+
+
+def test_read_ass_async(
+    dummy_ass_file: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that read_ass_async gives the same result for every source."""
+    monkeypatch.setattr(reader, "READ_CHUNK_SIZE", 7)
+    expected = read_ass(dummy_ass_file)
+    with tempfile.NamedTemporaryFile() as temp_file:
+        path = Path(temp_file.name)
+        path.write_text(dummy_ass_file)
+        result = asyncio.run(read_ass_async(path))
+    verify_result(result)
+    assert result == expected
+    assert asyncio.run(read_ass_async(dummy_ass_file)) == expected
+    with io.StringIO(dummy_ass_file) as handle:
+        assert asyncio.run(read_ass_async(handle)) == expected
+    with ThreadPoolExecutor() as executor:
+        result = asyncio.run(read_ass_async(dummy_ass_file, executor=executor))
+    assert result == expected
+
+
+def test_read_ass_async_streams(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that read_ass_async parses the lines as they are read, rather
+    than reading the whole stream first.
+    """
+    monkeypatch.setattr(reader, "READ_CHUNK_SIZE", 64)
+    reads = 0
+
+    class CountingStream(io.StringIO):
+        def read(self, size: Optional[int] = -1) -> str:
+            nonlocal reads
+            reads += 1
+            return super().read(size)
+
+    text = "no sections\n" + "x\n" * 50_000
+    with pytest.raises(CorruptAssLineError):
+        asyncio.run(read_ass_async(CountingStream(text)))
+    assert 0 < reads < len(text) // 64 // 10
+
+
+def test_read_ass_async_from_bytes(
+    dummy_ass_file: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that read_ass_async decodes bytes like read_ass."""
+    monkeypatch.setattr(decoding, "BLOCK_SIZE", 7)
+    monkeypatch.setattr(reader, "READ_CHUNK_SIZE", 7)
+    data = dummy_ass_file.replace("Ako!", "\N{EURO SIGN}").encode(
+        "cp1252", errors="ignore"
+    )
+    expected = read_ass(data)
+    assert asyncio.run(read_ass_async(data)) == expected
+    assert asyncio.run(
+        read_ass_async(dummy_ass_file.replace("\n", "\r\n").encode("utf-16"))
+    ) == read_ass(dummy_ass_file)
+
+
+def test_read_ass_corrupt_path(tmp_path: Path) -> None:
+    """Test that parse errors in memory-mapped paths are not masked by the
+    memory map failing to close.
+    """
+    path = tmp_path / "corrupt.ass"
+    path.write_text("no sections\n" + "x: y\n" * 100)
+    with pytest.raises(CorruptAssLineError):
+        read_ass(path)
+
+
+def test_iter_consume_ass_stream_pauses(dummy_ass_file: str) -> None:
+    """Test that parsing yields control after every batch of lines."""
+    ass_file = AssFile()
+    with io.StringIO(dummy_ass_file) as handle:
+        pauses = sum(
+            1 for _ in ass_file.iter_consume_ass_stream(handle, batch_size=2)
+        )
+    assert pauses > len(dummy_ass_file.splitlines()) // 2
+    assert ass_file == read_ass(dummy_ass_file)
+
+
+@pytest.mark.parametrize(
+    "encoding,bom",
+    [
+        ("utf-8", b""),
+        ("utf-8", b"\xef\xbb\xbf"),
+        ("utf-16-le", b"\xff\xfe"),
+        ("utf-16-be", b"\xfe\xff"),
+        ("utf-16-le", b""),
+        ("utf-16-be", b""),
+        ("cp1252", b""),
+    ],
+)
+def test_read_ass_from_bytes(
+    dummy_ass_file: str,
+    monkeypatch: pytest.MonkeyPatch,
+    encoding: str,
+    bom: bytes,
+) -> None:
+    """Test that bytes are decoded according to the sniffed encoding, even if
+    the blocks split characters and line endings.
+    """
+    monkeypatch.setattr(decoding, "BLOCK_SIZE", 7)
+    source = dummy_ass_file.lstrip("\N{BOM}").replace(
+        "Default Aegisub file", "Caf\N{LATIN SMALL LETTER E WITH ACUTE}"
+    )
+    # drop what legacy encodings cannot represent
+    source = source.encode(encoding, errors="ignore").decode(encoding)
+    data = bom + source.replace("\n", "\r\n").encode(encoding)
+    result = read_ass(data)
+    assert result == read_ass(source)
+    assert result.script_info["Title"] == (
+        "Caf\N{LATIN SMALL LETTER E WITH ACUTE}"
+    )
+
+
+def test_read_ass_from_mmap(dummy_ass_file: str, tmp_path: Path) -> None:
+    """Test that memory maps in legacy encodings are guessed, while paths
+    need the encoding to be given.
+    """
+    path = tmp_path / "legacy.ass"
+    path.write_bytes(
+        dummy_ass_file.replace("Ako!", "\N{EURO SIGN}").encode(
+            "cp1252", errors="ignore"
+        )
+    )
+    with path.open("rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            assert "\N{EURO SIGN}" in read_ass(data).events[0].text
+    with pytest.raises(UnicodeDecodeError):
+        read_ass(path)
+    with pytest.raises(UnicodeDecodeError):
+        asyncio.run(read_ass_async(path))
+    result = read_ass(path, encoding="cp1252")
+    assert "\N{EURO SIGN}" in result.events[0].text
+    result = asyncio.run(read_ass_async(path, encoding="cp1252"))
+    assert "\N{EURO SIGN}" in result.events[0].text
+
+
+def test_read_ass_with_encoding() -> None:
+    """Test that the encoding can be forced and that old Mac line endings
+    are recognized.
+    """
+    data = "[Script Info]\rTitle: \N{GREEK SMALL LETTER ALPHA}\rA: B\r"
+    result = read_ass(data.encode("iso-8859-7"), encoding="iso-8859-7")
+    assert dict(result.script_info) == {
+        "Title": "\N{GREEK SMALL LETTER ALPHA}",
+        "A": "B",
+    }
+
+
+@pytest.mark.parametrize("preserve_original", [False, True])
+def test_read_ass_time_range(preserve_original: bool) -> None:
+    """Test that only the events intersecting the time window are loaded,
+    including those whose {TIME:…} tags decide.
+    """
+    ass_file = AssFile()
+    ass_file.styles.append(AssStyle(name="Default"))
+    for start, end in [
+        (0, 1000),
+        (1000, 2004),
+        (1000, 2005),
+        (2000, 3000),
+        (4999, 6000),
+        (5000, 6000),
+    ]:
+        ass_file.events.append(AssEvent(start=start, end=end))
+    text = write_ass(ass_file)
+
+    result = read_ass(
+        text, preserve_original=preserve_original, time_range=(2004, 5000)
+    )
+    assert [(event.start, event.end) for event in result.events] == [
+        (1000, 2005),
+        (2000, 3000),
+        (4999, 6000),
+    ]
+    assert len(result.styles) == 1
+    assert result.events[0].index == 0
+    if preserve_original:
+        assert (
+            write_ass(result).splitlines()[-3:]
+            == [line for line in text.splitlines() if "{TIME:" in line][2:5]
+        )
+    assert asyncio.run(read_ass_async(text, time_range=(2004, 5000))) == result
+
+
+def test_read_ass_time_range_does_not_outlive_loading() -> None:
+    """Test that the time window only applies to the loading it was passed
+    to.
+    """
+    ass_file = AssFile()
+    ass_file.styles.append(AssStyle(name="Default"))
+    ass_file.events.extend(
+        [AssEvent(start=0, end=1000), AssEvent(start=5000, end=6000)]
+    )
+    result = read_ass(write_ass(ass_file), time_range=(0, 1000))
+    assert len(result.events) == 1
+
+    result.events.consume_ass_lines(
+        list(enumerate(ass_file.events.produce_ass_lines()))
+    )
+    assert result.events == ass_file.events
+    assert read_ass(write_ass(result)).events == result.events
@@ -0,0 +1,98 @@
+"""Tests for the AssSharedEvents class."""
+import gc
+import pickle
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from ass_parser import AssEvent, AssSharedEvents, read_ass
+
+
+def _total_duration(shared: AssSharedEvents) -> int:
+    with shared:
+        return sum(shared.get_column("end")) - sum(shared.get_column("start"))
+
+
+def test_shared_events(dummy_ass_file: str) -> None:
+    """Test that shared events read back equal to the source events."""
+    events = read_ass(dummy_ass_file).events
+    events[0].text = "zażółć gęślą jaźń"
+    with AssSharedEvents.create(events) as shared:
+        assert len(shared) == len(events)
+        assert [record.to_event() for record in shared] == list(events)
+        assert shared[-1].text == events[-1].text
+        assert shared[-2:] == [shared[-2], shared[-1]]
+        assert list(shared.get_column("layer")) == [
+            event.layer for event in events
+        ]
+        assert shared.get_column("start").readonly
+        assert shared.get_string("text", 0) == "zażółć gęślą jaźń"
+        with pytest.raises(ValueError):
+            shared.get_column("text")
+        with pytest.raises(IndexError):
+            shared[len(events)]
+
+
+def test_shared_events_empty() -> None:
+    """Test sharing an empty list of events."""
+    with AssSharedEvents.create([]) as shared:
+        assert len(shared) == 0
+        assert not list(shared)
+
+
+def test_shared_events_attach() -> None:
+    """Test that other processes attach to the block rather than receive
+    a copy of the events.
+    """
+    events = [AssEvent(start=i * 1000, end=i * 1000 + 500) for i in range(10)]
+    with AssSharedEvents.create(events) as shared:
+        assert len(pickle.dumps(shared)) < 200
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(_total_duration, shared).result() == 5000
+        assert shared[9].start == 9000
+
+
+def test_shared_events_garbage_collected(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that an instance garbage collected without being closed releases
+    its views before the block gets closed.
+    """
+    errors: list[BaseException] = []
+    monkeypatch.setattr(
+        sys, "unraisablehook", lambda args: errors.append(args.exc_value)
+    )
+    events = [AssEvent(start=i, end=i + 1, text=str(i)) for i in range(10)]
+    with AssSharedEvents.create(events) as shared:
+        attached = AssSharedEvents.attach(shared.name)
+        assert attached[9].text == "9"
+        del attached
+        gc.collect()
+    assert not errors
+
+
+def test_shared_events_attach_from_other_process() -> None:
+    """Test that a separate process attaching by name does not unlink the
+    block when it exits.
+    """
+    events = [AssEvent(start=i, end=i + 1, text=str(i)) for i in range(10)]
+    code = (
+        "import sys\n"
+        "from ass_parser import AssSharedEvents\n"
+        "with AssSharedEvents.attach(sys.argv[1]) as shared:\n"
+        "    print(shared[9].text)\n"
+    )
+    with AssSharedEvents.create(events) as shared:
+        for _ in range(2):
+            result = subprocess.run(
+                [sys.executable, "-c", code, shared.name],
+                cwd=Path(__file__).parents[2],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            assert result.stdout == "9\n"
+            assert not result.stderr
@@ -0,0 +1,135 @@
+"""Tests for the SnapshotSequenceMixin class."""
+import pickle
+import threading
+from collections.abc import Iterable
+
+from ass_parser import AssEvent, AssEventList
+
+
+def make_events() -> AssEventList:
+    """Create an event list with three events.
+
+    :return: event list
+    """
+    return AssEventList(data=[AssEvent(text=str(i)) for i in range(3)])
+
+
+def texts(events: Iterable[AssEvent]) -> list[str]:
+    """Return texts of the given events.
+
+    :param events: events to get the texts of
+    :return: list of texts
+    """
+    return [event.text for event in events]
+
+
+def test_snapshot_contents() -> None:
+    """Test that a snapshot contains detached copies of the items."""
+    events = make_events()
+    snapshot = events.snapshot()
+    assert len(snapshot) == 3
+    assert texts(snapshot) == ["0", "1", "2"]
+    assert texts(snapshot[1:]) == ["1", "2"]
+    assert snapshot[0] == events[0]
+    assert snapshot[0] is not events[0]
+    assert snapshot[0].parent is None
+
+
+def test_snapshot_after_item_modification() -> None:
+    """Test that modifying an item does not affect the snapshot."""
+    events = make_events()
+    snapshot = events.snapshot()
+    events[1].text = "changed"
+    events[1].text = "changed again"
+    assert texts(snapshot) == ["0", "1", "2"]
+    assert texts(events) == ["0", "changed again", "2"]
+
+
+def test_snapshot_after_throttled_modification() -> None:
+    """Test that throttled item updates do not affect the snapshot."""
+    events = make_events()
+    snapshot = events.snapshot()
+    events[1].begin_update()
+    events[1].text = "changed"
+    events[1].start = 5
+    events[1].end_update()
+    assert snapshot[1].text == "1"
+    assert snapshot[1].start == 0
+
+
+def test_snapshot_after_structure_changes() -> None:
+    """Test that inserting and removing items does not affect the snapshot."""
+    events = make_events()
+    snapshot = events.snapshot()
+    removed = events[0]
+    del events[0]
+    events.insert(0, AssEvent(text="inserted"))
+    events.append(AssEvent(text="appended"))
+    events[1] = AssEvent(text="replaced")
+    events.extend([AssEvent(text="extended")])
+    removed.text = "removed and changed"
+    assert texts(snapshot) == ["0", "1", "2"]
+    events.clear()
+    assert texts(snapshot) == ["0", "1", "2"]
+
+
+def test_snapshot_copies_only_changed_items() -> None:
+    """Test that items are copied only when they are about to change."""
+    events = make_events()
+    snapshot = events.snapshot()
+    # pylint: disable=protected-access
+    assert not snapshot._preserved
+    events[0].text = "changed"
+    assert len(snapshot._preserved) == 1
+    events.append(AssEvent())
+    events[-1].text = "changed"
+    assert len(snapshot._preserved) == 1
+
+
+def test_multiple_snapshots() -> None:
+    """Test that each snapshot keeps its own state."""
+    events = make_events()
+    snapshot1 = events.snapshot()
+    events[0].text = "first change"
+    snapshot2 = events.snapshot()
+    events[0].text = "second change"
+    assert snapshot1[0].text == "0"
+    assert snapshot2[0].text == "first change"
+    assert events[0].text == "second change"
+
+
+def test_pickling_list_with_snapshots() -> None:
+    """Test that lists with snapshots can be pickled."""
+    events = make_events()
+    snapshot = events.snapshot()
+    copied = pickle.loads(pickle.dumps(events))
+    assert copied == events
+    copied[0].text = "changed"
+    assert snapshot[0].text == "0"
+
+
+def test_reading_snapshot_from_another_thread() -> None:
+    """Test that the snapshot stays consistent while the list is edited."""
+    events = AssEventList(data=[AssEvent(start=i, end=i) for i in range(100)])
+    snapshot = events.snapshot()
+    results: list[bool] = []
+
+    def reader() -> None:
+        for _ in range(20):
+            results.append(
+                all(
+                    event.start == event.end == i
+                    for i, event in enumerate(snapshot)
+                )
+            )
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    for event in list(events):
+        event.begin_update()
+        event.start += 1000
+        event.end += 1000
+        event.end_update()
+    del events[::2]
+    thread.join()
+    assert all(results)
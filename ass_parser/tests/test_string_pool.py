@@ -0,0 +1,122 @@
+"""Tests for the StringPool class."""
+from ass_parser import (
+    AssEvent,
+    AssEventList,
+    AssStyle,
+    AssStyleList,
+    StringPool,
+    read_ass,
+    string_memory_report,
+    string_pool,
+)
+
+
+def test_string_pool_intern() -> None:
+    """Test that interning equal strings returns the same object."""
+    pool = StringPool()
+    first = "".join(["Def", "ault"])
+    second = "".join(["Defa", "ult"])
+    assert first is not second
+    assert pool.intern(first) is first
+    assert pool.intern(second) is first
+    assert len(pool) == 1
+    pool.clear()
+    assert len(pool) == 0
+    assert pool.intern(second) is second
+
+
+def test_parsed_events_share_strings(dummy_ass_file: str) -> None:
+    """Test that parsing an ASS file interns repeated strings."""
+    ass_file = read_ass(dummy_ass_file)
+    event1, event2 = ass_file.events
+    assert event1.style_name is event2.style_name
+    assert event1.style_name is ass_file.styles[0].name
+
+
+def test_setting_event_strings_interns_them() -> None:
+    """Test that public setters intern strings of events within a list."""
+    events = AssEventList(data=[AssEvent(), AssEvent()])
+    for event in events:
+        event.style_name = "".join(["Sig", "ns"])
+        event.actor = "".join(["Ak", "o"])
+        event.effect = "".join(["Ban", "ner"])
+        event.text = "".join(["Ak", "o!"])
+    event1, event2 = events
+    assert event1.style_name is event2.style_name
+    assert event1.actor is event2.actor
+    assert event1.effect is event2.effect
+    assert event1.text is event2.text
+
+
+def test_setting_style_strings_interns_them() -> None:
+    """Test that public setters intern strings of styles within a list."""
+    styles = AssStyleList(data=[AssStyle(name="1"), AssStyle(name="2")])
+    for style in styles:
+        style.font_name = "".join(["Ar", "ial"])
+    style1, style2 = styles
+    assert style1.font_name is style2.font_name
+    style1.name = "".join(["Sig", "ns"])
+    assert styles.string_pool.intern("Signs") is style1.name
+
+
+def test_string_pool_sweep() -> None:
+    """Test that sweeping the pool evicts exactly the strings that nothing
+    else references.
+    """
+    pool = StringPool()
+    kept = pool.intern("".join(["Ak", "o!"]))
+    pool.intern("".join(["dro", "pped"]))
+    pool._sweep()  # pylint: disable=protected-access
+    assert len(pool) == 1
+    assert pool.intern("".join(["Ak", "o!"])) is kept
+
+
+def test_edits_do_not_grow_string_pool() -> None:
+    """Test that replaced strings are evicted from the pool while the
+    strings in use are kept.
+    """
+    events = AssEventList(data=[AssEvent(), AssEvent()])
+    events[1].text = "".join(["Ak", "o!"])
+    for i in range(10_000):
+        events[0].text = f"edit {i}"
+    pool = events.string_pool
+    assert len(pool) <= 2 * string_pool.MIN_SWEEP_SIZE
+    assert pool.intern("".join(["Ak", "o!"])) is events[1].text
+    assert pool.intern("edit 9999") is events[0].text
+
+
+def test_inserting_events_interns_their_strings() -> None:
+    """Test that inserting events into a list interns their strings."""
+    event1 = AssEvent(text="".join(["Ak", "o!"]))
+    event2 = AssEvent(text="".join(["A", "ko!"]))
+    assert event1.text is not event2.text
+    AssEventList(data=[event1, event2])
+    assert event1.text is event2.text
+
+
+def test_setting_strings_in_detached_events() -> None:
+    """Test that events without a parent list keep their strings."""
+    text = "".join(["Ak", "o!"])
+    event = AssEvent()
+    event.text = text
+    assert event.text is text
+    assert event.style_name == ""
+    assert AssEvent(actor="test").actor == "test"
+
+
+def test_string_memory_report() -> None:
+    """Test that the memory report shows savings from sharing strings."""
+    ass_file = read_ass("[Events]\nFormat: Style, Text\n")
+    ass_file.styles.append(AssStyle(name="".join(["Def", "ault"])))
+    for _ in range(10):
+        ass_file.events.append(
+            AssEvent(
+                style_name="".join(["Def", "ault"]),
+                text="".join(["Ak", "o!"]),
+            )
+        )
+    report = string_memory_report(ass_file)
+    assert report.total_strings == 10 * 5 + 2
+    assert report.distinct_values == report.distinct_objects
+    assert report.saved_bytes > 0
+    assert report.stored_bytes + report.saved_bytes == report.unshared_bytes
@@ -0,0 +1,139 @@
+"""Tests for the UndoJournal class."""
+import gc
+import weakref
+
+import pytest
+
+from ass_parser import (
+    AssEvent,
+    AssFile,
+    AssStyle,
+    UndoJournal,
+    read_ass,
+    write_ass,
+)
+
+
+@pytest.fixture(name="ass_file")
+def fixture_ass_file(dummy_ass_file: str) -> AssFile:
+    """Return a parsed dummy ASS file.
+
+    :param dummy_ass_file: dummy ASS file text representation
+    :return: parsed ASS file
+    """
+    return read_ass(dummy_ass_file)
+
+
+def test_undo_redo_field_change(ass_file: AssFile) -> None:
+    """Test undoing and redoing event field changes."""
+    journal = UndoJournal(ass_file)
+    original = write_ass(ass_file)
+    assert not journal.can_undo
+    ass_file.events[1].text = "changed"
+    assert journal.can_undo
+    assert journal.size == 1
+    changed = write_ass(ass_file)
+    journal.undo()
+    assert write_ass(ass_file) == original
+    assert journal.can_redo
+    journal.redo()
+    assert write_ass(ass_file) == changed
+
+
+def test_undo_redo_insertion_and_removal(ass_file: AssFile) -> None:
+    """Test undoing and redoing item insertion and removal."""
+    journal = UndoJournal(ass_file)
+    states = [write_ass(ass_file)]
+    ass_file.events.insert(1, AssEvent(text="inserted"))
+    states.append(write_ass(ass_file))
+    ass_file.events.extend([AssEvent(text="a"), AssEvent(text="b")])
+    states.append(write_ass(ass_file))
+    del ass_file.events[0]
+    states.append(write_ass(ass_file))
+    del ass_file.events[::2]
+    states.append(write_ass(ass_file))
+    ass_file.styles[0] = AssStyle(name="replaced")
+    states.append(write_ass(ass_file))
+    ass_file.events.clear()
+    states.append(write_ass(ass_file))
+
+    for state in reversed(states[:-1]):
+        journal.undo()
+        assert write_ass(ass_file) == state
+    assert not journal.can_undo
+    for state in states[1:]:
+        journal.redo()
+        assert write_ass(ass_file) == state
+    assert not journal.can_redo
+
+
+def test_transactions(ass_file: AssFile) -> None:
+    """Test that transactions are undone as a whole."""
+    journal = UndoJournal(ass_file)
+    original = write_ass(ass_file)
+    with journal.transaction():
+        ass_file.events[0].start = 0
+        with journal.transaction():
+            ass_file.events.append(AssEvent(text="new"))
+            ass_file.events[-1].text = "changed"
+        ass_file.styles[0].scale(2)
+    assert journal.can_undo
+    journal.undo()
+    assert write_ass(ass_file) == original
+    assert not journal.can_undo
+
+
+def test_throttled_changes_are_recorded_once(ass_file: AssFile) -> None:
+    """Test that throttled updates are recorded as a single change."""
+    journal = UndoJournal(ass_file)
+    original = write_ass(ass_file)
+    ass_file.styles[0].scale(2)
+    assert journal.size == 5
+    journal.undo()
+    assert write_ass(ass_file) == original
+
+
+def test_new_change_clears_redo(ass_file: AssFile) -> None:
+    """Test that making a change after undoing discards the redo history."""
+    journal = UndoJournal(ass_file)
+    ass_file.events[0].text = "changed"
+    journal.undo()
+    ass_file.events[0].actor = "changed"
+    assert not journal.can_redo
+
+
+def test_eviction(ass_file: AssFile) -> None:
+    """Test that the oldest transactions are evicted to respect max_size."""
+    journal = UndoJournal(ass_file, max_size=3)
+    for i in range(5):
+        ass_file.events[0].start = i + 100
+    assert journal.size == 3
+    for _ in range(5):
+        journal.undo()
+    assert ass_file.events[0].start == 101
+
+
+def test_clear(ass_file: AssFile) -> None:
+    """Test forgetting the history."""
+    journal = UndoJournal(ass_file)
+    ass_file.events[0].text = "changed"
+    journal.clear()
+    assert not journal.can_undo
+    assert journal.size == 0
+    journal.undo()
+    assert ass_file.events[0].text == "changed"
+
+
+def test_close(ass_file: AssFile) -> None:
+    """Test that closed journals stop recording and can be freed."""
+    journal = UndoJournal(ass_file)
+    ass_file.events[1].text = "changed"
+    journal.close()
+    ass_file.events[1].text = "changed again"
+    del ass_file.events[0]
+    assert journal.size == 1
+    assert not ass_file.events.items_modified.callbacks
+    journal_ref = weakref.ref(journal)
+    del journal
+    gc.collect()
+    assert journal_ref() is None
@@ -1,9 +1,20 @@
 """Test writer module."""
+import asyncio
 import io
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from ass_parser import read_ass, write_ass
+import pytest
+
+from ass_parser import (
+    AssEvent,
+    AssFile,
+    read_ass,
+    write_ass,
+    write_ass_async,
+    writer,
+)
 
 DUMMY_ASS_FILE_REPARSED = """[Script Info]
 Title: Default Aegisub file
@@ -68,3 +79,116 @@ def test_write_ass_to_string(dummy_ass_file: str) -> None:
     ass_file = read_ass(dummy_ass_file)
     result = write_ass(ass_file)
     assert result == DUMMY_ASS_FILE_REPARSED
+
+
+def test_write_ass_strips_trailing_whitespace_of_sections() -> None:
+    """Test that trailing whitespace at the end of each section is dropped,
+    while whitespace within the section is kept.
+    """
+    ass_file = AssFile()
+    ass_file.events.append(AssEvent(text="first  "))
+    ass_file.events.append(AssEvent(text="last  "))
+    result = write_ass(ass_file)
+    assert "{TIME:0,0}first  \n" in result
+    assert result.endswith("{TIME:0,0}last\n")
+
+
+def test_write_ass_in_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the output does not depend on the chunk size."""
+    ass_file = AssFile()
+    for i in range(10):
+        ass_file.events.append(AssEvent(start=i, text=str(i)))
+    expected = write_ass(ass_file)
+    monkeypatch.setattr(writer, "CHUNK_SIZE", 3)
+    assert write_ass(ass_file) == expected
+
+
+def test_write_ass_during_throttled_update() -> None:
+    """Test that cached lines are dropped by each change made within
+    begin_update() and end_update().
+    """
+    ass_file = AssFile()
+    ass_file.events.append(AssEvent(text="old"))
+    assert write_ass(ass_file).endswith("}old\n")
+    event = ass_file.events[0]
+    event.begin_update()
+    event.text = "new"
+    assert write_ass(ass_file).endswith("}new\n")
+    event.actor = "actor"
+    assert ",actor," in write_ass(ass_file)
+    event.end_update()
+    assert write_ass(ass_file).endswith("}new\n")
+
+
+def test_write_ass_preserve_original(dummy_ass_file: str) -> None:
+    """Test that unmodified lines are written back as they were read."""
+    source_lines = [
+        line
+        for line in dummy_ass_file.lstrip("\N{BOM}").splitlines()
+        if not line.startswith(";")
+    ]
+    ass_file = read_ass(dummy_ass_file, preserve_original=True)
+    # sections are written in the canonical order
+    assert sorted(write_ass(ass_file).splitlines()) == sorted(source_lines)
+
+    ass_file.events[1].text = "changed"
+    ass_file.script_info["PlayResX"] = "640"
+    result = write_ass(ass_file).splitlines()
+    assert sorted(set(source_lines) - set(result)) == [
+        r"Dialogue: 0,0:00:08.71,0:00:10.95,Default,,0,0,0,,- Shizu!\N- Ako!",
+        "PlayResX: 1920",
+    ]
+    assert sorted(set(result) - set(source_lines)) == [
+        "Dialogue: 0,0:00:08.71,0:00:10.95,Default,,0,0,0,,"
+        "{TIME:8710,10950}changed",
+        "PlayResX: 640",
+    ]
+
+
+def test_write_ass_async(
+    dummy_ass_file: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that write_ass_async gives the same output for every target."""
+    monkeypatch.setattr(writer, "CHUNK_SIZE", 3)
+    ass_file = read_ass(dummy_ass_file)
+    assert asyncio.run(write_ass_async(ass_file)) == DUMMY_ASS_FILE_REPARSED
+    with io.StringIO() as handle:
+        asyncio.run(write_ass_async(ass_file, handle))
+        assert handle.getvalue() == DUMMY_ASS_FILE_REPARSED
+    with tempfile.NamedTemporaryFile() as temp_file:
+        path = Path(temp_file.name)
+        with ThreadPoolExecutor() as executor:
+            asyncio.run(write_ass_async(ass_file, path, executor=executor))
+        assert path.read_text() == DUMMY_ASS_FILE_REPARSED
+
+
+def test_write_ass_with_workers(
+    dummy_ass_file: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that formatting events in worker processes gives the same output
+    as formatting them in this process.
+    """
+    monkeypatch.setattr(writer, "FORMAT_CHUNK_SIZE", 3)
+
+    def build() -> AssFile:
+        ass_file = read_ass(dummy_ass_file)
+        for i in range(10):
+            ass_file.events.append(
+                AssEvent(
+                    start=i * 1234,
+                    end=i * 2345,
+                    actor="a,b",
+                    text=f"line {i}",
+                    note="{note}" if i % 2 else "",
+                    is_comment=i % 3 == 0,
+                )
+            )
+        return ass_file
+
+    ass_file = build()
+    expected_file = build()
+    assert write_ass(ass_file, workers=2) == write_ass(expected_file)
+    for changed_file in (ass_file, expected_file):
+        changed_file.events[0].text = "changed"
+        changed_file.events[5].note = "changed"
+    assert write_ass(ass_file, workers=2) == write_ass(expected_file)
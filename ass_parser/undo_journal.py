@@ -0,0 +1,363 @@
+"""UndoJournal definition."""
+from collections import deque
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from operator import attrgetter, itemgetter
+from typing import Any, Union
+
+from ass_parser.ass_event import AssEvent
+from ass_parser.ass_file import AssFile
+from ass_parser.ass_sections import AssEventList, AssStyleList
+from ass_parser.ass_style import AssStyle
+from ass_parser.observable import Subscription
+from ass_parser.observable_sequence_mixin import (
+    ObservableSequenceChangeEvent,
+    ObservableSequenceItemInsertionEvent,
+    ObservableSequenceItemModificationEvent,
+    ObservableSequenceItemRemovalEvent,
+)
+from ass_parser.util import public_fields
+
+AssItem = Union[AssEvent, AssStyle]
+AssItemList = Union[AssEventList, AssStyleList]
+
+
+def _compact_indices(indices: list[int]) -> Sequence[int]:
+    if indices and indices[-1] - indices[0] == len(indices) - 1:
+        return range(indices[0], indices[-1] + 1)
+    return indices
+
+
+def _insert_items(
+    target: AssItemList, indices: Sequence[int], items: list[AssItem]
+) -> None:
+    if isinstance(indices, range):
+        target[indices.start : indices.start] = items  # type: ignore
+    else:
+        for index, item in zip(indices, items):
+            target.insert(index, item)  # type: ignore
+
+
+def _remove_items(target: AssItemList, indices: Sequence[int]) -> None:
+    if isinstance(indices, range):
+        del target[indices.start : indices.stop]
+    else:
+        for index in reversed(indices):
+            del target[index]
+
+
+@dataclass
+class _Insertion:
+    """Items were inserted at the given ascending indices."""
+
+    target: AssItemList
+    indices: Sequence[int]
+    items: list[AssItem]
+
+    @property
+    def size(self) -> int:
+        return len(self.items)
+
+    def undo(self) -> None:
+        _remove_items(self.target, self.indices)
+
+    def redo(self) -> None:
+        _insert_items(self.target, self.indices, self.items)
+
+
+@dataclass
+class _Removal:
+    """Items were removed from the given ascending indices."""
+
+    target: AssItemList
+    indices: Sequence[int]
+    items: list[AssItem]
+
+    @property
+    def size(self) -> int:
+        return len(self.items)
+
+    def undo(self) -> None:
+        _insert_items(self.target, self.indices, self.items)
+
+    def redo(self) -> None:
+        _remove_items(self.target, self.indices)
+
+
+@dataclass
+class _Modification:
+    """Fields of the item at the given index changed from old to new
+    values.
+    """
+
+    target: AssItemList
+    index: int
+    changes: dict[str, tuple[Any, Any]]
+
+    @property
+    def size(self) -> int:
+        return len(self.changes)
+
+    def _apply(self, new: bool) -> None:
+        item = self.target[self.index]
+        item.begin_update()
+        for name, values in self.changes.items():
+            setattr(item, name, values[new])
+        item.end_update()
+
+    def undo(self) -> None:
+        self._apply(new=False)
+
+    def redo(self) -> None:
+        self._apply(new=True)
+
+
+_Operation = Union[_Insertion, _Removal, _Modification]
+
+
+@dataclass
+class _Transaction:
+    operations: list[_Operation] = field(default_factory=list)
+    size: int = 0
+
+    def undo(self) -> None:
+        for operation in reversed(self.operations):
+            operation.undo()
+
+    def redo(self) -> None:
+        for operation in self.operations:
+            operation.redo()
+
+
+class UndoJournal:
+    """Undo/redo history of the events and styles of an ASS file.
+
+    Rather than storing copies of the whole file, the journal listens to the
+    list and item change signals and records the inserted and removed items
+    and the old and new values of the changed fields. Undoing and redoing
+    takes time proportional to the size of the change.
+
+    Changes are grouped into transactions: each list operation or item update
+    made outside of .transaction() is a transaction of its own.
+    """
+
+    def __init__(self, ass_file: AssFile, max_size: int = 1_000_000) -> None:
+        """Initialize self.
+
+        :param ass_file: ASS file to track
+        :param max_size: maximum number of inserted items, removed items and
+            changed fields to remember; the oldest transactions are evicted
+            once the limit is exceeded
+        """
+        self.max_size = max_size
+        self._undo_stack: deque[_Transaction] = deque()
+        self._redo_stack: list[_Transaction] = []
+        self._size = 0
+        self._transaction_depth = 0
+        self._current: _Transaction = _Transaction()
+        self._is_replaying = False
+        self._pending_fields: dict[int, tuple[Any, ...]] = {}
+        self._pending_removals: dict[int, list[tuple[int, AssItem]]] = {}
+        self._subscriptions: list[Subscription] = []
+        for target in (ass_file.events, ass_file.styles):
+            self.watch(target)
+
+    def watch(self, target: AssItemList) -> None:
+        """Start recording changes of the given list.
+
+        :param target: list to watch
+        """
+        self._subscriptions += [
+            target.items_about_to_be_removed.subscribe(
+                partial(self._before_removal, target)
+            ),
+            target.items_removed.subscribe(partial(self._on_removal, target)),
+            target.items_inserted.subscribe(
+                partial(self._on_insertion, target)
+            ),
+            target.items_about_to_be_modified.subscribe(
+                self._before_modification
+            ),
+            target.items_modified.subscribe(
+                partial(self._on_modification, target)
+            ),
+            target.changed.subscribe(self._on_change),
+        ]
+
+    def close(self) -> None:
+        """Stop recording changes of all the watched lists.
+
+        The watched lists keep the journal alive until it is closed. The
+        history is kept and can still be undone and redone.
+        """
+        for subscription in self._subscriptions:
+            subscription.unsubscribe()
+        self._subscriptions.clear()
+
+    @property
+    def size(self) -> int:
+        """Return number of remembered item and field changes.
+
+        :return: size of the journal
+        """
+        return self._size
+
+    @property
+    def can_undo(self) -> bool:
+        """Return whether there is anything to undo.
+
+        :return: whether undo() will do anything
+        """
+        return bool(self._undo_stack)
+
+    @property
+    def can_redo(self) -> bool:
+        """Return whether there is anything to redo.
+
+        :return: whether redo() will do anything
+        """
+        return bool(self._redo_stack)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group all the changes made within the context into a single undo
+        step. Transactions can be nested.
+        """
+        self._transaction_depth += 1
+        try:
+            yield
+        finally:
+            self._transaction_depth -= 1
+            if not self._transaction_depth:
+                self._commit()
+
+    def undo(self) -> None:
+        """Revert the last transaction."""
+        if not self._undo_stack:
+            return
+        transaction = self._undo_stack.pop()
+        self._size -= transaction.size
+        with self._replaying():
+            transaction.undo()
+        self._redo_stack.append(transaction)
+
+    def redo(self) -> None:
+        """Reapply the last reverted transaction."""
+        if not self._redo_stack:
+            return
+        transaction = self._redo_stack.pop()
+        with self._replaying():
+            transaction.redo()
+        self._push(transaction)
+
+    def clear(self) -> None:
+        """Forget the whole history."""
+        self._undo_stack.clear()
+        self._redo_stack.clear()
+        self._size = 0
+
+    @contextmanager
+    def _replaying(self) -> Iterator[None]:
+        self._is_replaying = True
+        try:
+            yield
+        finally:
+            self._is_replaying = False
+
+    def _record(self, operation: _Operation) -> None:
+        if self._is_replaying:
+            return
+        self._current.operations.append(operation)
+        self._current.size += operation.size
+
+    def _on_change(self, _event: ObservableSequenceChangeEvent) -> None:
+        # every list operation ends with a change event
+        if not self._transaction_depth:
+            self._commit()
+
+    def _commit(self) -> None:
+        transaction = self._current
+        self._current = _Transaction()
+        if transaction.operations:
+            self._redo_stack.clear()
+            self._push(transaction)
+
+    def _push(self, transaction: _Transaction) -> None:
+        self._undo_stack.append(transaction)
+        self._size += transaction.size
+        while self._size > self.max_size and len(self._undo_stack) > 1:
+            self._size -= self._undo_stack.popleft().size
+
+    def _before_removal(
+        self,
+        target: AssItemList,
+        event: ObservableSequenceItemRemovalEvent[AssItem],
+    ) -> None:
+        if not self._is_replaying:
+            self._pending_removals[id(target)] = sorted(
+                ((item.index, item) for item in event.items),
+                key=itemgetter(0),
+            )
+
+    def _on_removal(
+        self,
+        target: AssItemList,
+        event: ObservableSequenceItemRemovalEvent[AssItem],
+    ) -> None:
+        removed = self._pending_removals.pop(id(target), None)
+        if removed:
+            self._record(
+                _Removal(
+                    target=target,
+                    indices=_compact_indices([index for index, _ in removed]),
+                    items=[item for _, item in removed],
+                )
+            )
+
+    def _on_insertion(
+        self,
+        target: AssItemList,
+        event: ObservableSequenceItemInsertionEvent[AssItem],
+    ) -> None:
+        if event.items:
+            items = sorted(event.items, key=attrgetter("index"))
+            self._record(
+                _Insertion(
+                    target=target,
+                    indices=_compact_indices([item.index for item in items]),
+                    items=items,
+                )
+            )
+
+    def _before_modification(
+        self, event: ObservableSequenceItemModificationEvent[Any]
+    ) -> None:
+        if not self._is_replaying:
+            item = event.item
+            self._pending_fields[id(item)] = tuple(
+                getattr(item, name) for name in public_fields(item)
+            )
+
+    def _on_modification(
+        self,
+        target: AssItemList,
+        event: ObservableSequenceItemModificationEvent[AssItem],
+    ) -> None:
+        item = event.item
+        old_values = self._pending_fields.pop(id(item), None)
+        if old_values is None:
+            return
+        changes = {
+            name: (old_value, getattr(item, name))
+            for name, old_value in zip(public_fields(item), old_values)
+            if getattr(item, name) != old_value
+        }
+        if changes:
+            assert isinstance(event.index, int)
+            self._record(
+                _Modification(
+                    target=target, index=event.index, changes=changes
+                )
+            )
@@ -1,10 +1,21 @@
 """Various ASS utilities."""
+import dataclasses
+import gc
 import re
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from decimal import Decimal
-from typing import Union
+from hashlib import blake2b
+from operator import attrgetter
+from typing import Any, Optional, Union
 
 TIMESTAMP_RE = re.compile(r"(\d{1,2}):(\d{2}):(\d{2})[.,](\d{2,3})")
 
+_PUBLIC_FIELDS: dict[type, tuple[str, ...]] = {}
+_CONTENT_GETTERS: dict[type, Callable[[Any], tuple[Any, ...]]] = {}
+_STORAGE_KEYS: dict[type, tuple[str, ...]] = {}
+
 
 def escape_ass_tag(text: str) -> str:
     """Escape text so that it doesn't get treated as ASS tags.
@@ -68,6 +79,17 @@ def ass_timestamp_to_ms(text: str) -> int:
     return milliseconds
 
 
+def try_ass_timestamp_to_ms(text: str) -> Optional[int]:
+    """Convert ASS text representation of time to milliseconds, if valid.
+
+    :param text: text to convert
+    :return: milliseconds, or None if text is not a timestamp
+    """
+    if not TIMESTAMP_RE.match(text):
+        return None
+    return ass_timestamp_to_ms(text)
+
+
 def smart_float(value: Union[int, float]) -> str:
     """Convert a float to a string but discard trailing .0.
 
@@ -78,3 +100,151 @@ def smart_float(value: Union[int, float]) -> str:
     if dec == dec.to_integral():
         return str(dec.quantize(Decimal(1)))
     return str(dec.normalize())
+
+
+def public_fields(obj: Any) -> tuple[str, ...]:
+    """Return names of the public fields of a dataclass instance, such as an
+    AssEvent or an AssStyle.
+
+    :param obj: dataclass instance
+    :return: field names that do not start with an underscore
+    """
+    obj_type = type(obj)
+    try:
+        return _PUBLIC_FIELDS[obj_type]
+    except KeyError:
+        names = tuple(
+            obj_field.name
+            for obj_field in dataclasses.fields(obj)
+            if not obj_field.name.startswith("_")
+        )
+        _PUBLIC_FIELDS[obj_type] = names
+        return names
+
+
+def content_positions(item_type: type) -> dict[str, int]:
+    """Return the positions of the public fields of a dataclass, such as
+    AssEvent or AssStyle, within its content_key() tuples and
+    content_columns() columns.
+
+    :param item_type: dataclass type
+    :return: field names mapped to their positions
+    """
+    return {
+        obj_field.name: position
+        for position, obj_field in enumerate(
+            obj_field
+            for obj_field in dataclasses.fields(item_type)
+            if not obj_field.name.startswith("_")
+        )
+    }
+
+
+def content_key(item: Any) -> tuple[Any, ...]:
+    """Return a hashable key that is equal for items with equal content.
+
+    :param item: event or style
+    :return: tuple of the public field values
+    """
+    item_type = type(item)
+    try:
+        getter = _CONTENT_GETTERS[item_type]
+    except KeyError:
+        getter = _CONTENT_GETTERS[item_type] = attrgetter(*public_fields(item))
+    return getter(item)
+
+
+def content_columns(items: Iterable[Any]) -> tuple[tuple[Any, ...], ...]:
+    """Transpose the public field values of the given items into columns.
+
+    :param items: events or styles of the same type
+    :return: tuple of columns, one per public field, or an empty tuple if
+        there are no items
+    """
+    return tuple(zip(*map(content_key, items)))
+
+
+def items_from_columns(
+    item_type: type,
+    columns: tuple[tuple[Any, ...], ...],
+    **extra_columns: Iterable[Any],
+) -> list[Any]:
+    """Recreate items from the columns made by content_columns().
+
+    The items are built without calling their constructor, which makes this
+    several times faster than calling item_type(*values) for each row.
+
+    :param item_type: dataclass to instantiate, such as AssEvent
+    :param columns: columns of public field values
+    :param extra_columns: values of private attributes to set, such as
+        _parent, by attribute name
+    :return: list of items
+    """
+    try:
+        keys = _STORAGE_KEYS[item_type]
+    except KeyError:
+        # fields exposed through properties keep their values under
+        # a private name
+        keys = _STORAGE_KEYS[item_type] = tuple(
+            "_" + obj_field.name
+            if isinstance(getattr(item_type, obj_field.name, None), property)
+            else obj_field.name
+            for obj_field in dataclasses.fields(item_type)
+            if not obj_field.name.startswith("_")
+        )
+    keys += tuple(extra_columns)
+    new = object.__new__
+    items: list[Any] = []
+    for values in zip(*columns, *extra_columns.values()):
+        item: Any = new(item_type)
+        item.__dict__.update(zip(keys, values))
+        items.append(item)
+    return items
+
+
+class _GcPauses:
+    """Nesting count of the gc_paused() blocks of all threads."""
+
+    lock = threading.Lock()
+    depth = 0
+    was_enabled = False
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """Disable the cyclic garbage collector while creating many objects.
+
+    Events and styles do not form reference cycles, so the collections
+    triggered by allocating them would only traverse them in vain. The
+    collector is enabled again when the outermost of the nested or
+    concurrent blocks ends, unless it was disabled to begin with.
+
+    :return: context manager
+    """
+    with _GcPauses.lock:
+        if not _GcPauses.depth:
+            _GcPauses.was_enabled = gc.isenabled()
+            gc.disable()
+        _GcPauses.depth += 1
+    try:
+        yield
+    finally:
+        with _GcPauses.lock:
+            _GcPauses.depth -= 1
+            if not _GcPauses.depth and _GcPauses.was_enabled:
+                gc.enable()
+
+
+def stable_hash(values: Iterable[Any]) -> int:
+    """Hash the representations of the given values.
+
+    Unlike hash(), the result does not change between interpreter runs, so
+    it can be stored on disk. The values are hashed as the repr() of their
+    tuple, which quotes and escapes strings, so no two different sequences
+    of strings and numbers hash the same input.
+
+    :param values: values to hash
+    :return: 64-bit hash
+    """
+    digest = blake2b(repr(tuple(values)).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
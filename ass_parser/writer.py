@@ -1,39 +1,197 @@
 """ASS file writing routines."""
+import asyncio
 import io
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
-from typing import IO, Union, overload
+from typing import IO, Any, Optional, Union, cast, overload
 
 from ass_parser.ass_file import AssFile
+from ass_parser.ass_sections import AssEventList
+from ass_parser.compression import is_binary_stream, open_path, text_writer
+from ass_parser.util import content_key
+
+# number of lines to join into a single write() call
+CHUNK_SIZE = 4096
+# number of events formatted by a worker process at once, see write_ass()
+FORMAT_CHUNK_SIZE = 10_000
+
+
+def _format_event_rows(rows: list[tuple[Any, ...]]) -> list[str]:
+    """Format events packed as tuples of their field values.
+
+    :param rows: content keys of the events to format
+    :return: ASS event lines
+    """
+    return [AssEventList.format_ass_table_values(row) for row in rows]
+
+
+def _format_events_in_pool(events: AssEventList, workers: int) -> None:
+    """Fill the cached ASS lines of the events in worker processes.
+
+    Events travel as tuples of their field values and only the ones that
+    changed since they were last serialized get formatted. The lines come
+    from the same function as with a single process, so the output does not
+    depend on the number of workers.
+
+    :param events: events to format
+    :param workers: number of worker processes
+    """
+    # pylint: disable=protected-access
+    pending = [event for event in events if event._ass_line is None]
+    if not pending:
+        return
+    chunks = [
+        [
+            content_key(event)
+            for event in pending[pos : pos + FORMAT_CHUNK_SIZE]
+        ]
+        for pos in range(0, len(pending), FORMAT_CHUNK_SIZE)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for pos, lines in zip(
+            range(0, len(pending), FORMAT_CHUNK_SIZE),
+            executor.map(_format_event_rows, chunks),
+        ):
+            for event, line in zip(pending[pos:], lines):
+                event._ass_line = line
+
+
+def _rstrip_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Strip trailing whitespace from a sequence of lines, as if they were
+    joined into a single string.
+
+    :param lines: lines to strip
+    :return: a generator of stripped lines
+    """
+    last_line: Optional[str] = None
+    blank_lines: list[str] = []
+    for line in lines:
+        if not line.strip():
+            blank_lines.append(line)
+            continue
+        if last_line is not None:
+            yield last_line
+        yield from blank_lines
+        blank_lines.clear()
+        last_line = line
+    if last_line is not None:
+        yield last_line.rstrip()
+
+
+def _produce_ass_lines(ass_file: AssFile) -> Iterator[str]:
+    """Produce ASS text representation of a whole file.
+
+    :param ass_file: the file to serialize
+    :return: a generator of ASS lines
+    """
+    sections = [
+        ass_file.script_info,
+        ass_file.styles,
+        ass_file.events,
+        # skip parsing raw sections that nobody accessed
+        *ass_file.extra_sections.iter_stored(),
+    ]
+    for i, section in enumerate(sections):
+        if i:
+            yield ""
+        yield from _rstrip_lines(section.produce_ass_lines())
+
+
+def _produce_ass_chunks(ass_file: AssFile) -> Iterator[str]:
+    """Produce ASS text representation of a whole file in chunks of
+    CHUNK_SIZE lines.
+
+    :param ass_file: the file to serialize
+    :return: a generator of text chunks
+    """
+    chunk: list[str] = []
+    for line in _produce_ass_lines(ass_file):
+        chunk.append(line)
+        if len(chunk) == CHUNK_SIZE:
+            yield "\n".join(chunk) + "\n"
+            chunk.clear()
+    if chunk:
+        yield "\n".join(chunk) + "\n"
+
+
+def _check_compression(target: Any, compression: Optional[str]) -> None:
+    """Reject compression for targets that cannot be compressed with it.
+
+    :param target: write_ass() target
+    :param compression: requested compression
+    """
+    if compression is not None and not is_binary_stream(target):
+        raise ValueError(
+            "compression applies to binary streams only; "
+            "paths are compressed according to their suffix"
+        )
 
 
 @overload
-def write_ass(ass_file: AssFile, target: Path) -> None:
+def write_ass(
+    ass_file: AssFile,
+    target: Path,
+    compression: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> None:
     ...  # pragma: no cover
 
 
 @overload
-def write_ass(ass_file: AssFile, target: IO[str]) -> None:
+def write_ass(
+    ass_file: AssFile,
+    target: Union[IO[str], IO[bytes]],
+    compression: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> None:
     ...  # pragma: no cover
 
 
 @overload
-def write_ass(ass_file: AssFile, target: None = None) -> str:
+def write_ass(
+    ass_file: AssFile,
+    target: None = None,
+    compression: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> str:
     ...  # pragma: no cover
 
 
 def write_ass(
-    ass_file: AssFile, target: Union[Path, IO[str], None] = None
+    ass_file: AssFile,
+    target: Union[Path, IO[str], IO[bytes], None] = None,
+    compression: Optional[str] = None,
+    workers: Optional[int] = None,
 ) -> Union[str, None]:
     """Save ASS to the specified target.
 
     If target is not specified, returns the serialized ASS file as a string.
 
+    Paths ending with .gz, .xz or .bz2 are compressed on the fly, and so are
+    binary streams if compression is given.
+
     :param ass_file: the file to save
-    :param target: a path, a writable stream or None
+    :param target: a path, a writable text or binary stream or None
+    :param compression: "gz", "xz" or "bz2" to compress the output written
+        to a binary stream; other targets raise a ValueError, as paths are
+        compressed according to their suffix
+    :param workers: number of worker processes to format the events in,
+        which pays off for hundreds of thousands of modified events; by
+        default, everything is formatted in this process
     :return: serialized ASS contents if target is None
     """
+    _check_compression(target, compression)
+    if workers is not None:
+        _format_events_in_pool(ass_file.events, workers)
+
     if isinstance(target, Path):
-        with target.open("w", encoding="utf-8") as handle:
+        with open_path(target, "w") as handle:
+            write_ass(ass_file, handle)
+            return None
+
+    if is_binary_stream(target):
+        with text_writer(cast(IO[bytes], target), compression) as handle:
             write_ass(ass_file, handle)
             return None
 
@@ -42,13 +200,96 @@ def write_ass(
             write_ass(ass_file, handle)
             return handle.getvalue()
 
-    print(ass_file.script_info.to_ass_string().rstrip(), file=target)
-    print(file=target)
-    print(ass_file.styles.to_ass_string().rstrip(), file=target)
-    print(file=target)
-    print(ass_file.events.to_ass_string().rstrip(), file=target)
-    for section in ass_file.extra_sections:
-        print(file=target)
-        print(section.to_ass_string().rstrip(), file=target)
+    text_target = cast(IO[str], target)
+    for text in _produce_ass_chunks(ass_file):
+        text_target.write(text)
+
+    return None
+
+
+@overload
+async def write_ass_async(
+    ass_file: AssFile,
+    target: Path,
+    executor: Optional[Executor] = None,
+    compression: Optional[str] = None,
+) -> None:
+    ...  # pragma: no cover
+
+
+@overload
+async def write_ass_async(
+    ass_file: AssFile,
+    target: Union[IO[str], IO[bytes]],
+    executor: Optional[Executor] = None,
+    compression: Optional[str] = None,
+) -> None:
+    ...  # pragma: no cover
+
+
+@overload
+async def write_ass_async(
+    ass_file: AssFile,
+    target: None = None,
+    executor: Optional[Executor] = None,
+    compression: Optional[str] = None,
+) -> str:
+    ...  # pragma: no cover
+
+
+async def write_ass_async(
+    ass_file: AssFile,
+    target: Union[Path, IO[str], IO[bytes], None] = None,
+    executor: Optional[Executor] = None,
+    compression: Optional[str] = None,
+) -> Union[str, None]:
+    """Save ASS to the specified target without blocking the event loop.
+
+    The file is serialized on the event loop chunk by chunk, with a pause
+    after each of them, and every chunk is written in a worker thread.
+    Alternatively, serializing can be offloaded entirely to an executor.
+
+    If target is not specified, returns the serialized ASS file as a string.
+
+    :param ass_file: the file to save
+    :param target: a path, a writable text or binary stream or None; see
+        write_ass()
+    :param executor: optional executor to serialize the file in
+    :param compression: see write_ass()
+    :return: serialized ASS contents if target is None
+    """
+    _check_compression(target, compression)
+    if isinstance(target, Path):
+        handle = await asyncio.to_thread(open_path, target, "w")
+        try:
+            await write_ass_async(ass_file, handle, executor)
+        finally:
+            await asyncio.to_thread(handle.close)
+        return None
+
+    if is_binary_stream(target):
+        with text_writer(cast(IO[bytes], target), compression) as handle:
+            await write_ass_async(ass_file, handle, executor)
+        return None
+
+    chunks: Iterable[str]
+    if executor is not None:
+        chunks = [
+            await asyncio.get_running_loop().run_in_executor(
+                executor, write_ass, ass_file
+            )
+        ]
+    else:
+        chunks = _produce_ass_chunks(ass_file)
+
+    if target is None:
+        result: list[str] = []
+        for text in chunks:
+            result.append(text)
+            await asyncio.sleep(0)
+        return "".join(result)
 
+    text_target = cast(IO[str], target)
+    for text in chunks:
+        await asyncio.to_thread(text_target.write, text)
     return None
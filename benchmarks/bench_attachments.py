@@ -0,0 +1,37 @@
+"""Time reading and writing a script with large embedded fonts.
+
+Run with: python -m benchmarks.bench_attachments
+"""
+import io
+import random
+
+from ass_parser import AssAttachment, AssAttachmentSection, read_ass, write_ass
+from benchmarks.common import make_ass_text, report
+
+NUM_FONTS = 4
+FONT_SIZE = 5_000_000
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    rng = random.Random(0)
+    ass_file = read_ass(make_ass_text(1000))
+    fonts = AssAttachmentSection(name="Fonts")
+    fonts.extend(
+        AssAttachment(f"font{i}.ttf", rng.randbytes(FONT_SIZE))
+        for i in range(NUM_FONTS)
+    )
+    ass_file.extra_sections.append(fonts)
+    text = write_ass(ass_file)
+    loaded = read_ass(text)
+    section = loaded.extra_sections[0]
+    assert isinstance(section, AssAttachmentSection)
+
+    report("write_ass (encode)", lambda: write_ass(ass_file))
+    report("read_ass", lambda: read_ass(text))
+    report("write_ass (reuse encoded)", lambda: write_ass(loaded))
+    report("decode one font", lambda: section[0].save(io.BytesIO()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Time reading and writing many ASS files one by one and in parallel.
+
+Run with: python -m benchmarks.bench_batch
+"""
+import tempfile
+from pathlib import Path
+
+from ass_parser import read_ass, read_ass_many, write_ass, write_ass_many
+from benchmarks.common import make_ass_text, report
+
+NUM_FILES = 16
+NUM_EVENTS = 5000
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = [Path(temp_dir) / f"{i}.ass" for i in range(NUM_FILES)]
+        for i, path in enumerate(paths):
+            path.write_text(make_ass_text(NUM_EVENTS, seed=i))
+        ass_files = [read_ass(path) for path in paths]
+        items = list(zip(ass_files, paths))
+
+        report("read_ass x files", lambda: [read_ass(path) for path in paths])
+        report("read_ass_many", lambda: list(read_ass_many(paths)))
+        report(
+            "write_ass x files",
+            lambda: [write_ass(ass_file, path) for ass_file, path in items],
+        )
+        report("write_ass_many", lambda: list(write_ass_many(items)))
+
+
+if __name__ == "__main__":
+    main()
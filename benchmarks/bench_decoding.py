@@ -0,0 +1,60 @@
+"""Time and measure memory of reading large ASS files in various encodings.
+
+Run with: python -m benchmarks.bench_decoding
+"""
+import mmap
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from ass_parser import read_ass
+from benchmarks.common import make_ass_text, report
+
+NUM_EVENTS = 50_000
+ENCODINGS = ["utf-8", "utf-8-sig", "utf-16", "cp1252"]
+
+
+def peak_memory(func: Callable[[], object]) -> float:
+    """Measure the peak memory allocated while calling the given function.
+
+    :param func: function to call
+    :return: peak allocation, in megabytes
+    """
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    text = make_ass_text(NUM_EVENTS)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for encoding in ENCODINGS:
+            path = Path(tmp_dir) / f"{encoding}.ass"
+            path.write_bytes(text.encode(encoding))
+            data = path.read_bytes()
+            print(f"{encoding}: {len(data) / 2**20:.1f} MB")
+
+            def read_mmap(path: Path = path) -> None:
+                with path.open("rb") as handle:
+                    with mmap.mmap(
+                        handle.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as view:
+                        read_ass(view)
+
+            report(f"  read_ass(Path) [{encoding}]", lambda: read_ass(path))
+            report(f"  read_ass(bytes) [{encoding}]", lambda: read_ass(data))
+            report(f"  read_ass(mmap) [{encoding}]", read_mmap)
+            print(
+                "  peak memory, Path:"
+                f" {peak_memory(lambda: read_ass(path)):.1f} MB"
+            )
+        print(f"read_ass(str): {peak_memory(lambda: read_ass(text)):.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
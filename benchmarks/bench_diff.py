@@ -0,0 +1,32 @@
+"""Time diffing and merging revisions of a large ASS file.
+
+Run with: python -m benchmarks.bench_diff
+"""
+import random
+
+from ass_parser import diff_ass, merge_ass, read_ass
+from benchmarks.common import make_ass_text, report
+
+NUM_EVENTS = 50_000
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    text = make_ass_text(NUM_EVENTS)
+    old = read_ass(text)
+    new = read_ass(text)
+    rng = random.Random(0)
+    for _ in range(500):
+        new.events[rng.randrange(len(new.events))].text += "!"
+    for _ in range(100):
+        del new.events[rng.randrange(len(new.events))]
+    moved = new.events.pop(10)
+    new.events.append(moved)
+
+    report("old == new", lambda: old == new)
+    report("diff_ass(old, new)", lambda: diff_ass(old, new))
+    report("merge_ass(old, new, old)", lambda: merge_ass(old, new, old))
+
+
+if __name__ == "__main__":
+    main()
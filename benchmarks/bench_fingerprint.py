@@ -0,0 +1,43 @@
+"""Time fingerprints and the equality checks that use them.
+
+Only comparing fingerprints is O(1); == compares the contents of files whose
+fingerprints match.
+
+Run with: python -m benchmarks.bench_fingerprint
+"""
+from ass_parser import read_ass
+from benchmarks.common import make_ass_text, report
+
+NUM_EVENTS = 50_000
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    text = make_ass_text(NUM_EVENTS)
+    old = read_ass(text)
+    new = read_ass(text)
+    same = read_ass(text)
+
+    def cold_fingerprint() -> int:
+        # pylint: disable=protected-access
+        for event in new.events:
+            event._fingerprint = None
+        new.events._fingerprint_cache = None
+        return new.fingerprint
+
+    def fingerprint_after_edit() -> int:
+        new.events[0].start += 1
+        return new.fingerprint
+
+    report("cold ass_file.fingerprint", cold_fingerprint)
+    report("ass_file.fingerprint after 1 edit", fingerprint_after_edit)
+    report("old == new (different fingerprints)", lambda: old == new)
+    report("old == same (contents compared)", lambda: old == same)
+    report(
+        "old.fingerprint == same.fingerprint",
+        lambda: old.fingerprint == same.fingerprint,
+    )
+
+
+if __name__ == "__main__":
+    main()
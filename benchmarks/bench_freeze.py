@@ -0,0 +1,27 @@
+"""Time freezing a large ASS file, hashing the frozen copy and thawing it.
+
+Run with: python -m benchmarks.bench_freeze
+"""
+from ass_parser import read_ass
+from benchmarks.common import make_ass_text, report
+
+NUM_EVENTS = 200_000
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    ass_file = read_ass(make_ass_text(NUM_EVENTS))
+    frozen = ass_file.freeze()
+
+    def hash_uncached() -> None:
+        hash(ass_file.freeze())
+
+    report("AssFile.freeze", ass_file.freeze)
+    report("AssFile.freeze + hash", hash_uncached)
+    report("AssFrozenFile hash, cached", lambda: hash(frozen), number=1000)
+    report("AssFrozenFile.thaw", frozen.thaw)
+    report("AssFile.snapshot().to_ass_file()", ass_file.snapshot().to_ass_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Measure the garbage collector pauses while parsing a large ASS file and
+the time it takes to free it.
+
+Run with: python -m benchmarks.bench_gc
+"""
+import gc
+import time
+from typing import Any
+
+from ass_parser import read_ass
+from benchmarks.common import make_ass_text
+
+NUM_EVENTS = 200_000
+ROUNDS = 3
+
+
+def _print(name: str, seconds: float) -> None:
+    print(f"{name:<40} {seconds * 1000:10.3f} ms")
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    text = make_ass_text(NUM_EVENTS)
+    pauses: list[float] = []
+    started = 0.0
+
+    def on_gc(phase: str, _info: dict[str, Any]) -> None:
+        nonlocal started
+        if phase == "start":
+            started = time.perf_counter()
+        else:
+            pauses.append(time.perf_counter() - started)
+
+    results: dict[str, list[float]] = {}
+    gc.callbacks.append(on_gc)
+    try:
+        for _ in range(ROUNDS):
+            gc.collect()
+            pauses.clear()
+            start = time.perf_counter()
+            ass_file = read_ass(text)
+            parse_time = time.perf_counter() - start
+            parse_pauses = pauses[:]
+
+            start = time.perf_counter()
+            del ass_file
+            release_time = time.perf_counter() - start
+            pauses.clear()
+            start = time.perf_counter()
+            gc.collect()
+            collect_time = time.perf_counter() - start
+
+            for name, value in [
+                ("read_ass", parse_time),
+                ("GC pauses during read_ass, total", sum(parse_pauses)),
+                (
+                    "GC pauses during read_ass, longest",
+                    max(parse_pauses, default=0),
+                ),
+                ("dropping the file", release_time),
+                ("collecting the file", collect_time),
+            ]:
+                results.setdefault(name, []).append(value)
+    finally:
+        gc.callbacks.remove(on_gc)
+    for name, values in results.items():
+        _print(name, min(values))
+
+
+if __name__ == "__main__":
+    main()
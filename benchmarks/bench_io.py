@@ -0,0 +1,32 @@
+"""Time reading and writing a large ASS file.
+
+Run with: python -m benchmarks.bench_io
+"""
+import asyncio
+
+from ass_parser import read_ass, read_ass_async, write_ass, write_ass_async
+from benchmarks.common import make_ass_text, report
+
+NUM_EVENTS = 50_000
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    text = make_ass_text(NUM_EVENTS)
+    ass_file = read_ass(text)
+
+    report("read_ass", lambda: read_ass(text))
+    report("read_ass_async", lambda: asyncio.run(read_ass_async(text)))
+
+    def write_after_edits() -> None:
+        for event in ass_file.events[:3]:
+            event.start += 1
+        write_ass(ass_file)
+
+    report("write_ass", lambda: write_ass(ass_file))
+    report("write_ass after 3 edits", write_after_edits)
+    report("write_ass_async", lambda: asyncio.run(write_ass_async(ass_file)))
+
+
+if __name__ == "__main__":
+    main()
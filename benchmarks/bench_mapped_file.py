@@ -0,0 +1,52 @@
+"""Time opening a large ASS file for random access to its events, with and
+without a sidecar index.
+
+Run with: python -m benchmarks.bench_mapped_file
+"""
+import tempfile
+from pathlib import Path
+
+from ass_parser import AssMappedFile, read_ass
+from ass_parser.ass_index import index_path_for
+from benchmarks.common import make_ass_text, report
+
+NUM_EVENTS = 200_000
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "large.ass"
+        path.write_text(make_ass_text(NUM_EVENTS), encoding="utf-8")
+
+        def open_and_slice() -> None:
+            with AssMappedFile(path) as mapped:
+                mapped.events[100_000:100_050]
+
+        def build_index() -> None:
+            index_path_for(path).unlink(missing_ok=True)
+            AssMappedFile(path, use_index=True).close()
+
+        def reopen() -> None:
+            AssMappedFile(path, use_index=True).close()
+
+        report("read_ass", lambda: read_ass(path), number=1)
+        report("AssMappedFile + 50 events", open_and_slice)
+        report("AssMappedFile, building sidecar index", build_index)
+        report("AssMappedFile, using sidecar index", reopen)
+        with AssMappedFile(path) as mapped:
+
+            def slice_uncached() -> None:
+                mapped.events.clear_cache()
+                mapped.events[100_000:100_050]
+
+            report(
+                "50 events, cached",
+                lambda: mapped.events[100_000:100_050],
+                number=100,
+            )
+            report("50 events, uncached", slice_uncached, number=100)
+
+
+if __name__ == "__main__":
+    main()
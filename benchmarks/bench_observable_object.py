@@ -0,0 +1,68 @@
+"""Benchmark attribute writes on observable objects.
+
+Run with: python -m benchmarks.bench_observable_object
+"""
+from ass_parser import AssEvent, AssEventList
+from benchmarks.common import report
+
+NUM_OBJECTS = 10_000
+
+
+def construct_events() -> None:
+    """Construct events, as the parser does."""
+    for i in range(NUM_OBJECTS):
+        AssEvent(
+            layer=0,
+            start=i,
+            end=i + 1000,
+            style_name="Default",
+            actor="Ako",
+            margin_left=0,
+            margin_right=0,
+            margin_vertical=0,
+            effect="",
+            text="Ako!",
+            note="",
+            is_comment=False,
+        )
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    detached = [AssEvent() for _ in range(NUM_OBJECTS)]
+    attached = AssEventList(data=[AssEvent() for _ in range(NUM_OBJECTS)])
+
+    def write_detached() -> None:
+        for event in detached:
+            event.start += 1
+            event.text = "changed"
+            event.text = ""
+
+    def write_attached() -> None:
+        for event in attached:
+            event.start += 1
+            event.actor = "changed"
+            event.actor = ""
+
+    def write_throttled() -> None:
+        for event in attached:
+            event.begin_update()
+            event.start += 1
+            event.end += 1
+            event.layer += 1
+            event.end_update()
+
+    def write_unchanged() -> None:
+        for event in detached:
+            event.start = event.start
+            event.style_name = event.style_name
+
+    report("construct 10k events", construct_events)
+    report("30k writes, detached events", write_detached)
+    report("30k writes, events in a list", write_attached)
+    report("30k throttled writes", write_throttled)
+    report("20k no-op writes", write_unchanged)
+
+
+if __name__ == "__main__":
+    main()
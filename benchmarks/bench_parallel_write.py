@@ -0,0 +1,34 @@
+"""Time formatting all events of a large ASS file in worker processes.
+
+Run with: python -m benchmarks.bench_parallel_write
+"""
+import os
+from typing import Optional
+
+from ass_parser import read_ass, write_ass
+from benchmarks.common import make_ass_text, report
+
+NUM_EVENTS = 200_000
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    ass_file = read_ass(make_ass_text(NUM_EVENTS))
+
+    def write_from_scratch(workers: Optional[int]) -> None:
+        # pylint: disable=protected-access
+        for event in ass_file.events:
+            event._ass_line = None
+        write_ass(ass_file, workers=workers)
+
+    print(f"{os.cpu_count()} CPUs")
+    report("write_ass", lambda: write_from_scratch(None))
+    for workers in (1, 2, 4):
+        report(
+            f"write_ass, {workers} workers",
+            lambda: write_from_scratch(workers),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Time pickling a large ASS file and compare the payload sizes.
+
+Run with: python -m benchmarks.bench_pickle
+"""
+import pickle
+
+from ass_parser import read_ass
+from benchmarks.common import make_ass_text, report
+
+NUM_EVENTS = 200_000
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    ass_file = read_ass(make_ass_text(NUM_EVENTS))
+    original = read_ass(make_ass_text(NUM_EVENTS), preserve_original=True)
+    for name, obj in [
+        ("file", ass_file),
+        ("file with source lines", original),
+        ("event list", ass_file.events),
+    ]:
+        payload = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        print(f"{name + ' pickle size':<40} {len(payload) / 2**20:10.3f} MB")
+
+        def dump(obj: object = obj) -> None:
+            pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+        def load(payload: bytes = payload) -> None:
+            pickle.loads(payload)
+
+        report(f"{name} dump", dump)
+        report(f"{name} load", load)
+
+
+if __name__ == "__main__":
+    main()
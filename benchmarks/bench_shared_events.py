@@ -0,0 +1,44 @@
+"""Time handing the events of a large ASS file to worker processes through
+shared memory rather than through pickles.
+
+Run with: python -m benchmarks.bench_shared_events
+"""
+import pickle
+
+from ass_parser import AssSharedEvents, read_ass
+from benchmarks.common import make_ass_text, report
+
+NUM_EVENTS = 200_000
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    events = read_ass(make_ass_text(NUM_EVENTS)).events
+    payload = pickle.dumps(events, protocol=pickle.HIGHEST_PROTOCOL)
+    print(f"{'pickle size per worker':<40} {len(payload) / 2**20:10.3f} MB")
+
+    def create() -> None:
+        with AssSharedEvents.create(events):
+            pass
+
+    with AssSharedEvents.create(events) as shared:
+        size = shared._shm.size  # pylint: disable=protected-access
+        print(f"{'shared block size, once':<40} {size / 2**20:10.3f} MB")
+        name = shared.name
+
+        def attach_and_sum() -> None:
+            with AssSharedEvents.attach(name) as other:
+                sum(other.get_column("end")) - sum(other.get_column("start"))
+
+        def unpickle_and_sum() -> None:
+            copy = pickle.loads(payload)
+            sum(event.duration for event in copy)
+
+        report("AssSharedEvents.create", create)
+        report("worker setup: unpickle + sum durations", unpickle_and_sum)
+        report("worker setup: attach + sum durations", attach_and_sum)
+        report("read all records", lambda: list(shared))
+
+
+if __name__ == "__main__":
+    main()
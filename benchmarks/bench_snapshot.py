@@ -0,0 +1,42 @@
+"""Compare AssFile snapshots with deep copies.
+
+Run with: python -m benchmarks.bench_snapshot
+"""
+import random
+from copy import copy, deepcopy
+
+from ass_parser import AssAttachment, AssAttachmentSection, read_ass, write_ass
+from benchmarks.common import make_ass_text, report
+
+NUM_EVENTS = 20_000
+NUM_FONTS = 4
+FONT_SIZE = 5_000_000
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    ass_file = read_ass(make_ass_text(NUM_EVENTS))
+
+    def edit_after_snapshot() -> None:
+        ass_file.snapshot()
+        for event in ass_file.events[:3]:
+            event.start += 1
+
+    report("deepcopy(ass_file)", lambda: deepcopy(ass_file))
+    report("ass_file.snapshot()", ass_file.snapshot, number=1000)
+    report("snapshot + 3 edits", edit_after_snapshot, number=100)
+    report("copy(event) x 20k", lambda: [copy(e) for e in ass_file.events])
+
+    rng = random.Random(0)
+    fonts = AssAttachmentSection(name="Fonts")
+    fonts.extend(
+        AssAttachment(f"font{i}.ttf", rng.randbytes(FONT_SIZE))
+        for i in range(NUM_FONTS)
+    )
+    ass_file.extra_sections.append(fonts)
+    raw_file = read_ass(write_ass(ass_file), raw_extra_sections=True)
+    report("snapshot (raw fonts)", raw_file.snapshot, number=1000)
+
+
+if __name__ == "__main__":
+    main()
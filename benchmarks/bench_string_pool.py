@@ -0,0 +1,32 @@
+"""Report memory used by the string fields of a parsed realistic file.
+
+Run with: python -m benchmarks.bench_string_pool
+"""
+import tracemalloc
+
+from ass_parser import read_ass, string_memory_report
+from benchmarks.common import make_ass_text
+
+NUM_EVENTS = 50_000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    text = make_ass_text(NUM_EVENTS)
+    tracemalloc.start()
+    ass_file = read_ass(text)
+    parsed_size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    report = string_memory_report(ass_file)
+    print(f"parsed file size:      {parsed_size / 1024:10.1f} KiB")
+    print(f"string fields:         {report.total_strings:10d}")
+    print(f"distinct values:       {report.distinct_values:10d}")
+    print(f"distinct objects:      {report.distinct_objects:10d}")
+    print(f"stored strings size:   {report.stored_bytes / 1024:10.1f} KiB")
+    print(f"unshared strings size: {report.unshared_bytes / 1024:10.1f} KiB")
+    print(f"saved:                 {report.saved_bytes / 1024:10.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
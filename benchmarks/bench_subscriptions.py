@@ -0,0 +1,55 @@
+"""Time event writes after many views subscribed to an event list and went
+away.
+
+Run with: python -m benchmarks.bench_subscriptions
+"""
+from ass_parser import (
+    AssEvent,
+    AssEventList,
+    ObservableSequenceItemModificationEvent,
+)
+from benchmarks.common import report
+
+NUM_EVENTS = 10_000
+NUM_VIEWS = 1_000
+
+
+class View:
+    """Consumer of event list changes, such as a grid or an index."""
+
+    def __init__(self) -> None:
+        self.changes = 0
+
+    def on_change(
+        self, _event: "ObservableSequenceItemModificationEvent[AssEvent]"
+    ) -> None:
+        """Count the change.
+
+        :param _event: change event
+        """
+        self.changes += 1
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    for name in ["leaked", "unsubscribed", "weak"]:
+        events = AssEventList(data=[AssEvent() for _ in range(NUM_EVENTS)])
+        for _ in range(NUM_VIEWS):
+            view = View()
+            subscription = events.items_modified.subscribe(
+                view.on_change, weak=name == "weak"
+            )
+            if name == "unsubscribed":
+                subscription.unsubscribe()
+        del view
+
+        def write(events: AssEventList = events) -> None:
+            for event in events:
+                event.text = "changed"
+                event.text = ""
+
+        report(f"20k writes, {NUM_VIEWS} {name} views", write)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Time loading the events of a 90-second scene from a large ASS file.
+
+Run with: python -m benchmarks.bench_time_range
+"""
+import tempfile
+from pathlib import Path
+
+from ass_parser import AssMappedFile, read_ass
+from benchmarks.common import make_ass_text, report
+
+NUM_EVENTS = 50_000
+# a 90-second scene in the middle of the file
+TIME_RANGE = (35_000_000, 35_090_000)
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    text = make_ass_text(NUM_EVENTS)
+    num_events = len(read_ass(text, time_range=TIME_RANGE).events)
+    print(f"{num_events} events in the window")
+
+    report("read_ass", lambda: read_ass(text))
+    report(
+        "read_ass, time_range", lambda: read_ass(text, time_range=TIME_RANGE)
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "large.ass"
+        path.write_text(text, encoding="utf-8")
+        AssMappedFile(path, use_index=True).close()
+
+        def mapped_time_range() -> None:
+            with AssMappedFile(path, use_index=True) as mapped:
+                list(mapped.events.iter_time_range(*TIME_RANGE))
+
+        report("AssMappedFile, sidecar index, time range", mapped_time_range)
+
+
+if __name__ == "__main__":
+    main()
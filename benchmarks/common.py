@@ -0,0 +1,76 @@
+"""Shared helpers for the benchmark scripts."""
+import random
+import timeit
+from typing import Callable
+
+STYLES = ["Default", "Alternate", "Signs", "Opening JP", "Opening EN"]
+ACTORS = ["", "Ako", "Shizu", "Kuro", "Yuu", "[karaoke]"]
+EFFECTS = ["", "", "", "Banner;30;0;0"]
+TEXTS = [
+    "Ako!",
+    "- Shizu!\\N- Ako!",
+    "{\\fad(200,0)\\k45}To{\\k41}o{\\k29}i {\\k20}mi{\\k37}chi",
+    "{\\an8\\pos(960,60)}Episode 3",
+    "I told you, it's not like that.",
+]
+
+
+def make_ass_text(num_events: int, seed: int = 0) -> str:
+    """Generate a realistic ASS script.
+
+    :param num_events: how many events to generate
+    :param seed: random seed, so that the output is reproducible
+    :return: ASS text representation
+    """
+    rng = random.Random(seed)
+    lines = [
+        "[Script Info]",
+        "ScriptType: v4.00+",
+        "PlayResX: 1920",
+        "PlayResY: 1080",
+        "",
+        "[V4+ Styles]",
+        "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, "
+        "OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, "
+        "ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, "
+        "Alignment, MarginL, MarginR, MarginV, Encoding",
+    ]
+    for style in STYLES:
+        lines.append(
+            f"Style: {style},Arial,55,&H00E7F4FF,&H000000FF,&H0025315A,"
+            "&H00000000,-1,0,0,0,100,100,0,0,1,2.5,0,2,10,10,10,1"
+        )
+    lines += [
+        "",
+        "[Events]",
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, "
+        "Effect, Text",
+    ]
+    time = 0
+    for _ in range(num_events):
+        start = time
+        end = start + rng.randint(500, 5000)
+        time += rng.randint(0, 3000)
+        lines.append(
+            "Dialogue: 0,"
+            f"{start // 3_600_000}:{start // 60000 % 60:02d}:"
+            f"{start // 1000 % 60:02d}.{start // 10 % 100:02d},"
+            f"{end // 3_600_000}:{end // 60000 % 60:02d}:"
+            f"{end // 1000 % 60:02d}.{end // 10 % 100:02d},"
+            f"{rng.choice(STYLES)},{rng.choice(ACTORS)},0,0,0,"
+            f"{rng.choice(EFFECTS)},{rng.choice(TEXTS)}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def report(name: str, func: Callable[[], object], number: int = 1) -> float:
+    """Time the given function and print the result.
+
+    :param name: benchmark name to print
+    :param func: function to time
+    :param number: how many times to call the function per repeat
+    :return: best time per call, in seconds
+    """
+    best = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"{name:<40} {best * 1000:10.3f} ms")
+    return best